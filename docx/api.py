@@ -20,6 +20,11 @@ def Document(docx=None):
     either a path to a ``.docx`` file (a string) or a file-like object. If
     *docx* is missing or ``None``, the built-in default document "template"
     is loaded.
+
+    This function is safe to call concurrently from multiple threads, for
+    example to open and save many documents on a thread pool; each thread
+    parses XML with its own parser. A |Document| object and the objects
+    obtained from it must only be used by one thread at a time.
     """
     docx = _default_docx_path() if docx is None else docx
     document_part = Package.open(docx).main_document_part
@@ -8,10 +8,21 @@ specialized ones like structured document tags.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from copy import deepcopy
+
+from docx.compat import is_string
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
 from docx.oxml.table import CT_Tbl
+from docx.oxml.xmlchemy import note_content_change
 from docx.shared import Parented
 from docx.text.paragraph import Paragraph
 
+_W_P, _W_R, _W_TBL, _W_TC = (
+    qn('w:p'), qn('w:r'), qn('w:tbl'), qn('w:tc')
+)
+
 
 class BlockItemContainer(Parented):
     """Base class for proxy objects that can contain block items.
@@ -21,6 +32,8 @@ class BlockItemContainer(Parented):
     a paragraph or table.
     """
 
+    __slots__ = ('_element',)
+
     def __init__(self, element, parent):
         super(BlockItemContainer, self).__init__(parent)
         self._element = element
@@ -39,6 +52,53 @@ class BlockItemContainer(Parented):
             paragraph.style = style
         return paragraph
 
+    def add_list(self, items, style=None, restart=True):
+        """
+        Return a list of paragraphs newly added to the end of the content in
+        this container, one for each item in *items*, together forming
+        a numbered list. Each item is either the text of its paragraph or
+        a ``(text, level)`` pair, where *level* is the 0-based list level of
+        the paragraph. Each paragraph has paragraph style *style* and is
+        numbered using the numbering definition of that style, or a default
+        numbering definition when the style has none. The list starts again
+        at 1 unless *restart* is |False|, in which case it continues the
+        numbering of the previous list numbered from the same numbering
+        definition, or of the paragraphs having *style* when there is no
+        such list. The numbering is resolved once and all paragraphs are
+        added in a single batch.
+        """
+        items = [(item, 0) if is_string(item) else item for item in items]
+        if not items:
+            return []
+        part = self.part
+        style_id = part.get_style_id(style, WD_STYLE_TYPE.PARAGRAPH)
+        ilvls = sorted(set(ilvl for _, ilvl in items))
+        numId = part.list_numId(style_id, ilvls, restart)
+
+        prototypes = {}
+        paragraphs = []
+        prev_p = None
+        for text, ilvl in items:
+            prototype = prototypes.get(ilvl)
+            if prototype is None:
+                prototype = prototypes[ilvl] = self._new_list_p(
+                    style_id, numId, ilvl
+                )
+            p = deepcopy(prototype)
+            if prev_p is None:
+                self._element._insert_p(p)
+            else:
+                prev_p.addnext(p)
+            prev_p = p
+            paragraph = Paragraph(p, self)
+            if text:
+                paragraph.add_run(text)
+            paragraphs.append(paragraph)
+        note_content_change(
+            self._element, *(paragraph._p for paragraph in paragraphs)
+        )
+        return paragraphs
+
     def add_table(self, rows, cols, width):
         """
         Return a table of *width* having *rows* rows and *cols* columns,
@@ -50,6 +110,43 @@ class BlockItemContainer(Parented):
         self._element._insert_tbl(tbl)
         return Table(tbl, self)
 
+    def iter_tables(self, recursive=True):
+        """
+        Generate a ``(table, depth, path)`` 3-tuple for each table in this
+        container, in document order. Like :attr:`tables`, only tables that
+        are direct children of this container or of a table cell are
+        included. *depth* is 0 for a table in this container, 1 for a table
+        nested in one of its cells, and so on. *path* is a tuple locating
+        the table, `(idx,)` for ``self.tables[idx]`` and `parent_path +
+        (row_idx, col_idx, idx)` for ``parent_table.cell(row_idx,
+        col_idx).tables[idx]``. Nested tables are skipped when *recursive*
+        is |False|. Only table, row and cell elements are visited and no
+        cell grid is computed, so locating a deeply nested table is cheap.
+        """
+        from .table import _Cell, Table
+        tbl_tag, tr_tag, tc_tag = qn('w:tbl'), qn('w:tr'), qn('w:tc')
+
+        def iter_tables(container, element, depth, path):
+            for tbl_idx, tbl in enumerate(element.iterchildren(tbl_tag)):
+                table = Table(tbl, container)
+                tbl_path = path + (tbl_idx,)
+                yield table, depth, tbl_path
+                if not recursive:
+                    continue
+                for row_idx, tr in enumerate(tbl.iterchildren(tr_tag)):
+                    col_idx = 0
+                    for tc in tr.iterchildren(tc_tag):
+                        if tc.find(tbl_tag) is not None:
+                            cell = _Cell(tc, table)
+                            cell_path = tbl_path + (row_idx, col_idx)
+                            for item in iter_tables(
+                                cell, tc, depth + 1, cell_path
+                            ):
+                                yield item
+                        col_idx += tc.grid_span
+
+        return iter_tables(self, self._element, 0, ())
+
     @property
     def paragraphs(self):
         """
@@ -58,6 +155,36 @@ class BlockItemContainer(Parented):
         """
         return [Paragraph(p, self) for p in self._element.p_lst]
 
+    def query(self, xpath, **variables):
+        """
+        Return a list of the items selected by *xpath*, an XPath expression
+        evaluated with the element of this container as the context node.
+        Each keyword argument in *variables* is bound to the XPath variable of
+        the same name, so ``$style_id`` in *xpath* refers to *style_id*.
+        A selected ``<w:p>``, ``<w:r>``, ``<w:tbl>`` or ``<w:tc>`` element is
+        returned as a |Paragraph|, |Run|, |Table| or |_Cell| object
+        respectively; any other result is returned as selected. An expression that evaluates to a string,
+        number or boolean returns that value rather than a list. For
+        example::
+
+            container.query(
+                './/w:p[w:pPr/w:pStyle/@w:val=$style_id]', style_id='Heading1'
+            )
+
+        returns each paragraph having the style with style id 'Heading1'. The
+        expression is compiled once and reused, and the filtering is done by
+        lxml, so no proxy object is created for an element not selected.
+        A selected item nested in this container has the parent it would
+        have if reached through the object API, such as the |_Cell| object
+        for a paragraph in a table cell, so ``.part`` and similar lookups
+        resolve as they would for that object.
+        """
+        results = self._element.xpath(xpath, **variables)
+        if not isinstance(results, list):
+            return results
+        proxies = {}
+        return [self._proxy_for(result, proxies) for result in results]
+
     @property
     def tables(self):
         """
@@ -73,3 +200,58 @@ class BlockItemContainer(Parented):
         container.
         """
         return Paragraph(self._element.add_p(), self)
+
+    @staticmethod
+    def _new_list_p(style_id, numId, ilvl):
+        """
+        Return a new ``<w:p>`` element having paragraph style *style_id* and
+        numbered at list level *ilvl* by the numbering instance *numId*.
+        """
+        p = OxmlElement('w:p')
+        pPr = p.get_or_add_pPr()
+        pPr.style = style_id
+        numPr = pPr.get_or_add_numPr()
+        numPr.get_or_add_ilvl().val = ilvl
+        numPr.get_or_add_numId().val = numId
+        return p
+
+    def _proxy_for(self, result, proxies):
+        """
+        Return a proxy object for *result* when it is a ``<w:p>``, ``<w:r>``,
+        ``<w:tbl>`` or ``<w:tc>`` element, otherwise *result* itself. The parent of the
+        proxy is built from the ancestors of *result* within this container,
+        a |Table| for each ``<w:tbl>``, a |_Cell| for each ``<w:tc>`` and
+        a |Paragraph| for each ``<w:p>``, starting from this container. Other
+        ancestors, like ``<w:tr>``, are passed over as the object API does.
+        *proxies* maps each element already given a proxy in this query to
+        that proxy, so a shared ancestor is proxied once.
+        """
+        from .table import _Cell, Table
+        from .text.run import Run
+        proxy_classes = {
+            _W_P: Paragraph, _W_R: Run, _W_TBL: Table, _W_TC: _Cell
+        }
+        proxy_cls = proxy_classes.get(getattr(result, 'tag', None))
+        if proxy_cls is None:
+            return result
+
+        ancestors = []
+        for ancestor in result.iterancestors():
+            if ancestor is self._element:
+                break
+            ancestors.append(ancestor)
+        else:
+            # ---not within this container, e.g. selected with '//'---
+            ancestors = []
+
+        ancestors.reverse()
+        parent = self
+        for element in ancestors + [result]:
+            proxy = proxies.get(element)
+            if proxy is None:
+                ancestor_cls = proxy_classes.get(element.tag)
+                if ancestor_cls is None:
+                    continue
+                proxy = proxies[element] = ancestor_cls(element, parent)
+            parent = proxy
+        return parent
@@ -15,6 +15,7 @@ import sys
 if sys.version_info >= (3, 0):
 
     from collections.abc import Sequence
+    from concurrent.futures import ThreadPoolExecutor
     from io import BytesIO
 
     def is_string(obj):
@@ -32,6 +33,11 @@ else:
     from collections import Sequence  # noqa
     from StringIO import StringIO as BytesIO  # noqa
 
+    try:
+        from concurrent.futures import ThreadPoolExecutor  # noqa
+    except ImportError:  # pragma: no cover
+        ThreadPoolExecutor = None
+
     def is_string(obj):
         """Return True if *obj* is a string, False otherwise."""
         return isinstance(obj, basestring)
@@ -10,10 +10,10 @@ from __future__ import (
 
 from ..enum.dml import MSO_COLOR_TYPE
 from ..oxml.simpletypes import ST_HexColorAuto
-from ..shared import ElementProxy
+from ..fmtproxy import FormatProxy
 
 
-class ColorFormat(ElementProxy):
+class ColorFormat(FormatProxy):
     """
     Provides access to color settings such as RGB color, theme color, and
     luminance adjustments.
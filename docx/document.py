@@ -8,6 +8,7 @@ from docx.blkcntnr import BlockItemContainer
 from docx.enum.section import WD_SECTION
 from docx.enum.text import WD_BREAK
 from docx.section import Section, Sections
+from docx.shape import InlineShape
 from docx.shared import ElementProxy, Emu
 
 
@@ -38,6 +39,20 @@ class Document(ElementProxy):
         style = "Title" if level == 0 else "Heading %d" % level
         return self.add_paragraph(text, style)
 
+    def add_list(self, items, style='List Number', restart=True):
+        """
+        Return a list of paragraphs newly added to the end of the document,
+        forming a numbered list having one paragraph for each item in
+        *items*. An item is either the text of its paragraph or
+        a ``(text, level)`` pair, where *level* is the 0-based list level.
+        Each paragraph has paragraph style *style*, 'List Number' by default,
+        and is numbered by the numbering definition of that style, or by
+        a default decimal numbering definition added on first use when the
+        style has none. Numbering starts again at 1 unless *restart* is
+        |False|. See :meth:`.BlockItemContainer.add_list`.
+        """
+        return self._body.add_list(items, style, restart)
+
     def add_page_break(self):
         """Return newly |Paragraph| object containing only a page break."""
         paragraph = self.add_paragraph()
@@ -71,6 +86,27 @@ class Document(ElementProxy):
         run = self.add_paragraph().add_run()
         return run.add_picture(image_path_or_stream, width, height)
 
+    def add_pictures(
+        self, image_paths_or_streams, width=None, height=None, workers=None
+    ):
+        """Return a list of new picture shapes, each added in its own paragraph.
+
+        The paragraphs are added at the end of the document, one for each image in
+        *image_paths_or_streams*, in order. Each picture is scaled based on *width* and
+        *height* as described for :meth:`add_picture`. The images are read and
+        characterized on a pool of at most *workers* threads, using the thread-pool
+        default when *workers* is |None| and the calling thread alone when it is 1.
+        """
+        inlines = self._part.new_pic_inlines(
+            image_paths_or_streams, width, height, workers
+        )
+        pictures = []
+        for inline in inlines:
+            run = self.add_paragraph().add_run()
+            run._r.add_drawing(inline)
+            pictures.append(InlineShape(inline))
+        return pictures
+
     def add_section(self, start_type=WD_SECTION.NEW_PAGE):
         """
         Return a |Section| object representing a new section added at the end
@@ -101,6 +137,16 @@ class Document(ElementProxy):
         """
         return self._part.core_properties
 
+    def header_footer_map(self):
+        """
+        Return a dict mapping each (section index, header/footer type) pair to
+        the (header_part, footer_part) pair in effect for that section, as
+        described for :meth:`.Sections.header_footer_map`. Computed in a
+        single pass over the sections, so reading the headers and footers of
+        every section this way takes linear time.
+        """
+        return self.sections.header_footer_map()
+
     @property
     def inline_shapes(self):
         """
@@ -111,6 +157,17 @@ class Document(ElementProxy):
         """
         return self._part.inline_shapes
 
+    def iter_tables(self, recursive=True):
+        """
+        Generate a ``(table, depth, path)`` 3-tuple for each table in this
+        document, in document order, including tables nested in table cells
+        unless *recursive* is |False|. *depth* is 0 for a top-level table.
+        *path* is `(idx,)` for ``document.tables[idx]`` and extends its
+        parent table's path with `(row_idx, col_idx, idx)` for
+        ``parent_table.cell(row_idx, col_idx).tables[idx]``.
+        """
+        return self._body.iter_tables(recursive)
+
     @property
     def paragraphs(self):
         """
@@ -127,6 +184,19 @@ class Document(ElementProxy):
         """
         return self._part
 
+    def query(self, xpath, **variables):
+        """
+        Return a list of the paragraphs, runs, tables or other items in the
+        body of this document selected by *xpath*, an XPath expression
+        evaluated with ``<w:body>`` as the context node. Each keyword argument
+        in *variables* is bound to the XPath variable of the same name. For
+        example, ``document.query('.//w:tbl[w:tblPr/w:tblStyle/@w:val=$s]',
+        s='TableGrid')`` returns every table, nested or not, having the
+        'TableGrid' style, and ``document.query('.//w:r[w:rPr/w:b]')`` every
+        run with a bold setting. See :meth:`.BlockItemContainer.query`.
+        """
+        return self._body.query(xpath, **variables)
+
     def save(self, path_or_stream):
         """
         Save this document to *path_or_stream*, which can be either a path to
@@ -191,6 +261,9 @@ class _Body(BlockItemContainer):
     Proxy for ``<w:body>`` element in this document, having primarily a
     container role.
     """
+
+    __slots__ = ('_body',)
+
     def __init__(self, body_elm, parent):
         super(_Body, self).__init__(body_elm, parent)
         self._body = body_elm
@@ -0,0 +1,44 @@
+# encoding: utf-8
+
+"""
+Formatting proxy base class, shared by character, paragraph, color and
+tab stop formatting.
+"""
+
+from __future__ import (
+    absolute_import, division, print_function, unicode_literals
+)
+
+from .oxml.styles import styles_of_format
+from .shared import ElementProxy
+
+
+class FormatProxy(ElementProxy):
+    """
+    Base class for proxies of formatting properties, such as |Font|, that can
+    belong to a style or the document defaults as well as to document
+    content. Whether it belongs to the styles is determined once, when the
+    proxy is constructed. Changing formatting that belongs to the styles
+    discards the effective formatting resolved from them, so it reflects the
+    change.
+    """
+
+    __slots__ = ('_styles',)
+
+    def __init__(self, element, parent=None):
+        super(FormatProxy, self).__init__(element, parent)
+        self._styles = styles_of_format(element)
+
+    def __setattr__(self, name, value):
+        super(FormatProxy, self).__setattr__(name, value)
+        if not name.startswith('_'):
+            self._note_style_change()
+
+    def _note_style_change(self):
+        """
+        Discard the lookups cached on the `w:styles` element this formatting
+        belongs to, if any, after a change to it.
+        """
+        styles = self._styles
+        if styles is not None:
+            styles.reset_caches()
@@ -10,6 +10,7 @@ from __future__ import (
 )
 
 from docx.image.bmp import Bmp
+from docx.image.cache import ImageCache  # noqa
 from docx.image.gif import Gif
 from docx.image.jpeg import Exif, Jfif
 from docx.image.png import Png
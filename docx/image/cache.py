@@ -0,0 +1,154 @@
+# encoding: utf-8
+
+"""
+Process-level cache of characterized images, for jobs that insert the same images
+into many documents.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import hashlib
+import os
+import threading
+
+from collections import OrderedDict
+
+from ..compat import is_string
+from .image import Image
+
+
+class ImageCache(object):
+    """
+    Bounded least-recently-used cache of |Image| objects, keyed by file path,
+    modification time and size for an image identified by path, and by SHA1
+    digest for an image read from a stream.
+
+    A cached image holds its bytes in memory, so each document the image is added
+    to shares the same bytes object, and neither the file read nor the header
+    parsing is repeated. No cache is used unless one is enabled for the process
+    with :meth:`enable`::
+
+        ImageCache.enable(maxsize=32)
+
+    after which every picture added by path or stream, in any document, is looked up
+    in the cache. Access is thread-safe.
+    """
+
+    _current = None
+
+    def __init__(self, maxsize=128):
+        super(ImageCache, self).__init__()
+        self._maxsize = maxsize
+        self._images = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._images)
+
+    def clear(self):
+        """
+        Remove all images from this cache.
+        """
+        with self._lock:
+            self._images.clear()
+
+    @classmethod
+    def current(cls):
+        """
+        The |ImageCache| instance enabled for this process, or |None| if image
+        caching is disabled, the default.
+        """
+        return cls._current
+
+    @classmethod
+    def disable(cls):
+        """
+        Stop caching images for this process and release the cached images.
+        """
+        cls._current = None
+
+    @classmethod
+    def enable(cls, maxsize=128):
+        """
+        Return a newly created |ImageCache| instance holding at most *maxsize*
+        images, after enabling it for this process. Any previously enabled cache
+        is discarded.
+        """
+        cache = cls._current = cls(maxsize)
+        return cache
+
+    def get(self, image_descriptor):
+        """
+        Return the |Image| instance for the image identified by *image_descriptor*, a
+        path or file-like object, loading it and adding it to this cache when not
+        already present.
+        """
+        if is_string(image_descriptor):
+            return self._get_by_path(image_descriptor)
+        return self._get_by_stream(image_descriptor)
+
+    @property
+    def maxsize(self):
+        """
+        The maximum number of images held by this cache.
+        """
+        return self._maxsize
+
+    def _add(self, key, image):
+        """
+        Add *image* to this cache under *key*, evicting the least recently used
+        images once the cache is full. Return the image cached under *key*, which
+        is the one added by another thread when it won a race to add it.
+        """
+        with self._lock:
+            images = self._images
+            if key in images:
+                return images[key]
+            images[key] = image
+            while len(images) > self._maxsize:
+                images.popitem(last=False)
+        return image
+
+    def _get_by_path(self, path):
+        """
+        Return the cached |Image| for the file at *path*, keyed by its absolute
+        path, modification time and size so a changed file is read again.
+        """
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        key = ('path', path, stat.st_mtime, stat.st_size)
+        image = self._lookup(key)
+        if image is not None:
+            return image
+        with open(path, 'rb') as stream:
+            image = Image._from_stream(
+                stream, stream.read(), os.path.basename(path)
+            )
+        return self._add(key, image)
+
+    def _get_by_stream(self, stream):
+        """
+        Return the cached |Image| for the bytes in *stream*, keyed by their SHA1
+        digest.
+        """
+        stream.seek(0)
+        blob = stream.read()
+        digest = hashlib.sha1(blob).hexdigest()
+        key = ('sha1', digest)
+        image = self._lookup(key)
+        if image is not None:
+            return image
+        image = Image._from_stream(stream, blob)
+        image._digests['sha1'] = digest
+        return self._add(key, image)
+
+    def _lookup(self, key):
+        """
+        Return the image cached under *key*, marking it most recently used, or
+        |None| if there is no such image.
+        """
+        with self._lock:
+            image = self._images.pop(key, None)
+            if image is not None:
+                self._images[key] = image
+        return image
@@ -5,6 +5,13 @@ Exceptions specific the the image sub-package
 """
 
 
+class ImageFileChangedError(Exception):
+    """
+    The file an image is read from on demand was changed or removed after the
+    image was loaded.
+    """
+
+
 class InvalidImageStreamError(Exception):
     """
     The recognized image stream appears to be corrupted
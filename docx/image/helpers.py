@@ -10,6 +10,9 @@ from .exceptions import UnexpectedEndOfFileError
 BIG_ENDIAN = '>'
 LITTLE_ENDIAN = '<'
 
+# ---compiled |Struct| for each format read so far, by format string---
+_structs = {}
+
 
 class StreamReader(object):
     """
@@ -89,7 +92,9 @@ class StreamReader(object):
         return bytes_
 
     def _read_int(self, fmt, base, offset):
-        struct = Struct(fmt)
+        struct = _structs.get(fmt)
+        if struct is None:
+            struct = _structs[fmt] = Struct(fmt)
         return self._unpack_item(struct, base, offset)
 
     def _unpack_item(self, struct, base, offset):
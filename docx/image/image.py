@@ -11,7 +11,8 @@ import hashlib
 import os
 
 from ..compat import BytesIO, is_string
-from .exceptions import UnrecognizedImageError
+from ..opc.blobstore import CHUNK_SIZE, SpooledBlob, iter_blob, read_blob
+from .exceptions import ImageFileChangedError, UnrecognizedImageError
 from ..shared import Emu, Inches, lazyproperty
 
 
@@ -19,12 +20,23 @@ class Image(object):
     """
     Graphical image stream such as JPEG, PNG, or GIF with properties and
     methods required by ImagePart.
+
+    An image loaded from a path is read when it is loaded. Assign |True| to
+    ``Image.read_paths_lazily`` to instead read only its headers then, and its
+    bytes from the file when they are needed, typically when the document is
+    saved. The file must then stay unchanged until that time;
+    |ImageFileChangedError| is raised when it has changed or been removed.
     """
-    def __init__(self, blob, filename, image_header):
+
+    read_paths_lazily = False
+
+    def __init__(self, blob, filename, image_header, source=None):
         super(Image, self).__init__()
         self._blob = blob
         self._filename = filename
         self._image_header = image_header
+        self._source = source
+        self._digests = {}
 
     @classmethod
     def from_blob(cls, blob):
@@ -39,27 +51,40 @@ class Image(object):
     def from_file(cls, image_descriptor):
         """
         Return a new |Image| subclass instance loaded from the image file
-        identified by *image_descriptor*, a path or file-like object.
-        """
+        identified by *image_descriptor*, a path or file-like object. The
+        image bytes are read once, here, unless *image_descriptor* is a path
+        and ``Image.read_paths_lazily`` is |True|. The image headers are
+        parsed from the open file rather than from a copy of those bytes.
+        When an |ImageCache| is enabled, the image is looked up in that cache
+        instead.
+        """
+        from docx.image.cache import ImageCache
+
+        cache = ImageCache.current()
+        if cache is not None:
+            return cache.get(image_descriptor)
         if is_string(image_descriptor):
             path = image_descriptor
-            with open(path, 'rb') as f:
-                blob = f.read()
-                stream = BytesIO(blob)
             filename = os.path.basename(path)
-        else:
-            stream = image_descriptor
-            stream.seek(0)
-            blob = stream.read()
-            filename = None
-        return cls._from_stream(stream, blob, filename)
+            with open(path, 'rb') as stream:
+                if cls.read_paths_lazily:
+                    source = _SourceFile(path, os.fstat(stream.fileno()))
+                    return cls._from_stream(stream, None, filename, source)
+                blob = SpooledBlob.spool_stream(stream)
+                return cls._from_stream(stream, blob, filename)
+        stream = image_descriptor
+        stream.seek(0)
+        blob = SpooledBlob.spool_stream(stream)
+        return cls._from_stream(stream, blob, None)
 
     @property
     def blob(self):
         """
         The bytes of the image 'file'
         """
-        return self._blob
+        if self._source is not None:
+            return b''.join(self._source.iter_chunks(CHUNK_SIZE))
+        return read_blob(self._blob)
 
     @property
     def content_type(self):
@@ -69,6 +94,20 @@ class Image(object):
         """
         return self._image_header.content_type
 
+    def digest(self, hash_name='sha1'):
+        """
+        Hex digest of the image blob, computed with the :mod:`hashlib`
+        algorithm named by *hash_name*, e.g. ``'sha1'`` or ``'blake2b'``. The
+        digest for each algorithm is computed only once.
+        """
+        digests = self._digests
+        if hash_name not in digests:
+            hash_ = hashlib.new(hash_name)
+            for chunk in self.iter_blob_chunks():
+                hash_.update(chunk)
+            digests[hash_name] = hash_.hexdigest()
+        return digests[hash_name]
+
     @lazyproperty
     def ext(self):
         """
@@ -87,6 +126,16 @@ class Image(object):
         """
         return self._filename
 
+    def iter_blob_chunks(self, chunk_size=CHUNK_SIZE):
+        """
+        Generate the bytes of the image 'file' in chunks of at most
+        *chunk_size* bytes, reading them from the image file or the temporary
+        file holding them when they are not held in memory.
+        """
+        if self._source is not None:
+            return self._source.iter_chunks(chunk_size)
+        return iter_blob(self._blob, chunk_size)
+
     @property
     def px_width(self):
         """
@@ -160,23 +209,69 @@ class Image(object):
 
         return Emu(width), Emu(height)
 
-    @lazyproperty
+    @property
     def sha1(self):
         """
         SHA1 hash digest of the image blob
         """
-        return hashlib.sha1(self._blob).hexdigest()
+        return self.digest('sha1')
 
     @classmethod
-    def _from_stream(cls, stream, blob, filename=None):
+    def _from_stream(cls, stream, blob, filename=None, source=None):
         """
         Return an instance of the |Image| subclass corresponding to the
-        format of the image in *stream*.
+        format of the image in *stream*. *blob* is |None| when the image
+        bytes are to be read from *source* on demand.
         """
         image_header = _ImageHeaderFactory(stream)
         if filename is None:
             filename = 'image.%s' % image_header.default_ext
-        return cls(blob, filename, image_header)
+        return cls(blob, filename, image_header, source)
+
+
+class _SourceFile(object):
+    """
+    The image file an |Image| reads its bytes from on demand, along with the
+    status of that file when the image was loaded. The file is checked
+    against that status each time it is read, so bytes from a file changed
+    since are never mistaken for the image.
+    """
+    def __init__(self, path, stat_result):
+        super(_SourceFile, self).__init__()
+        self._path = path
+        self._signature = self._signature_of(stat_result)
+
+    def iter_chunks(self, chunk_size):
+        """
+        Generate the bytes of the file in chunks of at most *chunk_size*
+        bytes. Raises |ImageFileChangedError| when the file has been changed
+        or removed since the image was loaded.
+        """
+        try:
+            f = open(self._path, 'rb')
+        except (IOError, OSError):
+            raise ImageFileChangedError(
+                "image file '%s' was removed after it was added" % self._path
+            )
+        with f:
+            if self._signature_of(os.fstat(f.fileno())) != self._signature:
+                raise ImageFileChangedError(
+                    "image file '%s' changed after it was added" % self._path
+                )
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                yield chunk
+
+    @staticmethod
+    def _signature_of(stat_result):
+        """
+        Return the values of *stat_result* that change when a file is
+        rewritten or replaced.
+        """
+        mtime = getattr(stat_result, 'st_mtime_ns', stat_result.st_mtime)
+        return (
+            stat_result.st_dev, stat_result.st_ino, stat_result.st_size,
+            mtime
+        )
 
 
 def _ImageHeaderFactory(stream):
@@ -183,10 +183,16 @@ class _MarkerParser(object):
 class _MarkerFinder(object):
     """
     Service class that knows how to find the next JFIF marker in a stream.
+    The stream is read in blocks that are searched in memory rather than a
+    byte at a time.
     """
+    _block_size = 4096
+
     def __init__(self, stream):
         super(_MarkerFinder, self).__init__()
         self._stream = stream
+        self._block = b''
+        self._block_offset = 0
 
     @classmethod
     def from_stream(cls, stream):
@@ -217,6 +223,24 @@ class _MarkerFinder(object):
             break
         return marker_code, segment_offset
 
+    def _block_at(self, offset):
+        """
+        Return a (block, block_offset) 2-tuple where *block* is a sequence of
+        bytes read from *stream* that contains the byte at *offset* and
+        *block_offset* is the offset in *stream* of its first byte. The last
+        block read is reused when it contains *offset*. Raise Exception if
+        *offset* is at or beyond the end of the stream.
+        """
+        block, block_offset = self._block, self._block_offset
+        if not block_offset <= offset < block_offset + len(block):
+            self._stream.seek(offset)
+            block = self._stream.read(self._block_size)
+            if not block:  # pragma: no cover
+                raise Exception('unexpected end of file')
+            self._block = block
+            self._block_offset = block_offset = offset
+        return block, block_offset
+
     def _next_non_ff_byte(self, start):
         """
         Return an offset, byte 2-tuple for the next byte in *stream* that is
@@ -224,12 +248,15 @@ class _MarkerFinder(object):
         offset *start* is not '\xFF', *start* and the returned *offset* will
         be the same.
         """
-        self._stream.seek(start)
-        byte_ = self._read_byte()
-        while byte_ == b'\xFF':
-            byte_ = self._read_byte()
-        offset_of_non_ff_byte = self._stream.tell() - 1
-        return offset_of_non_ff_byte, byte_
+        offset = start
+        while True:
+            block, block_offset = self._block_at(offset)
+            idx, block_len = offset - block_offset, len(block)
+            while idx < block_len and block[idx:idx+1] == b'\xFF':
+                idx += 1
+            if idx < block_len:
+                return block_offset + idx, block[idx:idx+1]
+            offset = block_offset + block_len
 
     def _offset_of_next_ff_byte(self, start):
         """
@@ -237,22 +264,13 @@ class _MarkerFinder(object):
         the byte at offset *start*. Returns *start* if the byte at that
         offset is a hex 255; it does not necessarily advance in the stream.
         """
-        self._stream.seek(start)
-        byte_ = self._read_byte()
-        while byte_ != b'\xFF':
-            byte_ = self._read_byte()
-        offset_of_ff_byte = self._stream.tell() - 1
-        return offset_of_ff_byte
-
-    def _read_byte(self):
-        """
-        Return the next byte read from stream. Raise Exception if stream is
-        at end of file.
-        """
-        byte_ = self._stream.read(1)
-        if not byte_:  # pragma: no cover
-            raise Exception('unexpected end of file')
-        return byte_
+        offset = start
+        while True:
+            block, block_offset = self._block_at(offset)
+            idx = block.find(b'\xFF', offset - block_offset)
+            if idx != -1:
+                return block_offset + idx
+            offset = block_offset + len(block)
 
 
 def _MarkerFactory(marker_code, stream, offset):
@@ -48,6 +48,11 @@ class _TiffParser(object):
     Parses a TIFF image stream to extract the image properties found in its
     main image file directory (IFD)
     """
+    _tags = (
+        TIFF_TAG.IMAGE_WIDTH, TIFF_TAG.IMAGE_LENGTH, TIFF_TAG.X_RESOLUTION,
+        TIFF_TAG.Y_RESOLUTION, TIFF_TAG.RESOLUTION_UNIT
+    )
+
     def __init__(self, ifd_entries):
         super(_TiffParser, self).__init__()
         self._ifd_entries = ifd_entries
@@ -60,7 +65,9 @@ class _TiffParser(object):
         """
         stream_rdr = cls._make_stream_reader(stream)
         ifd0_offset = stream_rdr.read_long(4)
-        ifd_entries = _IfdEntries.from_stream(stream_rdr, ifd0_offset)
+        ifd_entries = _IfdEntries.from_stream(
+            stream_rdr, ifd0_offset, cls._tags
+        )
         return cls(ifd_entries)
 
     @property
@@ -167,12 +174,13 @@ class _IfdEntries(object):
         return self._entries.__getitem__(key)
 
     @classmethod
-    def from_stream(cls, stream, offset):
+    def from_stream(cls, stream, offset, tags=None):
         """
         Return a new |_IfdEntries| instance parsed from *stream* starting at
-        *offset*.
+        *offset*. When *tags* is a sequence of tag codes, only the entries
+        having those tags are parsed.
         """
-        ifd_parser = _IfdParser(stream, offset)
+        ifd_parser = _IfdParser(stream, offset, tags)
         entries = dict((e.tag, e.value) for e in ifd_parser.iter_entries())
         return cls(entries)
 
@@ -189,20 +197,31 @@ class _IfdParser(object):
     Service object that knows how to extract directory entries from an Image
     File Directory (IFD)
     """
-    def __init__(self, stream_rdr, offset):
+    def __init__(self, stream_rdr, offset, tags=None):
         super(_IfdParser, self).__init__()
         self._stream_rdr = stream_rdr
         self._offset = offset
+        self._tags = tags
 
     def iter_entries(self):
         """
         Generate an |_IfdEntry| instance corresponding to each entry in the
-        directory.
+        directory. When this parser was given *tags*, only entries having one
+        of those tags are generated, and iteration stops as soon as all of
+        them have been found; the values of other entries are never read.
         """
+        stream_rdr = self._stream_rdr
+        pending_tags = None if self._tags is None else set(self._tags)
         for idx in range(self._entry_count):
+            if pending_tags is not None and not pending_tags:
+                return
             dir_entry_offset = self._offset + 2 + (idx*12)
-            ifd_entry = _IfdEntryFactory(self._stream_rdr, dir_entry_offset)
-            yield ifd_entry
+            if pending_tags is not None:
+                tag_code = stream_rdr.read_short(dir_entry_offset)
+                if tag_code not in pending_tags:
+                    continue
+                pending_tags.discard(tag_code)
+            yield _IfdEntryFactory(stream_rdr, dir_entry_offset)
 
     @property
     def _entry_count(self):
@@ -0,0 +1,265 @@
+# encoding: utf-8
+
+"""
+Storage for the binary content of package parts, such as images, that can be held
+outside of memory.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import itertools
+import os
+import threading
+import weakref
+from tempfile import TemporaryFile
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class SpooledBlob(object):
+    """
+    The bytes of a package part, held in memory while they are small and moved to
+    disk once they grow past :attr:`spill_threshold` bytes.
+
+    Spilling is disabled by default. Assign a byte count to
+    ``SpooledBlob.spill_threshold`` to enable it for parts loaded or added after the
+    assignment, e.g. ``SpooledBlob.spill_threshold = 8 * 1024 * 1024``. Blobs moved
+    to disk share a temporary file, each keeping only its offset and size, so the
+    number of open files does not grow with the number of parts. The space a blob
+    uses in that file is given back when the blob is garbage collected.
+    """
+
+    spill_threshold = None
+
+    def __init__(self, chunks, max_size):
+        super(SpooledBlob, self).__init__()
+        self._spill_file = None
+        chunks = iter(chunks)
+        buffered, size = [], 0
+        for chunk in chunks:
+            buffered.append(chunk)
+            size += len(chunk)
+            if max_size is not None and size > max_size:
+                spill_file = _active_spill_file()
+                self._offset, self._size = spill_file.append(
+                    itertools.chain(buffered, chunks)
+                )
+                self._bytes, self._spill_file = None, spill_file
+                return
+        self._bytes, self._offset, self._size = b"".join(buffered), None, size
+
+    def __del__(self):
+        spill_file = getattr(self, "_spill_file", None)
+        if spill_file is not None:
+            spill_file.release(self._offset)
+
+    def __len__(self):
+        return self._size
+
+    @classmethod
+    def spool(cls, blob):
+        """
+        Return *blob* unchanged when spilling is disabled, otherwise a new
+        |SpooledBlob| instance holding the bytes of *blob*.
+        """
+        if cls.spill_threshold is None or blob is None:
+            return blob
+        return cls((blob,), cls.spill_threshold)
+
+    @classmethod
+    def spool_stream(cls, stream, chunk_size=CHUNK_SIZE):
+        """
+        Return the bytes read from *stream*, from its current position to its end.
+        When spilling is enabled they are returned as a |SpooledBlob| instance and
+        are read in chunks of *chunk_size* bytes, so a blob moved to disk is never
+        held in memory whole.
+        """
+        if cls.spill_threshold is None:
+            return stream.read()
+        chunks = iter(lambda: stream.read(chunk_size), b"")
+        return cls(chunks, cls.spill_threshold)
+
+    @property
+    def is_spilled(self):
+        """
+        |True| if the bytes of this blob have been moved to disk.
+        """
+        return self._spill_file is not None
+
+    def iter_chunks(self, chunk_size=CHUNK_SIZE):
+        """
+        Generate the bytes held by this blob in chunks of at most *chunk_size* bytes.
+        """
+        for start in range(0, self._size, chunk_size):
+            yield self._read(start, min(chunk_size, self._size - start))
+
+    def read(self):
+        """
+        Return the bytes held by this blob, loaded into memory.
+        """
+        return self._read(0, self._size)
+
+    def _read(self, start, size):
+        """
+        Return *size* bytes of this blob starting at *start*.
+        """
+        if self._bytes is not None:
+            return self._bytes[start:start + size]
+        return self._spill_file.read(self._offset + start, size)
+
+
+class _SpillFile(object):
+    """
+    Temporary file holding the bytes of spilled |SpooledBlob| objects, one after the
+    other.
+
+    The file is created on first use and keeps the offset and size of each blob
+    still using it. Releasing the blob at the end of the file truncates the file to
+    the end of the last blob still in use, and releasing the last blob closes the
+    file, which removes it. A gap left by a blob released from the middle is
+    reclaimed once the blobs after it are released too.
+
+    A file is frozen when the process forks, because the parent and child then share
+    it. A frozen file is never written or truncated again, only read, and is closed
+    by each process once that process has released its last blob in it. Access is
+    serialized so blobs can be read from more than one thread.
+    """
+
+    def __init__(self):
+        super(_SpillFile, self).__init__()
+        self._file = None
+        self._lock = threading.Lock()
+        self._sizes = {}
+        self._end = 0
+        self._frozen = False
+        self.pid = os.getpid()
+
+    def append(self, chunks):
+        """
+        Write the byte-strings generated by *chunks* at the end of the file and
+        return an ``(offset, size)`` pair locating the bytes written.
+        """
+        with self._lock:
+            if self._file is None:
+                self._file = TemporaryFile()
+            offset = size = self._end
+            self._file.seek(offset)
+            try:
+                for chunk in chunks:
+                    self._file.write(chunk)
+                    size += len(chunk)
+                self._file.flush()
+            except BaseException:
+                self._truncate(offset)
+                raise
+            self._sizes[offset] = size - offset
+            self._end = size
+            return offset, size - offset
+
+    def freeze(self):
+        """
+        Stop writing to and truncating this file. Called when the process forks.
+        """
+        with self._lock:
+            self._frozen = True
+
+    @property
+    def is_empty(self):
+        """
+        |True| when no blob is stored in this file.
+        """
+        return not self._sizes
+
+    def read(self, offset, size):
+        """
+        Return *size* bytes read from the file starting at *offset*.
+        """
+        if _pread is not None:
+            return _pread(self._file.fileno(), size, offset)
+        with self._lock:
+            self._file.seek(offset)
+            return self._file.read(size)
+
+    def release(self, offset):
+        """
+        Give back the space used by the blob stored at *offset*.
+        """
+        with self._lock:
+            size = self._sizes.pop(offset)
+            if not self._sizes:
+                self._file.close()
+                self._file, self._end = None, 0
+            elif not self._frozen and offset + size == self._end:
+                self._truncate(max(o + s for o, s in self._sizes.items()))
+
+    def _truncate(self, end):
+        """
+        Cut the file down to *end* bytes, unless it is frozen.
+        """
+        if self._frozen:
+            return
+        self._file.seek(end)
+        self._file.truncate()
+        self._end = end
+
+
+_pread = getattr(os, "pread", None)
+_spill_file = _SpillFile()
+_frozen_spill_files = weakref.WeakSet()
+
+
+def _active_spill_file():
+    """
+    Return the spill file new blobs are written to in this process. A process forked
+    without the fork hooks below notices here and stops using its parent's file.
+    """
+    if _spill_file.pid != os.getpid():
+        _freeze_spill_file()
+    return _spill_file
+
+
+def _freeze_spill_file():
+    """
+    Freeze the spill file in use, if it holds any blob, and start a new one for
+    blobs spilled after the fork.
+    """
+    global _spill_file
+    if not _spill_file.is_empty:
+        _spill_file.freeze()
+        _frozen_spill_files.add(_spill_file)
+    _spill_file = _SpillFile()
+
+
+def _reset_spill_locks_in_child():
+    """
+    Replace the locks of frozen spill files in a forked child, where a lock held by
+    another thread of the parent at the time of the fork would never be released.
+    """
+    for spill_file in list(_frozen_spill_files):
+        spill_file._lock = threading.Lock()
+    _spill_file.pid = os.getpid()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(
+        before=_freeze_spill_file, after_in_child=_reset_spill_locks_in_child
+    )
+
+
+def iter_blob(blob, chunk_size=CHUNK_SIZE):
+    """
+    Generate the bytes of *blob*, a byte-string or |SpooledBlob|, in chunks. A
+    byte-string is generated whole, as a single chunk.
+    """
+    if isinstance(blob, SpooledBlob):
+        return blob.iter_chunks(chunk_size)
+    return iter((blob,))
+
+
+def read_blob(blob):
+    """
+    Return the bytes of *blob*, which is a byte-string, a |SpooledBlob| or |None|.
+    """
+    if isinstance(blob, SpooledBlob):
+        return blob.read()
+    return blob
@@ -9,15 +9,47 @@ the package related custom element classes.
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+import threading
+import warnings
+
 from lxml import etree
 
 from .constants import NAMESPACE as NS, RELATIONSHIP_TARGET_MODE as RTM
 
 
-# configure XML parser
+# configure XML parser, one for each thread, see docx.oxml.thread_parser()
 element_class_lookup = etree.ElementNamespaceClassLookup()
-oxml_parser = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
-oxml_parser.set_element_class_lookup(element_class_lookup)
+_thread_parsers = threading.local()
+
+
+def thread_parser():
+    """
+    Return the oxml parser of the calling thread, creating it on the first
+    call in that thread.
+    """
+    parser = getattr(_thread_parsers, 'parser', None)
+    if parser is None:
+        parser = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
+        parser.set_element_class_lookup(element_class_lookup)
+        _thread_parsers.parser = parser
+    return parser
+
+
+def __getattr__(name):
+    """
+    Resolve the deprecated ``oxml_parser`` name to the parser of the calling
+    thread, so code passing it to lxml directly does not share one parser
+    across threads. Use :func:`thread_parser` instead.
+    """
+    if name == 'oxml_parser':
+        warnings.warn(
+            'oxml_parser is deprecated, use thread_parser() instead',
+            DeprecationWarning, stacklevel=2
+        )
+        return thread_parser()
+    raise AttributeError(
+        'module %r has no attribute %r' % (__name__, name)
+    )
 
 nsmap = {
     'ct': NS.OPC_CONTENT_TYPES,
@@ -32,9 +64,10 @@ nsmap = {
 
 def parse_xml(text):
     """
-    ``etree.fromstring()`` replacement that uses oxml parser
+    ``etree.fromstring()`` replacement that uses the oxml parser of the
+    calling thread
     """
-    return etree.fromstring(text, oxml_parser)
+    return etree.fromstring(text, thread_parser())
 
 
 def qn(tag):
@@ -8,6 +8,7 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+from .blobstore import SpooledBlob, iter_blob, read_blob
 from .compat import cls_method_fn
 from .oxml import serialize_part_xml
 from ..oxml import parse_xml
@@ -56,7 +57,7 @@ class Part(object):
         binary. Intended to be overridden by subclasses. Default behavior is
         to return load blob.
         """
-        return self._blob
+        return read_blob(self._blob)
 
     @property
     def content_type(self):
@@ -74,9 +75,19 @@ class Part(object):
         if self._rel_ref_count(rId) < 2:
             del self.rels[rId]
 
+    def iter_blob_chunks(self):
+        """
+        Generate the contents of this part as a sequence of byte-strings, so
+        a large blob held out of memory can be written without loading it
+        whole. A blob held in memory is generated as a single chunk.
+        """
+        if isinstance(self._blob, SpooledBlob):
+            return iter_blob(self._blob)
+        return iter((self.blob,))
+
     @classmethod
     def load(cls, partname, content_type, blob, package):
-        return cls(partname, content_type, blob, package)
+        return cls(partname, content_type, SpooledBlob.spool(blob), package)
 
     def load_rel(self, reltype, target, rId, is_external=False):
         """
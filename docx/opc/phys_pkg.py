@@ -7,8 +7,10 @@ Provides a general interface to a *physical* OPC package, such as a zip file.
 from __future__ import absolute_import
 
 import os
+import sys
+import time
 
-from zipfile import ZipFile, is_zipfile, ZIP_DEFLATED
+from zipfile import ZipFile, ZipInfo, is_zipfile, ZIP_DEFLATED
 
 from .compat import is_string
 from .exceptions import PackageNotFoundError
@@ -153,3 +155,31 @@ class _ZipPkgWriter(PhysPkgWriter):
         *pack_uri*.
         """
         self._zipf.writestr(pack_uri.membername, blob)
+
+    def write_chunks(self, pack_uri, chunks):
+        """
+        Write the byte-strings generated by *chunks* to this zip package as a
+        single member with the membername corresponding to *pack_uri*,
+        without joining them in memory first where the Python version
+        allows it. A blob generated as a single chunk is written as a whole.
+        One generated in several chunks, as a blob held out of memory is, is
+        streamed with ZIP64 extensions, since its size is not known up front
+        and may pass the 2 GiB limit of a plain zip member.
+        """
+        if sys.version_info < (3, 6):
+            return self.write(pack_uri, b''.join(chunks))
+        chunks = iter(chunks)
+        first_chunk = next(chunks, b'')
+        second_chunk = next(chunks, None)
+        if second_chunk is None:
+            return self.write(pack_uri, first_chunk)
+        zinfo = ZipInfo(
+            pack_uri.membername, date_time=time.localtime(time.time())[:6]
+        )
+        zinfo.compress_type = ZIP_DEFLATED
+        zinfo.external_attr = 0o600 << 16
+        with self._zipf.open(zinfo, 'w', force_zip64=True) as f:
+            f.write(first_chunk)
+            f.write(second_chunk)
+            for chunk in chunks:
+                f.write(chunk)
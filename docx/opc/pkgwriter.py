@@ -51,7 +51,7 @@ class PackageWriter(object):
         rels item for its relationships if and only if it has any.
         """
         for part in parts:
-            phys_writer.write(part.partname, part.blob)
+            phys_writer.write_chunks(part.partname, part.iter_blob_chunks())
             if len(part._rels):
                 phys_writer.write(part.partname.rels_uri, part._rels.xml)
 
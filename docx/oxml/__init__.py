@@ -7,28 +7,113 @@ corresponding to Open XML elements.
 
 from __future__ import absolute_import
 
+import threading
+import warnings
+
+from copy import deepcopy
+
 from lxml import etree
 
 from .ns import NamespacePrefixedTag, nsmap
 
 
-# configure XML parser
+# configure XML parser; an lxml parser must not be used by two threads at
+# once, so each thread gets its own, all sharing the one class lookup
 element_class_lookup = etree.ElementNamespaceClassLookup()
-oxml_parser = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
-oxml_parser.set_element_class_lookup(element_class_lookup)
+_thread_parsers = threading.local()
+
+
+def thread_parser():
+    """
+    Return the oxml parser of the calling thread, creating it on the first
+    call in that thread. Every such parser uses the custom element classes
+    registered with :func:`register_element_cls`, so any thread can parse
+    and create oxml elements without locking.
+    """
+    parser = getattr(_thread_parsers, 'parser', None)
+    if parser is None:
+        parser = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
+        parser.set_element_class_lookup(element_class_lookup)
+        _thread_parsers.parser = parser
+    return parser
+
+
+def __getattr__(name):
+    """
+    Resolve the deprecated ``oxml_parser`` name to the parser of the calling
+    thread, so code passing it to lxml directly does not share one parser
+    across threads. Use :func:`thread_parser` instead.
+    """
+    if name == 'oxml_parser':
+        warnings.warn(
+            'oxml_parser is deprecated, use thread_parser() instead',
+            DeprecationWarning, stacklevel=2
+        )
+        return thread_parser()
+    raise AttributeError(
+        'module %r has no attribute %r' % (__name__, name)
+    )
 
 
 def parse_xml(xml):
     """
     Return root lxml element obtained by parsing XML character string in
     *xml*, which can be either a Python 2.x string or unicode. The custom
-    parser is used, so custom element classes are produced for elements in
-    *xml* that have them.
+    parser of the calling thread is used, so custom element classes are
+    produced for elements in *xml* that have them.
     """
-    root_element = etree.fromstring(xml, oxml_parser)
+    root_element = etree.fromstring(xml, thread_parser())
     return root_element
 
 
+# parsed prototype elements, keyed by name, shared by the whole process
+_prototypes = {}
+
+
+def clone_prototype(key, load_xml):
+    """
+    Return a new element tree that is a deep copy of the prototype element
+    registered under *key*. The first time *key* is used, the prototype is
+    parsed from the XML returned by calling *load_xml*, which takes no
+    arguments, so XML such as a template file is read and parsed only once per
+    process. Every default part and element skeleton built from fixed XML is
+    registered here under a distinct key, e.g. the template file name.
+    """
+    prototype = _prototypes.get(key)
+    if prototype is None:
+        prototype = _prototypes.setdefault(key, parse_xml(load_xml()))
+    return deepcopy(prototype)
+
+
+# compiled XPath expressions of each thread, keyed by expression text; lxml
+# serializes evaluation of an XPath object, so threads do not share them.
+# Expressions past the limit are compiled on each use
+_thread_xpaths = threading.local()
+_XPATHS_MAX = 1024
+
+
+def compiled_xpath(xpath_str):
+    """
+    Return an |etree.XPath| object for *xpath_str*, compiled with the
+    standard namespace mapping the first time it is requested in the calling
+    thread and reused by that thread after that. A value that changes from
+    call to call is passed as an XPath variable rather than formatted into
+    the expression, e.g.
+    ``compiled_xpath('w:style[@w:styleId=$styleId]')(styles, styleId=id_)``,
+    so there is one compiled expression however many values are used and no
+    quoting problems with values containing quote characters.
+    """
+    xpaths = getattr(_thread_xpaths, 'xpaths', None)
+    if xpaths is None:
+        xpaths = _thread_xpaths.xpaths = {}
+    xpath = xpaths.get(xpath_str)
+    if xpath is None:
+        xpath = etree.XPath(xpath_str, namespaces=nsmap)
+        if len(xpaths) < _XPATHS_MAX:
+            xpaths[xpath_str] = xpath
+    return xpath
+
+
 def register_element_cls(tag, cls):
     """
     Register *cls* to be constructed when the oxml parser encounters an
@@ -55,7 +140,7 @@ def OxmlElement(nsptag_str, attrs=None, nsdecls=None):
     nsptag = NamespacePrefixedTag(nsptag_str)
     if nsdecls is None:
         nsdecls = nsptag.nsmap
-    return oxml_parser.makeelement(
+    return thread_parser().makeelement(
         nsptag.clark_name, attrib=attrs, nsmap=nsdecls
     )
 
@@ -76,7 +161,10 @@ from .document import CT_Body, CT_Document  # noqa
 register_element_cls('w:body',     CT_Body)
 register_element_cls('w:document', CT_Document)
 
-from .numbering import CT_Num, CT_Numbering, CT_NumLvl, CT_NumPr  # noqa
+from .numbering import (  # noqa
+    CT_AbstractNum, CT_Num, CT_Numbering, CT_NumLvl, CT_NumPr
+)
+register_element_cls('w:abstractNum',   CT_AbstractNum)
 register_element_cls('w:abstractNumId', CT_DecimalNumber)
 register_element_cls('w:ilvl',          CT_DecimalNumber)
 register_element_cls('w:lvlOverride',   CT_NumLvl)
@@ -135,14 +223,19 @@ register_element_cls('wp:docPr',      CT_NonVisualDrawingProps)
 register_element_cls('wp:extent',     CT_PositiveSize2D)
 register_element_cls('wp:inline',     CT_Inline)
 
-from .styles import CT_LatentStyles, CT_LsdException, CT_Style, CT_Styles  # noqa
+from .styles import (  # noqa
+    CT_LatentStyles, CT_LsdException, CT_PPrDefault, CT_RPrDefault, CT_Style,
+    CT_Styles
+)
 register_element_cls('w:basedOn',        CT_String)
 register_element_cls('w:latentStyles',   CT_LatentStyles)
 register_element_cls('w:locked',         CT_OnOff)
 register_element_cls('w:lsdException',   CT_LsdException)
 register_element_cls('w:name',           CT_String)
 register_element_cls('w:next',           CT_String)
+register_element_cls('w:pPrDefault',     CT_PPrDefault)
 register_element_cls('w:qFormat',        CT_OnOff)
+register_element_cls('w:rPrDefault',     CT_RPrDefault)
 register_element_cls('w:semiHidden',     CT_OnOff)
 register_element_cls('w:style',          CT_Style)
 register_element_cls('w:styles',         CT_Styles)
@@ -5,7 +5,11 @@ Custom element classes that correspond to the document part, e.g.
 <w:document>.
 """
 
-from .xmlchemy import BaseOxmlElement, ZeroOrOne, ZeroOrMore
+from .ns import qn
+from .xmlchemy import (
+    BaseOxmlElement, ZeroOrOne, ZeroOrMore, content_revision,
+    note_content_change, section_revision
+)
 
 
 class CT_Document(BaseOxmlElement):
@@ -14,13 +18,102 @@ class CT_Document(BaseOxmlElement):
     """
     body = ZeroOrOne('w:body')
 
+    # ---(section revision, sectPr list, sectPr indices) of the last search---
+    _section_index = (None, None, None)
+    # ---(content revision, effective header/footer rIds) of the last pass---
+    _hdrftr_index = (None, None)
+
+    @property
+    def hdrftr_rIds(self):
+        """
+        Return a list containing a dict for each section, in document order,
+        mapping each (reference tag, type) key of `CT_SectPr.hdrftr_rIds` to
+        the rId of the header or footer in effect for that section, whether
+        defined by the section itself or inherited from a prior section. The
+        list is computed in a single pass over the sections and is shared by
+        callers until the document content changes.
+        """
+        sectPr_lst = self.sectPr_lst
+        revision = content_revision(self)
+        cached_revision, hdrftr_rIds = self._hdrftr_index
+        if cached_revision != revision:
+            hdrftr_rIds = []
+            rIds = {}
+            for sectPr in sectPr_lst:
+                rIds = dict(rIds)
+                rIds.update(sectPr.hdrftr_rIds)
+                hdrftr_rIds.append(rIds)
+            self._hdrftr_index = (revision, hdrftr_rIds)
+        return hdrftr_rIds
+
+    @property
+    def last_sectPr(self):
+        """
+        Return the last ``<w:sectPr>`` element in the document, or |None| if
+        there is none. This is usually the sentinel ``<w:sectPr>`` at the end
+        of the body, which is found without searching the document.
+        """
+        body = self.body
+        if body is not None and len(body) and body[-1].tag == qn('w:sectPr'):
+            return body[-1]
+        sectPr_lst = self.sectPr_lst
+        return sectPr_lst[-1] if sectPr_lst else None
+
+    def sectPr_idx(self, sectPr):
+        """
+        Return the index of *sectPr* in `.sectPr_lst`. The document is
+        searched again when *sectPr* is not in the cached index, as when it
+        was added by a change the cache was not told about.
+        """
+        sectPr_idxs = self._sections[1]
+        if sectPr not in sectPr_idxs:
+            note_content_change(self)
+            sectPr_idxs = self._sections[1]
+        return sectPr_idxs[sectPr]
+
     @property
     def sectPr_lst(self):
         """
         Return a list containing a reference to each ``<w:sectPr>`` element
-        in the document, in the order encountered.
+        in the document, in the order encountered. The list is shared by
+        callers until the document content changes and must not be modified.
+        """
+        return self._sections[0]
+
+    @property
+    def _sections(self):
         """
-        return self.xpath('.//w:sectPr')
+        A (sectPr_lst, sectPr_idxs) pair, where *sectPr_idxs* maps each
+        ``<w:sectPr>`` element to its index in *sectPr_lst*. The document is
+        searched again only when its section revision has changed, that is
+        when a ``<w:sectPr>`` element has been added or removed, or when a
+        cached ``<w:sectPr>`` is no longer in the document, as when the
+        paragraph holding it was removed directly with lxml.
+        """
+        revision = section_revision(self)
+        cached_revision, sectPr_lst, sectPr_idxs = self._section_index
+        if cached_revision == revision and any(
+            _top_ancestor(sectPr) is not self for sectPr in sectPr_lst
+        ):
+            note_content_change(self)
+            revision = section_revision(self)
+        if cached_revision != revision:
+            sectPr_lst = self.xpath('.//w:sectPr')
+            sectPr_idxs = dict((sectPr, idx) for idx, sectPr in enumerate(sectPr_lst))
+            self._section_index = (revision, sectPr_lst, sectPr_idxs)
+        return sectPr_lst, sectPr_idxs
+
+
+def _top_ancestor(element):
+    """
+    Return the outermost ancestor of *element*, or *element* itself when it has
+    no parent. Unlike ``getroottree().getroot()``, this finds the detached
+    subtree an element removed from a document is left in.
+    """
+    parent = element.getparent()
+    while parent is not None:
+        element, parent = parent, parent.getparent()
+    return element
 
 
 class CT_Body(BaseOxmlElement):
@@ -51,6 +144,7 @@ class CT_Body(BaseOxmlElement):
         # ---remove any header or footer references from "new" last section---
         for hdrftr_ref in sentinel_sectPr.xpath("w:headerReference|w:footerReference"):
             sentinel_sectPr.remove(hdrftr_ref)
+        note_content_change(self)
         # ---the sentinel `w:sectPr` now controls the new last section---
         return sentinel_sectPr
 
@@ -65,3 +159,4 @@ class CT_Body(BaseOxmlElement):
             content_elms = self[:]
         for content_elm in content_elms:
             self.remove(content_elm)
+        note_content_change(self)
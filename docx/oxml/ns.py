@@ -28,28 +28,45 @@ nsmap = {
 
 pfxmap = dict((value, key) for key, value in nsmap.items())
 
+# Clark name of each namespace-prefixed tag converted by qn(), and each
+# NamespacePrefixedTag created, keyed by its tag and by its Clark name. The
+# set of tags used by the package is small and fixed, so these don't need
+# to be bounded.
+_clark_names = {}
+_nsptags = {}
+_nsptags_by_clark_name = {}
+
 
 class NamespacePrefixedTag(str):
     """
     Value object that knows the semantics of an XML tag having a namespace
-    prefix.
+    prefix. Instances are immutable and cached, so constructing the same tag
+    a second time returns the instance already created for it.
     """
     def __new__(cls, nstag, *args):
-        return super(NamespacePrefixedTag, cls).__new__(cls, nstag)
-
-    def __init__(self, nstag):
-        self._pfx, self._local_part = nstag.split(':')
-        self._ns_uri = nsmap[self._pfx]
+        try:
+            return _nsptags[nstag]
+        except KeyError:
+            pass
+        nsptag = super(NamespacePrefixedTag, cls).__new__(cls, nstag)
+        nsptag._pfx, nsptag._local_part = nstag.split(':')
+        nsptag._ns_uri = nsmap[nsptag._pfx]
+        nsptag._clark_name = qn(nstag)
+        return _nsptags.setdefault(nstag, nsptag)
 
     @property
     def clark_name(self):
-        return '{%s}%s' % (self._ns_uri, self._local_part)
+        return self._clark_name
 
     @classmethod
     def from_clark_name(cls, clark_name):
+        try:
+            return _nsptags_by_clark_name[clark_name]
+        except KeyError:
+            pass
         nsuri, local_name = clark_name[1:].split('}')
         nstag = '%s:%s' % (pfxmap[nsuri], local_name)
-        return cls(nstag)
+        return _nsptags_by_clark_name.setdefault(clark_name, cls(nstag))
 
     @property
     def local_part(self):
@@ -108,7 +125,13 @@ def qn(tag):
     Stands for "qualified name", a utility function to turn a namespace
     prefixed tag name into a Clark-notation qualified tag name for lxml. For
     example, ``qn('p:cSld')`` returns ``'{http://schemas.../main}cSld'``.
+    Each Clark name is computed once and the same string returned for each
+    later call with the same tag.
     """
+    try:
+        return _clark_names[tag]
+    except KeyError:
+        pass
     prefix, tagroot = tag.split(':')
     uri = nsmap[prefix]
-    return '{%s}%s' % (uri, tagroot)
+    return _clark_names.setdefault(tag, '{%s}%s' % (uri, tagroot))
@@ -4,7 +4,8 @@
 Custom element classes related to the numbering part
 """
 
-from . import OxmlElement
+from . import OxmlElement, clone_prototype
+from .ns import nsdecls
 from .shared import CT_DecimalNumber
 from .simpletypes import ST_DecimalNumber
 from .xmlchemy import (
@@ -12,6 +13,67 @@ from .xmlchemy import (
 )
 
 
+class CT_AbstractNum(BaseOxmlElement):
+    """
+    ``<w:abstractNum>`` element, an abstract numbering definition, holding the
+    number format, text and indentation of each level of a list.
+    """
+    _tag_seq = (
+        'w:nsid', 'w:multiLevelType', 'w:tmpl', 'w:name', 'w:styleLink',
+        'w:numStyleLink', 'w:lvl'
+    )
+    name = ZeroOrOne('w:name', successors=_tag_seq[4:])
+    abstractNumId = RequiredAttribute('w:abstractNumId', ST_DecimalNumber)
+    del _tag_seq
+
+    @classmethod
+    def new(cls, abstractNum_id, name):
+        """
+        Return a new ``<w:abstractNum>`` element having abstractNumId of
+        *abstractNum_id* and name *name*, defining a numbered list of nine
+        levels numbered 1., a., i., 1., and so on, each indented a further
+        half inch. The element is a copy of a prototype parsed once.
+        """
+        abstractNum = clone_prototype('w:abstractNum', cls._abstractNum_xml)
+        abstractNum.abstractNumId = abstractNum_id
+        abstractNum.name.val = name
+        return abstractNum
+
+    @property
+    def name_val(self):
+        """
+        The value of the ``w:val`` attribute of the ``<w:name>`` child, or
+        |None| if not present.
+        """
+        name = self.name
+        if name is None:
+            return None
+        return name.val
+
+    @classmethod
+    def _abstractNum_xml(cls):
+        num_fmts = ('decimal', 'lowerLetter', 'lowerRoman')
+        lvls_xml = ''.join(
+            '  <w:lvl w:ilvl="%d">\n'
+            '    <w:start w:val="1"/>\n'
+            '    <w:numFmt w:val="%s"/>\n'
+            '    <w:lvlText w:val="%%%d."/>\n'
+            '    <w:lvlJc w:val="left"/>\n'
+            '    <w:pPr>\n'
+            '      <w:ind w:left="%d" w:hanging="360"/>\n'
+            '    </w:pPr>\n'
+            '  </w:lvl>\n' % (ilvl, num_fmts[ilvl % 3], ilvl+1, 720*(ilvl+1))
+            for ilvl in range(9)
+        )
+        return (
+            '<w:abstractNum %s w:abstractNumId="0">\n'
+            '  <w:multiLevelType w:val="hybridMultilevel"/>\n'
+            '  <w:name w:val=""/>\n'
+            '%s'
+            '</w:abstractNum>' % (nsdecls('w'), lvls_xml)
+        )
+
+
 class CT_Num(BaseOxmlElement):
     """
     ``<w:num>`` element, which represents a concrete list definition
@@ -20,7 +82,7 @@ class CT_Num(BaseOxmlElement):
     """
     abstractNumId = OneAndOnlyOne('w:abstractNumId')
     lvlOverride = ZeroOrMore('w:lvlOverride')
-    numId = RequiredAttribute('w:numId', ST_DecimalNumber)
+    _numId = RequiredAttribute('w:numId', ST_DecimalNumber)
 
     def add_lvlOverride(self, ilvl):
         """
@@ -44,6 +106,20 @@ class CT_Num(BaseOxmlElement):
         num.append(abstractNumId)
         return num
 
+    @property
+    def numId(self):
+        """
+        Value of the required ``w:numId`` attribute.
+        """
+        return self._numId
+
+    @numId.setter
+    def numId(self, value):
+        self._numId = value
+        numbering = self.getparent()
+        if isinstance(numbering, CT_Numbering):
+            numbering.reset_caches()
+
 
 class CT_NumLvl(BaseOxmlElement):
     """
@@ -94,27 +170,124 @@ class CT_Numbering(BaseOxmlElement):
     ``<w:numbering>`` element, the root element of a numbering part, i.e.
     numbering.xml
     """
+    abstractNum = ZeroOrMore(
+        'w:abstractNum', successors=('w:num', 'w:numIdMacAtCleanup')
+    )
     num = ZeroOrMore('w:num', successors=('w:numIdMacAtCleanup',))
 
+    def abstractNum_having_name(self, name):
+        """
+        Return the first ``<w:abstractNum>`` child element having
+        ``w:name/@w:val`` matching *name*, or |None| if not found.
+        """
+        abstractNum = self._numbering_index['abstractNum_by_name'].get(name)
+        if abstractNum is None or abstractNum.name_val == name:
+            return abstractNum
+        self.reset_caches()
+        return self._numbering_index['abstractNum_by_name'].get(name)
+
+    def add_abstractNum(self, name):
+        """
+        Return a newly added CT_AbstractNum (<w:abstractNum>) element named
+        *name*, defining a numbered list and having the first unused
+        ``abstractNumId``.
+        """
+        abstractNum = CT_AbstractNum.new(self._next_abstractNumId, name)
+        self._insert_abstractNum(abstractNum)
+        index = self._numbering_index
+        index['abstractNum_by_name'].setdefault(name, abstractNum)
+        index['abstractNumIds'].add(abstractNum.abstractNumId)
+        index['child_count'] += 1
+        return abstractNum
+
     def add_num(self, abstractNum_id):
         """
         Return a newly added CT_Num (<w:num>) element referencing the
         abstract numbering definition identified by *abstractNum_id*.
         """
         next_num_id = self._next_numId
-        num = CT_Num.new(next_num_id, abstractNum_id)
-        return self._insert_num(num)
+        num = self._insert_num(CT_Num.new(next_num_id, abstractNum_id))
+        index = self._numbering_index
+        index['num_by_numId'].setdefault(next_num_id, num)
+        index['num_by_abstractNumId'].setdefault(abstractNum_id, num)
+        index['last_num_by_abstractNumId'][abstractNum_id] = num
+        index['child_count'] += 1
+        return num
+
+    def add_restarted_num(self, numId, ilvls):
+        """
+        Return a newly added CT_Num (<w:num>) element referencing the same
+        abstract numbering definition as the ``<w:num>`` having *numId*, and
+        overriding the start of each level in *ilvls* so numbering starts
+        again at 1. Raises |KeyError| if there is no such ``<w:num>``.
+        """
+        abstractNum_id = self.num_having_numId(numId).abstractNumId.val
+        num = self.add_num(abstractNum_id)
+        for ilvl in ilvls:
+            num.add_lvlOverride(ilvl).add_startOverride(1)
+        return num
+
+    def last_num_referencing(self, abstractNum_id):
+        """
+        Return the last ``<w:num>`` child element referencing the abstract
+        numbering definition identified by *abstractNum_id*, or |None| if
+        there is none.
+        """
+        index = self._numbering_index
+        num = index['last_num_by_abstractNumId'].get(abstractNum_id)
+        if num is None or num.abstractNumId.val == abstractNum_id:
+            return num
+        self.reset_caches()
+        return self._numbering_index['last_num_by_abstractNumId'].get(
+            abstractNum_id
+        )
 
     def num_having_numId(self, numId):
         """
         Return the ``<w:num>`` child element having ``numId`` attribute
         matching *numId*.
         """
-        xpath = './w:num[@w:numId="%d"]' % numId
-        try:
-            return self.xpath(xpath)[0]
-        except IndexError:
+        num = self._numbering_index['num_by_numId'].get(numId)
+        if num is None:
             raise KeyError('no <w:num> element with numId %d' % numId)
+        return num
+
+    def num_referencing(self, abstractNum_id):
+        """
+        Return the first ``<w:num>`` child element referencing the abstract
+        numbering definition identified by *abstractNum_id*, or |None| if
+        there is none.
+        """
+        index = self._numbering_index
+        num = index['num_by_abstractNumId'].get(abstractNum_id)
+        if num is None or num.abstractNumId.val == abstractNum_id:
+            return num
+        self.reset_caches()
+        return self._numbering_index['num_by_abstractNumId'].get(
+            abstractNum_id
+        )
+
+    def reset_caches(self):
+        """
+        Discard the numbering index cached on this element, causing it to be
+        rebuilt on next use. Called when the numId of a child ``<w:num>`` is
+        set.
+        """
+        self._numbering_index_cache = None
+
+    @property
+    def _next_abstractNumId(self):
+        """
+        The first ``abstractNumId`` unused by a ``<w:abstractNum>`` element,
+        starting at 0.
+        """
+        index = self._numbering_index
+        abstractNumIds = index['abstractNumIds']
+        abstractNum_id = index['next_abstractNumId']
+        while abstractNum_id in abstractNumIds:
+            abstractNum_id += 1
+        index['next_abstractNumId'] = abstractNum_id
+        return abstractNum_id
 
     @property
     def _next_numId(self):
@@ -123,9 +296,52 @@ class CT_Numbering(BaseOxmlElement):
         1 and filling any gaps in numbering between existing ``<w:num>``
         elements.
         """
-        numId_strs = self.xpath('./w:num/@w:numId')
-        num_ids = [int(numId_str) for numId_str in numId_strs]
-        for num in range(1, len(num_ids)+2):
-            if num not in num_ids:
-                break
-        return num
+        index = self._numbering_index
+        num_by_numId = index['num_by_numId']
+        num_id = index['next_numId']
+        while num_id in num_by_numId:
+            num_id += 1
+        index['next_numId'] = num_id
+        return num_id
+
+    @property
+    def _numbering_index(self):
+        """
+        A dict of the lookups used to find numbering definitions in this
+        element without searching it. 'num_by_numId',
+        'num_by_abstractNumId' and 'abstractNum_by_name' map a key to the
+        first child having it, in document order,
+        'last_num_by_abstractNumId' maps a key to the last such child, and
+        'abstractNumIds' is
+        the set of abstractNumId values in use. 'next_numId' and
+        'next_abstractNumId' hold the lowest id that may be unused, so
+        allocating ids in sequence does not rescan the ids already used.
+        Built on first access and cached on this element. It is rebuilt when
+        the number of children changes other than through this element's
+        methods, when the numId of a child ``<w:num>`` is set, and when an
+        entry found by name or abstractNumId turns out to be stale. A key
+        not in the index is a miss and does not cause a rebuild.
+        """
+        index = getattr(self, '_numbering_index_cache', None)
+        if index is None or index['child_count'] != len(self):
+            num_by_numId, num_by_abstractNumId = {}, {}
+            last_num_by_abstractNumId = {}
+            abstractNum_by_name, abstractNumIds = {}, set()
+            for abstractNum in self.abstractNum_lst:
+                abstractNumIds.add(abstractNum.abstractNumId)
+                abstractNum_by_name.setdefault(abstractNum.name_val, abstractNum)
+            for num in self.num_lst:
+                num_by_numId.setdefault(num.numId, num)
+                num_by_abstractNumId.setdefault(num.abstractNumId.val, num)
+                last_num_by_abstractNumId[num.abstractNumId.val] = num
+            index = self._numbering_index_cache = {
+                'abstractNumIds': abstractNumIds,
+                'abstractNum_by_name': abstractNum_by_name,
+                'child_count': len(self),
+                'last_num_by_abstractNumId': last_num_by_abstractNumId,
+                'next_abstractNumId': 0,
+                'next_numId': 1,
+                'num_by_abstractNumId': num_by_abstractNumId,
+                'num_by_numId': num_by_numId,
+            }
+        return index
@@ -7,13 +7,16 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 from copy import deepcopy
 
 from docx.enum.section import WD_HEADER_FOOTER, WD_ORIENTATION, WD_SECTION_START
+from docx.oxml.document import CT_Document
 from docx.oxml.simpletypes import ST_SignedTwipsMeasure, ST_TwipsMeasure, XsdString
+from docx.oxml.ns import qn
 from docx.oxml.xmlchemy import (
     BaseOxmlElement,
     OptionalAttribute,
     RequiredAttribute,
     ZeroOrMore,
     ZeroOrOne,
+    note_content_change,
 )
 
 
@@ -136,10 +139,20 @@ class CT_SectPr(BaseOxmlElement):
         pgMar = self.get_or_add_pgMar()
         pgMar.footer = value
 
+    @property
+    def first_sectPr(self):
+        """The first sectPr in the document, which is this one if it is the first."""
+        document = self.getroottree().getroot()
+        if isinstance(document, CT_Document):
+            return document.sectPr_lst[0]
+        sectPrs = document.xpath(".//w:sectPr")
+        return sectPrs[0] if sectPrs else self
+
     def get_footerReference(self, type_):
         """Return footerReference element of *type_* or None if not present."""
-        path = "./w:footerReference[@w:type='%s']" % WD_HEADER_FOOTER.to_xml(type_)
-        footerReferences = self.xpath(path)
+        footerReferences = self.xpath(
+            "./w:footerReference[@w:type=$type]", type=WD_HEADER_FOOTER.to_xml(type_)
+        )
         if not footerReferences:
             return None
         return footerReferences[0]
@@ -147,7 +160,7 @@ class CT_SectPr(BaseOxmlElement):
     def get_headerReference(self, type_):
         """Return headerReference element of *type_* or None if not present."""
         matching_headerReferences = self.xpath(
-            "./w:headerReference[@w:type='%s']" % WD_HEADER_FOOTER.to_xml(type_)
+            "./w:headerReference[@w:type=$type]", type=WD_HEADER_FOOTER.to_xml(type_)
         )
         if len(matching_headerReferences) == 0:
             return None
@@ -187,6 +200,16 @@ class CT_SectPr(BaseOxmlElement):
         pgMar = self.get_or_add_pgMar()
         pgMar.header = value
 
+    @property
+    def hdrftr_rIds(self):
+        """Dict mapping (reference tag, type) to rId of each header/footer reference.
+
+        The reference tag is the Clark name of the `w:headerReference` or
+        `w:footerReference` child and the type is a member of WD_HEADER_FOOTER.
+        """
+        references = self.iterchildren(qn("w:headerReference"), qn("w:footerReference"))
+        return dict(((ref.tag, ref.type_), ref.rId) for ref in references)
+
     @property
     def left_margin(self):
         """
@@ -253,18 +276,44 @@ class CT_SectPr(BaseOxmlElement):
         pgSz = self.get_or_add_pgSz()
         pgSz.w = value
 
+    def prior_hdrftr_rId(self, reference_tag, type_):
+        """Return rId of header or footer this section inherits from a prior section.
+
+        *reference_tag* is "w:headerReference" or "w:footerReference". The rId is that
+        of the *type_* reference in the closest prior section having one, or None if no
+        prior section has one.
+        """
+        key = (qn(reference_tag), type_)
+        document = self.getroottree().getroot()
+        if isinstance(document, CT_Document):
+            idx = document.sectPr_idx(self)
+            return document.hdrftr_rIds[idx - 1].get(key) if idx > 0 else None
+        sectPr = self.preceding_sectPr
+        while sectPr is not None:
+            rId = sectPr.hdrftr_rIds.get(key)
+            if rId is not None:
+                return rId
+            sectPr = sectPr.preceding_sectPr
+        return None
+
     @property
     def preceding_sectPr(self):
         """sectPr immediately preceding this one or None if this is the first."""
-        # ---[1] predicate returns list of zero or one value---
-        preceding_sectPrs = self.xpath("./preceding::w:sectPr[1]")
-        return preceding_sectPrs[0] if len(preceding_sectPrs) > 0 else None
+        document = self.getroottree().getroot()
+        if not isinstance(document, CT_Document):
+            # ---[1] predicate returns list of zero or one value---
+            preceding_sectPrs = self.xpath("./preceding::w:sectPr[1]")
+            return preceding_sectPrs[0] if len(preceding_sectPrs) > 0 else None
+        # ---use the document's section index rather than searching---
+        idx = document.sectPr_idx(self)
+        return document.sectPr_lst[idx - 1] if idx > 0 else None
 
     def remove_footerReference(self, type_):
         """Return rId of w:footerReference child of *type_* after removing it."""
         footerReference = self.get_footerReference(type_)
         rId = footerReference.rId
         self.remove(footerReference)
+        note_content_change(self, footerReference)
         return rId
 
     def remove_headerReference(self, type_):
@@ -272,6 +321,7 @@ class CT_SectPr(BaseOxmlElement):
         headerReference = self.get_headerReference(type_)
         rId = headerReference.rId
         self.remove(headerReference)
+        note_content_change(self, headerReference)
         return rId
 
     @property
@@ -4,8 +4,8 @@
 Custom element classes for shape-related elements like ``<w:inline>``
 """
 
-from . import parse_xml
-from .ns import nsdecls
+from . import clone_prototype
+from .ns import nsdecls, nsmap
 from .simpletypes import (
     ST_Coordinate, ST_DrawingElementId, ST_PositiveCoordinate,
     ST_RelationshipId, XsdString, XsdToken
@@ -61,16 +61,13 @@ class CT_Inline(BaseOxmlElement):
     def new(cls, cx, cy, shape_id, pic):
         """
         Return a new ``<wp:inline>`` element populated with the values passed
-        as parameters.
+        as parameters. The element is a copy of a prototype parsed once.
         """
-        inline = parse_xml(cls._inline_xml())
+        inline = clone_prototype('wp:inline', cls._inline_xml)
         inline.extent.cx = cx
         inline.extent.cy = cy
         inline.docPr.id = shape_id
         inline.docPr.name = 'Picture %d' % shape_id
-        inline.graphic.graphicData.uri = (
-            'http://schemas.openxmlformats.org/drawingml/2006/picture'
-        )
         inline.graphic.graphicData._insert_pic(pic)
         return inline
 
@@ -96,9 +93,9 @@ class CT_Inline(BaseOxmlElement):
             '    <a:graphicFrameLocks noChangeAspect="1"/>\n'
             '  </wp:cNvGraphicFramePr>\n'
             '  <a:graphic>\n'
-            '    <a:graphicData uri="URI not set"/>\n'
+            '    <a:graphicData uri="%s"/>\n'
             '  </a:graphic>\n'
-            '</wp:inline>' % nsdecls('wp', 'a', 'pic', 'r')
+            '</wp:inline>' % (nsdecls('wp', 'a', 'pic', 'r'), nsmap['pic'])
         )
 
 
@@ -131,9 +128,10 @@ class CT_Picture(BaseOxmlElement):
         """
         Return a new ``<pic:pic>`` element populated with the minimal
         contents required to define a viable picture element, based on the
-        values passed as parameters.
+        values passed as parameters. The element is a copy of a prototype
+        parsed once.
         """
-        pic = parse_xml(cls._pic_xml())
+        pic = clone_prototype('pic:pic', cls._pic_xml)
         pic.nvPicPr.cNvPr.id = pic_id
         pic.nvPicPr.cNvPr.name = filename
         pic.blipFill.blip.embed = rId
@@ -4,7 +4,13 @@
 Custom element classes related to the styles part
 """
 
+from copy import deepcopy
+
+from lxml import etree
+
+from . import OxmlElement
 from ..enum.style import WD_STYLE_TYPE
+from .ns import qn
 from .simpletypes import ST_DecimalNumber, ST_OnOff, ST_String
 from .xmlchemy import (
     BaseOxmlElement, OptionalAttribute, RequiredAttribute, ZeroOrMore,
@@ -12,6 +18,23 @@ from .xmlchemy import (
 )
 
 
+def styles_of_format(element):
+    """
+    Return the `w:styles` element whose resolved formatting depends on the
+    formatting of *element*, or |None| if it has none. *element* is the
+    element of a formatting proxy such as |Font|; a `w:style`,
+    `w:pPrDefault` or `w:rPrDefault` element, or an element within their
+    properties, such as a `w:tab`, belongs to the styles. Any other element,
+    such as the `w:r` element of a run in the document body, is recognized
+    without searching its ancestors.
+    """
+    while element is not None and element.tag in _prop_container_tags:
+        element = element.getparent()
+    if not isinstance(element, (CT_PPrDefault, CT_RPrDefault, CT_Style)):
+        return None
+    return next(element.iterancestors(_W_STYLES), None)
+
+
 def styleId_from_name(name):
     """
     Return the style id corresponding to *name*, taking into account
@@ -46,6 +69,30 @@ class CT_LatentStyles(BaseOxmlElement):
     defUIPriority = OptionalAttribute('w:defUIPriority', ST_DecimalNumber)
     defUnhideWhenUsed = OptionalAttribute('w:defUnhideWhenUsed', ST_OnOff)
 
+    def add_lsdException(self):
+        """
+        Return a newly added `w:lsdException` element, discarding the name
+        index so it is rebuilt to include it.
+        """
+        lsdException = self._add_lsdException()
+        self.reset_caches()
+        return lsdException
+
+    def add_lsdException_named(self, name):
+        """
+        Return a newly added `w:lsdException` element having *name*, adding
+        it to the name index when that index is built.
+        """
+        lsdException = self._new_lsdException()
+        lsdException.name = name
+        self._insert_lsdException(lsdException)
+        owner = self._index_owner
+        index = getattr(owner, '_lsdException_index_cache', None)
+        if index is not None and index[0] == len(self) - 1:
+            index[1].setdefault(name, lsdException)
+            owner._lsdException_index_cache = (len(self), index[1])
+        return lsdException
+
     def bool_prop(self, attr_name):
         """
         Return the boolean value of the attribute having *attr_name*, or
@@ -58,13 +105,17 @@ class CT_LatentStyles(BaseOxmlElement):
 
     def get_by_name(self, name):
         """
-        Return the `w:lsdException` child having *name*, or |None| if not
-        found.
+        Return the first `w:lsdException` child having *name*, or |None| if
+        not found.
         """
-        found = self.xpath('w:lsdException[@w:name="%s"]' % name)
-        if not found:
-            return None
-        return found[0]
+        return self._lsdException_index.get(name)
+
+    def reset_caches(self):
+        """
+        Discard the `w:lsdException` name index, causing it to be rebuilt on
+        next use. Called when a child is added, deleted or renamed.
+        """
+        self._index_owner._lsdException_index_cache = None
 
     def set_bool_prop(self, attr_name, value):
         """
@@ -72,6 +123,39 @@ class CT_LatentStyles(BaseOxmlElement):
         """
         setattr(self, attr_name, bool(value))
 
+    @property
+    def _index_owner(self):
+        """
+        The element the name index is cached on; the parent `w:styles`
+        element when there is one, since lxml discards the proxy for this
+        element as soon as no reference to it remains.
+        """
+        styles = self.getparent()
+        if isinstance(styles, CT_Styles):
+            return styles
+        return self
+
+    @property
+    def _lsdException_index(self):
+        """
+        Dict mapping each latent style name to the first `w:lsdException`
+        child having it, in document order, as an XPath lookup would. Cached
+        on |_index_owner| with the child count it was built for, and rebuilt
+        after a reset or when the number of children changes.
+        """
+        owner = self._index_owner
+        index = getattr(owner, '_lsdException_index_cache', None)
+        if index is None or index[0] != len(self):
+            lsdExceptions_by_name = {}
+            for lsdException in self.lsdException_lst:
+                lsdExceptions_by_name.setdefault(
+                    lsdException.get(qn('w:name')), lsdException
+                )
+            index = owner._lsdException_index_cache = (
+                len(self), lsdExceptions_by_name
+            )
+        return index[1]
+
 
 class CT_LsdException(BaseOxmlElement):
     """
@@ -79,7 +163,7 @@ class CT_LsdException(BaseOxmlElement):
     a named latent style.
     """
     locked = OptionalAttribute('w:locked', ST_OnOff)
-    name = RequiredAttribute('w:name', ST_String)
+    _name = RequiredAttribute('w:name', ST_String)
     qFormat = OptionalAttribute('w:qFormat', ST_OnOff)
     semiHidden = OptionalAttribute('w:semiHidden', ST_OnOff)
     uiPriority = OptionalAttribute('w:uiPriority', ST_DecimalNumber)
@@ -89,7 +173,23 @@ class CT_LsdException(BaseOxmlElement):
         """
         Remove this `w:lsdException` element from the XML document.
         """
-        self.getparent().remove(self)
+        latentStyles = self.getparent()
+        latentStyles.remove(self)
+        latentStyles.reset_caches()
+
+    @property
+    def name(self):
+        """
+        Value of `w:name` attribute.
+        """
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        self._name = value
+        latentStyles = self.getparent()
+        if isinstance(latentStyles, CT_LatentStyles):
+            latentStyles.reset_caches()
 
     def on_off_prop(self, attr_name):
         """
@@ -105,6 +205,22 @@ class CT_LsdException(BaseOxmlElement):
         setattr(self, attr_name, value)
 
 
+class CT_PPrDefault(BaseOxmlElement):
+    """
+    `w:pPrDefault` element, holding the default paragraph properties of the
+    document in its `w:pPr` child.
+    """
+    pPr = ZeroOrOne('w:pPr', successors=())
+
+
+class CT_RPrDefault(BaseOxmlElement):
+    """
+    `w:rPrDefault` element, holding the default run properties of the
+    document in its `w:rPr` child.
+    """
+    rPr = ZeroOrOne('w:rPr', successors=())
+
+
 class CT_Style(BaseOxmlElement):
     """
     A ``<w:style>`` element, representing a style definition
@@ -129,7 +245,7 @@ class CT_Style(BaseOxmlElement):
     del _tag_seq
 
     type = OptionalAttribute('w:type', WD_STYLE_TYPE)
-    styleId = OptionalAttribute('w:styleId', ST_String)
+    _styleId = OptionalAttribute('w:styleId', ST_String)
     default = OptionalAttribute('w:default', ST_OnOff)
     customStyle = OptionalAttribute('w:customStyle', ST_OnOff)
 
@@ -169,7 +285,9 @@ class CT_Style(BaseOxmlElement):
         """
         Remove this `w:style` element from its parent `w:styles` element.
         """
-        self.getparent().remove(self)
+        styles = self.getparent()
+        styles.remove(self)
+        styles.reset_caches()
 
     @property
     def locked_val(self):
@@ -204,6 +322,7 @@ class CT_Style(BaseOxmlElement):
         if value is not None:
             name = self._add_name()
             name.val = value
+        self._reset_styles_caches()
 
     @property
     def next_style(self):
@@ -234,6 +353,18 @@ class CT_Style(BaseOxmlElement):
         if bool(value):
             self._add_qFormat()
 
+    @property
+    def styleId(self):
+        """
+        Value of `w:styleId` attribute or |None| if not present.
+        """
+        return self._styleId
+
+    @styleId.setter
+    def styleId(self, value):
+        self._styleId = value
+        self._reset_styles_caches()
+
     @property
     def semiHidden_val(self):
         """
@@ -285,6 +416,16 @@ class CT_Style(BaseOxmlElement):
             unhideWhenUsed = self._add_unhideWhenUsed()
             unhideWhenUsed.val = value
 
+    def _reset_styles_caches(self):
+        """
+        Discard the lookups cached on the parent `w:styles` element, if any,
+        after a change to this style that can affect them, such as to the id
+        or name it is indexed under.
+        """
+        styles = self.getparent()
+        if isinstance(styles, CT_Styles):
+            styles.reset_caches()
+
 
 class CT_Styles(BaseOxmlElement):
     """
@@ -307,6 +448,7 @@ class CT_Styles(BaseOxmlElement):
         style.customStyle = None if builtin else True
         style.styleId = styleId_from_name(name)
         style.name_val = name
+        self.reset_caches()
         return style
 
     def default_for(self, style_type):
@@ -322,30 +464,254 @@ class CT_Styles(BaseOxmlElement):
         # spec calls for last default in document order
         return default_styles_for_type[-1]
 
+    def effective_p(self, p):
+        """
+        Return a new loose `w:p` element having a `w:pPr` child that holds
+        the effective paragraph properties of *p*. These combine, in
+        increasing order of precedence, the document defaults, the style of
+        the table containing *p*, the paragraph style of *p* with the styles
+        it is based on, and the properties applied directly to *p*. The
+        properties contributed by styles are resolved once for each
+        combination of styles and cached.
+        """
+        pStyle_id = p.style
+        tblStyle_id = self._tblStyle_id_of(p)
+        pPr = deepcopy(self._style_props(('w:pPr', pStyle_id, tblStyle_id)))
+        _merge_props(pPr, p.pPr)
+        effective_p = OxmlElement('w:p')
+        effective_p.append(pPr)
+        return effective_p
+
+    def effective_r(self, r):
+        """
+        Return a new loose `w:r` element having a `w:rPr` child that holds
+        the effective run properties of *r*. These combine, in increasing
+        order of precedence, the document defaults, the style of the table
+        containing *r*, the style of the paragraph containing *r*, the
+        character style of *r*, each with the styles it is based on, and the
+        properties applied directly to *r*. The properties contributed by
+        styles are resolved once for each combination of styles and cached.
+        """
+        p = next(r.iterancestors(qn('w:p')), None)
+        pStyle_id = None if p is None else p.style
+        tblStyle_id = self._tblStyle_id_of(r)
+        rStyle_id = r.style
+        rPr = deepcopy(self._style_props(
+            ('w:rPr', pStyle_id, tblStyle_id, rStyle_id)
+        ))
+        _merge_props(rPr, r.rPr)
+        effective_r = OxmlElement('w:r')
+        effective_r.append(rPr)
+        return effective_r
+
     def get_by_id(self, styleId):
         """
         Return the ``<w:style>`` child element having ``styleId`` attribute
         matching *styleId*, or |None| if not found.
         """
-        xpath = 'w:style[@w:styleId="%s"]' % styleId
-        try:
-            return self.xpath(xpath)[0]
-        except IndexError:
-            return None
+        return self._style_index[0].get(styleId)
 
     def get_by_name(self, name):
         """
         Return the ``<w:style>`` child element having ``<w:name>`` child
         element with value *name*, or |None| if not found.
         """
-        xpath = 'w:style[w:name/@w:val="%s"]' % name
-        try:
-            return self.xpath(xpath)[0]
-        except IndexError:
+        return self._style_index[1].get(name)
+
+    def numId_of(self, style_id):
+        """
+        Return the numId of the numbering definition applied by the paragraph
+        style identified by *style_id*, including one inherited from the
+        styles it is based on, or |None| if the style applies no numbering.
+        The default paragraph style is used when *style_id* is |None| or
+        does not identify a paragraph style.
+        """
+        pPr = self._style_props(('w:pPr', style_id, None))
+        numId = pPr.find('%s/%s' % (qn('w:numPr'), qn('w:numId')))
+        if numId is None or not numId.val:
             return None
+        return numId.val
+
+    def reset_caches(self):
+        """
+        Discard the style-id and style-name index and the resolved style
+        properties cached on this element, causing them to be rebuilt on
+        next use. Called when a style is added, removed, or changed.
+        """
+        self._style_index_cache = None
+        self._style_props_cache = None
 
     def _iter_styles(self):
         """
         Generate each of the `w:style` child elements in document order.
         """
         return (style for style in self.xpath('w:style'))
+
+    def _resolve_style_props(self, key):
+        """
+        Return a new `w:pPr` or `w:rPr` element containing the properties
+        contributed by the document defaults and the styles identified in
+        *key*, a (tagname, pStyle_id, tblStyle_id[, rStyle_id]) tuple. The
+        table style layer is omitted when *tblStyle_id* is |None|, meaning
+        the element is not in a table. Within each of the table, paragraph
+        and character layers a style overrides the styles it is based on.
+        Toggle properties like `w:b` set by more than one layer are combined
+        by exclusive-or, as ECMA-376 §17.7.3 specifies, so an italic
+        character style in an italic paragraph style gives upright text.
+        """
+        tagname, pStyle_id, tblStyle_id = key[:3]
+        props = OxmlElement(tagname)
+        default_path = 'w:docDefaults/%sDefault/%s' % (tagname, tagname)
+        _merge_props(props, self.find(
+            '/'.join(qn(nsptag) for nsptag in default_path.split('/'))
+        ))
+        styles = [(pStyle_id, WD_STYLE_TYPE.PARAGRAPH)]
+        if tblStyle_id is not None:
+            styles.insert(0, (tblStyle_id, WD_STYLE_TYPE.TABLE))
+        if tagname == 'w:rPr':
+            styles.append((key[3], WD_STYLE_TYPE.CHARACTER))
+        toggled = set()
+        for style_id, style_type in styles:
+            level_props = OxmlElement(tagname)
+            for style in self._style_chain(style_id, style_type):
+                _merge_props(level_props, style.find(qn(tagname)))
+            _merge_props(props, level_props, toggled)
+        return props
+
+    def _style_chain(self, style_id, style_type):
+        """
+        Return a list containing the style of *style_type* identified by
+        *style_id* preceded by each of the styles it is based on, base-most
+        first. The default style for *style_type* is used when *style_id* is
+        |None| or does not identify a style of that type.
+        """
+        style = None if style_id is None else self.get_by_id(style_id)
+        if style is None or style.type != style_type:
+            style = self.default_for(style_type)
+        chain = []
+        while style is not None and style not in chain:
+            chain.insert(0, style)
+            style = style.base_style
+        return chain
+
+    @property
+    def _style_index(self):
+        """
+        A (styles_by_id, styles_by_name) pair of dicts mapping each style id
+        and style name to the first `w:style` child having it, in document
+        order, as an XPath lookup would. Built on first access after a reset
+        and cached on this element. Reset when a style is added or deleted
+        and when the id or name of a child style is set.
+        """
+        style_index = getattr(self, '_style_index_cache', None)
+        if style_index is None:
+            styles_by_id, styles_by_name = {}, {}
+            for style in self.style_lst:
+                styles_by_id.setdefault(style.styleId, style)
+                styles_by_name.setdefault(style.name_val, style)
+            style_index = self._style_index_cache = (
+                styles_by_id, styles_by_name
+            )
+        return style_index
+
+    def _style_props(self, key):
+        """
+        The cached `w:pPr` or `w:rPr` element holding the properties
+        contributed by the document defaults and styles identified in *key*.
+        Callers must not modify the returned element.
+        """
+        cache = getattr(self, '_style_props_cache', None)
+        if cache is None:
+            cache = self._style_props_cache = {}
+        props = cache.get(key)
+        if props is None:
+            props = cache[key] = self._resolve_style_props(key)
+        return props
+
+    @staticmethod
+    def _tblStyle_id_of(element):
+        """
+        The style id applied to the innermost table containing *element*,
+        the empty string if that table has no style, so the default table
+        style applies, or |None| if *element* is not in a table.
+        """
+        tbl = next(element.iterancestors(qn('w:tbl')), None)
+        if tbl is None:
+            return None
+        tblStyle_val = tbl.tblStyle_val
+        return '' if tblStyle_val is None else tblStyle_val
+
+
+_W_STYLES = qn('w:styles')
+_prop_container_tags = frozenset(
+    qn(nsptag) for nsptag in ('w:pPr', 'w:rPr', 'w:tab', 'w:tabs')
+)
+_attr_merged_tags = frozenset(
+    qn(nsptag) for nsptag in ('w:ind', 'w:lang', 'w:rFonts', 'w:spacing')
+)
+_toggle_tags = frozenset(
+    qn(nsptag) for nsptag in (
+        'w:b', 'w:bCs', 'w:caps', 'w:dstrike', 'w:emboss', 'w:i', 'w:iCs',
+        'w:imprint', 'w:outline', 'w:shadow', 'w:smallCaps', 'w:strike',
+        'w:vanish',
+    )
+)
+_unmerged_tags = frozenset(
+    qn(nsptag) for nsptag in (
+        'w:pPrChange', 'w:pStyle', 'w:rPr', 'w:rPrChange', 'w:rStyle',
+        'w:sectPr',
+    )
+)
+
+
+def _merge_props(props, overrides, toggled=None):
+    """
+    Apply each property child of *overrides*, a `w:pPr` or `w:rPr` element
+    or |None|, to the like element *props*. An override replaces the same
+    property in *props*, except that the attributes of elements like
+    `w:rFonts` and `w:spacing` are applied individually. Style references,
+    revisions, section properties and paragraph-mark run properties are not
+    applied.
+
+    *toggled*, when given, is the set of toggle property tags already applied
+    by a lower style layer and is updated in place. A toggle property in that
+    set is combined with the value in *props* by exclusive-or rather than
+    replacing it.
+    """
+    if overrides is None:
+        return
+    for child in overrides.iterchildren(etree.Element):
+        tag = child.tag
+        if tag in _unmerged_tags:
+            continue
+        prop = props.find(tag)
+        if toggled is not None and tag in _toggle_tags:
+            if tag in toggled:
+                child = deepcopy(child)
+                child.val = bool(prop.val) != bool(child.val)
+            toggled.add(tag)
+        if prop is None:
+            _insert_prop(props, deepcopy(child))
+        elif tag in _attr_merged_tags:
+            if tag == qn('w:ind') and (
+                child.firstLine is not None or child.hanging is not None
+            ):
+                prop.firstLine = prop.hanging = None
+            for name, value in child.attrib.items():
+                prop.set(name, value)
+        else:
+            props.replace(prop, deepcopy(child))
+
+
+def _insert_prop(props, prop):
+    """
+    Insert *prop* into *props* in schema sequence, using the inserter the
+    properties element class provides for that child when there is one and
+    appending it otherwise.
+    """
+    local_name = etree.QName(prop).localname
+    insert = getattr(props, '_insert_%s' % local_name, None)
+    if insert is None:
+        props.append(prop)
+    else:
+        insert(prop)
@@ -6,7 +6,9 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
-from . import parse_xml
+from copy import deepcopy
+
+from . import clone_prototype
 from ..enum.table import WD_CELL_VERTICAL_ALIGNMENT, WD_ROW_HEIGHT_RULE
 from ..exceptions import InvalidSpanError
 from .ns import nsdecls, qn
@@ -16,9 +18,12 @@ from .simpletypes import (
 )
 from .xmlchemy import (
     BaseOxmlElement, OneAndOnlyOne, OneOrMore, OptionalAttribute,
-    RequiredAttribute, ZeroOrOne, ZeroOrMore
+    RequiredAttribute, ZeroOrOne, ZeroOrMore, note_content_change
 )
 
+_BLOCK_ITEM_TAGS = (qn('w:p'), qn('w:tbl'), qn('w:sdt'))
+_W_P = qn('w:p')
+
 
 class CT_Height(BaseOxmlElement):
     """
@@ -112,6 +117,26 @@ class CT_Tbl(BaseOxmlElement):
     tblGrid = OneAndOnlyOne('w:tblGrid')
     tr = ZeroOrMore('w:tr')
 
+    def add_gridCols(self, count, width):
+        """
+        Return a list of *count* new ``<w:gridCol>`` elements of *width*,
+        appended to the grid of this table, after adding a ``<w:tc>`` element
+        of *width* to the end of each row for each of them. Each new cell is
+        a copy of a single prototype cell.
+        """
+        tblGrid = self.tblGrid
+        gridCols = []
+        for _ in range(count):
+            gridCol = tblGrid.add_gridCol()
+            gridCol.w = width
+            gridCols.append(gridCol)
+        tc = CT_Tc.new()
+        tc.width = width
+        for tr in self.tr_lst:
+            for _ in range(count):
+                tr.append(deepcopy(tc))
+        return gridCols
+
     @property
     def bidiVisual_val(self):
         """
@@ -139,6 +164,78 @@ class CT_Tbl(BaseOxmlElement):
         """
         return len(self.tblGrid.gridCol_lst)
 
+    def delete_grid_cols(self, idxs):
+        """
+        Remove the grid columns at each of *idxs* in a single pass over the
+        rows of this table. A cell lying entirely within deleted columns is
+        removed; the span of a cell only partly within them is reduced, as
+        is its width when the widths of the deleted columns are known.
+        Raises |IndexError| if any of *idxs* is out of range and
+        |ValueError| if *idxs* includes every column, since a row must keep
+        at least one cell.
+        """
+        gridCols = self.tblGrid.gridCol_lst
+        deleted = self._normalized_idxs(idxs, len(gridCols), 'column')
+        if gridCols and len(deleted) == len(gridCols):
+            raise ValueError('cannot delete every column of a table')
+        for tr in self.tr_lst:
+            grid_col = 0
+            for tc in tr.tc_lst:
+                span = tc.grid_span
+                deleted_cols = [
+                    idx for idx in range(grid_col, grid_col + span)
+                    if idx in deleted
+                ]
+                grid_col += span
+                if not deleted_cols:
+                    continue
+                if len(deleted_cols) == span:
+                    tr.remove(tc)
+                    continue
+                tc.grid_span = span - len(deleted_cols)
+                widths = [gridCols[idx].w for idx in deleted_cols]
+                if tc.width is None or None in widths:
+                    continue
+                width = tc.width - sum(widths)
+                if width > 0:
+                    tc.width = Emu(width)
+        tblGrid = self.tblGrid
+        for idx in deleted:
+            tblGrid.remove(gridCols[idx])
+        note_content_change(self)
+
+    def delete_trs(self, idxs):
+        """
+        Remove the ``<w:tr>`` elements at each of *idxs* in a single pass.
+        When the top cell of a vertical merge is removed, the first
+        remaining cell of that merge becomes its new top cell. Raises
+        |IndexError| if any of *idxs* is out of range and |ValueError| if
+        *idxs* includes every row, since a table must keep at least one row.
+        """
+        tr_lst = self.tr_lst
+        deleted = self._normalized_idxs(idxs, len(tr_lst), 'row')
+        if tr_lst and len(deleted) == len(tr_lst):
+            raise ValueError('cannot delete every row of a table')
+        orphaned_cols = set()
+        for tr_idx, tr in enumerate(tr_lst):
+            is_deleted = tr_idx in deleted
+            grid_col = 0
+            for tc in tr.tc_lst:
+                vMerge = tc.vMerge
+                if is_deleted:
+                    if vMerge == ST_Merge.RESTART:
+                        orphaned_cols.add(grid_col)
+                    elif vMerge is None:
+                        orphaned_cols.discard(grid_col)
+                elif grid_col in orphaned_cols:
+                    orphaned_cols.remove(grid_col)
+                    if vMerge == ST_Merge.CONTINUE:
+                        tc.vMerge = ST_Merge.RESTART
+                grid_col += tc.grid_span
+            if is_deleted:
+                self.remove(tr)
+        note_content_change(self)
+
     def iter_tcs(self):
         """
         Generate each of the `w:tc` elements in this table, left to right and
@@ -153,9 +250,23 @@ class CT_Tbl(BaseOxmlElement):
     def new_tbl(cls, rows, cols, width):
         """
         Return a new `w:tbl` element having *rows* rows and *cols* columns
-        with *width* distributed evenly between the columns.
+        with *width* distributed evenly between the columns. The table is
+        assembled from copies of prototype elements, each parsed once.
         """
-        return parse_xml(cls._tbl_xml(rows, cols, width))
+        col_width = Emu(width/cols) if cols > 0 else Emu(0)
+        tbl = clone_prototype('w:tbl', cls._tbl_xml)
+        tblGrid = tbl.tblGrid
+        for _ in range(cols):
+            tblGrid.add_gridCol().w = col_width
+        if rows > 0:
+            tc = CT_Tc.new()
+            tc.width = col_width
+            tr = tbl.add_tr()
+            for _ in range(cols):
+                tr.append(deepcopy(tc))
+            for _ in range(rows - 1):
+                tbl.append(deepcopy(tr))
+        return tbl
 
     @property
     def tblStyle_val(self):
@@ -180,9 +291,25 @@ class CT_Tbl(BaseOxmlElement):
             return
         tblPr._add_tblStyle().val = styleId
 
+    @staticmethod
+    def _normalized_idxs(idxs, count, item_name):
+        """
+        Return the set of non-negative indices corresponding to *idxs* in
+        a sequence of *count* items, where negative indices count from the
+        end as they do for a list. Raises |IndexError| if any of *idxs* is
+        out of range.
+        """
+        normalized = set()
+        for idx in idxs:
+            if not -count <= idx < count:
+                raise IndexError('%s index [%d] is out of range' % (
+                    item_name, idx
+                ))
+            normalized.add(idx % count)
+        return normalized
+
     @classmethod
-    def _tbl_xml(cls, rows, cols, width):
-        col_width = Emu(width/cols) if cols > 0 else Emu(0)
+    def _tbl_xml(cls):
         return (
             '<w:tbl %s>\n'
             '  <w:tblPr>\n'
@@ -191,47 +318,9 @@ class CT_Tbl(BaseOxmlElement):
             '               w:lastColumn="0" w:lastRow="0" w:noHBand="0"\n'
             '               w:noVBand="1" w:val="04A0"/>\n'
             '  </w:tblPr>\n'
-            '%s'  # tblGrid
-            '%s'  # trs
+            '  <w:tblGrid/>\n'
             '</w:tbl>\n'
-        ) % (
-            nsdecls('w'),
-            cls._tblGrid_xml(cols, col_width),
-            cls._trs_xml(rows, cols, col_width)
-        )
-
-    @classmethod
-    def _tblGrid_xml(cls, col_count, col_width):
-        xml = '  <w:tblGrid>\n'
-        for i in range(col_count):
-            xml += '    <w:gridCol w:w="%d"/>\n' % col_width.twips
-        xml += '  </w:tblGrid>\n'
-        return xml
-
-    @classmethod
-    def _trs_xml(cls, row_count, col_count, col_width):
-        xml = ''
-        for i in range(row_count):
-            xml += (
-                '  <w:tr>\n'
-                '%s'
-                '  </w:tr>\n'
-            ) % cls._tcs_xml(col_count, col_width)
-        return xml
-
-    @classmethod
-    def _tcs_xml(cls, col_count, col_width):
-        xml = ''
-        for i in range(col_count):
-            xml += (
-                '    <w:tc>\n'
-                '      <w:tcPr>\n'
-                '        <w:tcW w:type="dxa" w:w="%d"/>\n'
-                '      </w:tcPr>\n'
-                '      <w:p/>\n'
-                '    </w:tc>\n'
-            ) % col_width.twips
-        return xml
+        ) % nsdecls('w')
 
 
 class CT_TblGrid(BaseOxmlElement):
@@ -400,6 +489,7 @@ class CT_Tc(BaseOxmlElement):
         if tcPr is not None:
             new_children.append(tcPr)
         self[:] = new_children
+        note_content_change(self)
 
     @property
     def grid_span(self):
@@ -422,9 +512,8 @@ class CT_Tc(BaseOxmlElement):
         Generate a reference to each of the block-level content elements in
         this cell, in the order they appear.
         """
-        block_item_tags = (qn('w:p'), qn('w:tbl'), qn('w:sdt'))
         for child in self:
-            if child.tag in block_item_tags:
+            if child.tag in _BLOCK_ITEM_TAGS:
                 yield child
 
     @property
@@ -449,13 +538,10 @@ class CT_Tc(BaseOxmlElement):
     def new(cls):
         """
         Return a new ``<w:tc>`` element, containing an empty paragraph as the
-        required EG_BlockLevelElt.
+        required EG_BlockLevelElt. The element is a copy of a prototype
+        parsed once.
         """
-        return parse_xml(
-            '<w:tc %s>\n'
-            '  <w:p/>\n'
-            '</w:tc>' % nsdecls('w')
-        )
+        return clone_prototype('w:tc', cls._tc_xml)
 
     @property
     def right(self):
@@ -467,6 +553,30 @@ class CT_Tc(BaseOxmlElement):
         """
         return self._grid_col + self.grid_span
 
+    def set_text(self, text, preserve_formatting=False):
+        """
+        Replace the content of this cell with a single paragraph containing
+        *text* in a single run. When *preserve_formatting* is |True|, the
+        ``<w:pPr>`` of the first paragraph and the ``<w:rPr>`` of the first
+        run in this cell are moved to the new paragraph and run.
+        """
+        pPr = rPr = None
+        if preserve_formatting:
+            p = self.find(qn('w:p'))
+            if p is not None:
+                pPr = p.pPr
+            r = self.find('%s/%s' % (qn('w:p'), qn('w:r')))
+            if r is not None:
+                rPr = r.rPr
+        self.clear_content()
+        p = self.add_p()
+        if pPr is not None:
+            p._insert_pPr(pPr)
+        r = p.add_r()
+        if rPr is not None:
+            r._insert_rPr(rPr)
+        r.text = text
+
     @property
     def top(self):
         """
@@ -581,6 +691,7 @@ class CT_Tc(BaseOxmlElement):
             other_tc.append(block_element)
         # add back the required minimum single empty <w:p> element
         self.append(self._new_p())
+        note_content_change(self)
 
     def _new_tbl(self):
         return CT_Tbl.new()
@@ -598,7 +709,9 @@ class CT_Tc(BaseOxmlElement):
         """
         Remove this `w:tc` element from the XML tree.
         """
-        self.getparent().remove(self)
+        tr = self.getparent()
+        tr.remove(self)
+        note_content_change(tr)
 
     def _remove_trailing_empty_p(self):
         """
@@ -607,7 +720,7 @@ class CT_Tc(BaseOxmlElement):
         """
         block_items = list(self.iter_block_items())
         last_content_elm = block_items[-1]
-        if last_content_elm.tag != qn('w:p'):
+        if last_content_elm.tag != _W_P:
             return
         p = last_content_elm
         if len(p.r_lst) > 0:
@@ -708,6 +821,14 @@ class CT_Tc(BaseOxmlElement):
             return None
         return tr_below.tc_at_grid_col(self._grid_col)
 
+    @classmethod
+    def _tc_xml(cls):
+        return (
+            '<w:tc %s>\n'
+            '  <w:p/>\n'
+            '</w:tc>' % nsdecls('w')
+        )
+
     @property
     def _tr(self):
         """
@@ -5,7 +5,11 @@ Custom element classes related to paragraphs (CT_P).
 """
 
 from ..ns import qn
-from ..xmlchemy import BaseOxmlElement, OxmlElement, ZeroOrMore, ZeroOrOne
+from ..xmlchemy import (
+    BaseOxmlElement, OxmlElement, ZeroOrMore, ZeroOrOne, note_content_change
+)
+
+_W_PPR = qn('w:pPr')
 
 
 class CT_P(BaseOxmlElement):
@@ -25,6 +29,7 @@ class CT_P(BaseOxmlElement):
         """
         new_p = OxmlElement('w:p')
         self.addprevious(new_p)
+        note_content_change(self, new_p)
         return new_p
 
     @property
@@ -47,10 +52,11 @@ class CT_P(BaseOxmlElement):
         """
         Remove all child elements, except the ``<w:pPr>`` element if present.
         """
-        for child in self[:]:
-            if child.tag == qn('w:pPr'):
-                continue
+        content_children = [child for child in self if child.tag != _W_PPR]
+        for child in content_children:
             self.remove(child)
+        if content_children:
+            note_content_change(self, *content_children)
 
     def set_sectPr(self, sectPr):
         """
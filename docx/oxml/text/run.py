@@ -7,9 +7,14 @@ Custom element classes related to text runs (CT_R).
 from ..ns import qn
 from ..simpletypes import ST_BrClear, ST_BrType
 from ..xmlchemy import (
-    BaseOxmlElement, OptionalAttribute, ZeroOrMore, ZeroOrOne
+    BaseOxmlElement, OptionalAttribute, ZeroOrMore, ZeroOrOne, note_content_change
 )
 
+_W_BR_CR = (qn('w:br'), qn('w:cr'))
+_W_DRAWING = qn('w:drawing')
+_W_T = qn('w:t')
+_W_TAB = qn('w:tab')
+
 
 class CT_Br(BaseOxmlElement):
     """
@@ -48,17 +53,22 @@ class CT_R(BaseOxmlElement):
         Return a newly appended ``CT_Drawing`` (``<w:drawing>``) child
         element having *inline_or_anchor* as its child.
         """
-        drawing = self._add_drawing()
+        drawing = self._new_drawing()
         drawing.append(inline_or_anchor)
-        return drawing
+        return self._insert_drawing(drawing)
 
     def clear_content(self):
         """
         Remove all child elements except the ``<w:rPr>`` element if present.
         """
         content_child_elms = self[1:] if self.rPr is not None else self[:]
+        drawing_removed = False
         for child in content_child_elms:
+            if child.tag == _W_DRAWING:
+                drawing_removed = True
             self.remove(child)
+        if drawing_removed:
+            note_content_change(self, *content_child_elms)
 
     @property
     def style(self):
@@ -89,12 +99,13 @@ class CT_R(BaseOxmlElement):
         """
         text = ''
         for child in self:
-            if child.tag == qn('w:t'):
+            tag = child.tag
+            if tag == _W_T:
                 t_text = child.text
                 text += t_text if t_text is not None else ''
-            elif child.tag == qn('w:tab'):
+            elif tag == _W_TAB:
                 text += '\t'
-            elif child.tag in (qn('w:br'), qn('w:cr')):
+            elif tag in _W_BR_CR:
                 text += '\n'
         return text
 
@@ -9,12 +9,13 @@ from __future__ import absolute_import
 
 from lxml import etree
 
+import itertools
 import re
 
 from docx.compat import Unicode
-from docx.oxml import OxmlElement
+from docx.oxml import OxmlElement, compiled_xpath
 from docx.oxml.exceptions import InvalidXmlError
-from docx.oxml.ns import NamespacePrefixedTag, nsmap, qn
+from docx.oxml.ns import NamespacePrefixedTag, qn
 from docx.shared import lazyproperty
 
 
@@ -114,6 +115,7 @@ class BaseAttribute(object):
         super(BaseAttribute, self).__init__()
         self._attr_name = attr_name
         self._simple_type = simple_type
+        self._clark_name = qn(attr_name) if ':' in attr_name else attr_name
 
     def populate_class_members(self, element_cls, prop_name):
         """
@@ -134,12 +136,6 @@ class BaseAttribute(object):
         # assign unconditionally to overwrite element name definition
         setattr(self._element_cls, self._prop_name, property_)
 
-    @property
-    def _clark_name(self):
-        if ':' in self._attr_name:
-            return qn(self._attr_name)
-        return self._attr_name
-
 
 class OptionalAttribute(BaseAttribute):
     """
@@ -157,11 +153,14 @@ class OptionalAttribute(BaseAttribute):
         Return a function object suitable for the "get" side of the attribute
         property descriptor.
         """
+        clark_name, default = self._clark_name, self._default
+        from_xml = self._simple_type.from_xml
+
         def get_attr_value(obj):
-            attr_str_value = obj.get(self._clark_name)
+            attr_str_value = obj.get(clark_name)
             if attr_str_value is None:
-                return self._default
-            return self._simple_type.from_xml(attr_str_value)
+                return default
+            return from_xml(attr_str_value)
         get_attr_value.__doc__ = self._docstring
         return get_attr_value
 
@@ -184,13 +183,16 @@ class OptionalAttribute(BaseAttribute):
         Return a function object suitable for the "set" side of the attribute
         property descriptor.
         """
+        clark_name, default = self._clark_name, self._default
+        to_xml = self._simple_type.to_xml
+
         def set_attr_value(obj, value):
-            if value is None or value == self._default:
-                if self._clark_name in obj.attrib:
-                    del obj.attrib[self._clark_name]
+            if value is None or value == default:
+                if clark_name in obj.attrib:
+                    del obj.attrib[clark_name]
                 return
-            str_value = self._simple_type.to_xml(value)
-            obj.set(self._clark_name, str_value)
+            str_value = to_xml(value)
+            obj.set(clark_name, str_value)
         return set_attr_value
 
 
@@ -209,14 +211,17 @@ class RequiredAttribute(BaseAttribute):
         Return a function object suitable for the "get" side of the attribute
         property descriptor.
         """
+        clark_name = self._clark_name
+        from_xml = self._simple_type.from_xml
+
         def get_attr_value(obj):
-            attr_str_value = obj.get(self._clark_name)
+            attr_str_value = obj.get(clark_name)
             if attr_str_value is None:
                 raise InvalidXmlError(
                     "required '%s' attribute not present on element %s" %
                     (self._attr_name, obj.tag)
                 )
-            return self._simple_type.from_xml(attr_str_value)
+            return from_xml(attr_str_value)
         get_attr_value.__doc__ = self._docstring
         return get_attr_value
 
@@ -237,9 +242,12 @@ class RequiredAttribute(BaseAttribute):
         Return a function object suitable for the "set" side of the attribute
         property descriptor.
         """
+        clark_name = self._clark_name
+        to_xml = self._simple_type.to_xml
+
         def set_attr_value(obj, value):
-            str_value = self._simple_type.to_xml(value)
-            obj.set(self._clark_name, str_value)
+            str_value = to_xml(value)
+            obj.set(clark_name, str_value)
         return set_attr_value
 
 
@@ -251,6 +259,7 @@ class _BaseChildElement(object):
     def __init__(self, nsptagname, successors=()):
         super(_BaseChildElement, self).__init__()
         self._nsptagname = nsptagname
+        self._clark_name = qn(nsptagname)
         self._successors = successors
 
     def populate_class_members(self, element_cls, prop_name):
@@ -305,10 +314,14 @@ class _BaseChildElement(object):
     def _add_inserter(self):
         """
         Add an ``_insert_x()`` method to the element class for this child
-        element.
+        element. The Clark names of its successors are computed once, here,
+        so inserting finds its place in a single scan of the children.
         """
+        successor_tags = tuple(qn(tagname) for tagname in self._successors)
+
         def _insert_child(obj, child):
-            obj.insert_element_before(child, *self._successors)
+            obj._insert_before_first_of(child, successor_tags)
+            note_content_change(obj, child)
             return child
 
         _insert_child.__doc__ = (
@@ -371,8 +384,10 @@ class _BaseChildElement(object):
         descriptor. This default getter returns the child element with
         matching tag name or |None| if not present.
         """
+        clark_name = self._clark_name
+
         def get_child_element(obj):
-            return obj.find(qn(self._nsptagname))
+            return obj.find(clark_name)
         get_child_element.__doc__ = (
             '``<%s>`` child element or |None| if not present.'
             % self._nsptagname
@@ -389,8 +404,10 @@ class _BaseChildElement(object):
         Return a function object suitable for the "get" side of a list
         property descriptor.
         """
+        clark_name = self._clark_name
+
         def get_child_element_list(obj):
-            return obj.findall(qn(self._nsptagname))
+            return obj.findall(clark_name)
         get_child_element_list.__doc__ = (
             'A list containing each of the ``<%s>`` child elements, in the o'
             'rder they appear.' % self._nsptagname
@@ -507,8 +524,10 @@ class OneAndOnlyOne(_BaseChildElement):
         Return a function object suitable for the "get" side of the property
         descriptor.
         """
+        clark_name = self._clark_name
+
         def get_child_element(obj):
-            child = obj.find(qn(self._nsptagname))
+            child = obj.find(clark_name)
             if child is None:
                 raise InvalidXmlError(
                     "required ``<%s>`` child element not present" %
@@ -599,8 +618,14 @@ class ZeroOrOne(_BaseChildElement):
         Add a ``_remove_x()`` method to the element class for this child
         element.
         """
+        clark_name = self._clark_name
+
         def _remove_child(obj):
-            obj.remove_all(self._nsptagname)
+            children = obj.findall(clark_name)
+            for child in children:
+                obj.remove(child)
+            if children:
+                note_content_change(obj, *children)
         _remove_child.__doc__ = (
             'Remove all ``<%s>`` child elements.'
         ) % self._nsptagname
@@ -649,9 +674,14 @@ class ZeroOrOneChoice(_BaseChildElement):
         Add a ``_remove_eg_x()`` method to the element class for this choice
         group.
         """
+        member_tags = self._member_clark_names
+
         def _remove_choice_group(obj):
-            for tagname in self._member_nsptagnames:
-                obj.remove_all(tagname)
+            children = list(obj.iterchildren(*member_tags))
+            for child in children:
+                obj.remove(child)
+            if children:
+                note_content_change(obj, *children)
 
         _remove_choice_group.__doc__ = (
             'Remove the current choice group child element if present.'
@@ -666,8 +696,12 @@ class ZeroOrOneChoice(_BaseChildElement):
         Return a function object suitable for the "get" side of the property
         descriptor.
         """
+        member_tags = self._member_clark_names
+
         def get_group_member_element(obj):
-            return obj.first_child_found_in(*self._member_nsptagnames)
+            for child in obj.iterchildren(*member_tags):
+                return child
+            return None
         get_group_member_element.__doc__ = (
             'Return the child element belonging to this element group, or '
             '|None| if no member child is present.'
@@ -675,12 +709,12 @@ class ZeroOrOneChoice(_BaseChildElement):
         return get_group_member_element
 
     @lazyproperty
-    def _member_nsptagnames(self):
+    def _member_clark_names(self):
         """
-        Sequence of namespace-prefixed tagnames, one for each of the member
-        elements of this choice group.
+        Tuple of Clark-notation tag names, one for each of the member elements
+        of this choice group.
         """
-        return [choice.nsptagname for choice in self._choices]
+        return tuple(qn(choice.nsptagname) for choice in self._choices)
 
     @lazyproperty
     def _remove_choice_group_method_name(self):
@@ -714,11 +748,14 @@ class _OxmlElementBase(etree.ElementBase):
         return None
 
     def insert_element_before(self, elm, *tagnames):
-        successor = self.first_child_found_in(*tagnames)
-        if successor is not None:
-            successor.addprevious(elm)
-        else:
-            self.append(elm)
+        """
+        Return *elm* after inserting it before the first child having a tag
+        in *tagnames*, or appending it when there is no such child.
+        """
+        self._insert_before_first_of(
+            elm, tuple(qn(tagname) for tagname in tagnames)
+        )
+        note_content_change(self, elm)
         return elm
 
     def remove_all(self, *tagnames):
@@ -726,10 +763,14 @@ class _OxmlElementBase(etree.ElementBase):
         Remove all child elements whose tagname (e.g. 'a:p') appears in
         *tagnames*.
         """
+        removed = []
         for tagname in tagnames:
             matching = self.findall(qn(tagname))
             for child in matching:
                 self.remove(child)
+                removed.append(child)
+        if removed:
+            note_content_change(self, *removed)
 
     @property
     def xml(self):
@@ -740,14 +781,29 @@ class _OxmlElementBase(etree.ElementBase):
         """
         return serialize_for_reading(self)
 
-    def xpath(self, xpath_str):
+    def xpath(self, xpath_str, **variables):
         """
         Override of ``lxml`` _Element.xpath() method to provide standard Open
-        XML namespace mapping (``nsmap``) in centralized location.
+        XML namespace mapping (``nsmap``) in centralized location. The
+        expression is compiled once, by |compiled_xpath|, and each keyword
+        argument in *variables* is bound to the XPath variable of that name,
+        e.g. ``$name`` for *name*.
         """
-        return super(BaseOxmlElement, self).xpath(
-            xpath_str, namespaces=nsmap
-        )
+        return compiled_xpath(xpath_str)(self, **variables)
+
+    def _insert_before_first_of(self, elm, clark_names):
+        """
+        Return *elm* after inserting it before the first child, in document
+        order, whose tag is one of the Clark names in *clark_names*, or
+        appending it when there is no such child. The children are scanned
+        once, however many names are given.
+        """
+        if clark_names:
+            for successor in self.iterchildren(*clark_names):
+                successor.addprevious(elm)
+                return elm
+        self.append(elm)
+        return elm
 
     @property
     def _nsptag(self):
@@ -757,3 +813,76 @@ class _OxmlElementBase(etree.ElementBase):
 BaseOxmlElement = MetaOxmlElement(
     'BaseOxmlElement', (etree.ElementBase,), dict(_OxmlElementBase.__dict__)
 )
+
+
+_content_revisions = itertools.count(1)
+_W_SECTPR = qn('w:sectPr')
+
+
+def content_revision(element):
+    """
+    Return the current content revision of the XML document containing
+    *element*, a number that changes each time a child element is added to
+    or removed from an element of that document by a library method. The
+    ``_insert_x()``, ``_add_x()`` and ``_remove_x()`` methods generated for
+    each child element declaration call |note_content_change|, as do the
+    element methods that change children directly with lxml. A cache of
+    elements found by searching a document is valid while its content
+    revision is the same as when the search was done. Revision numbers are
+    unique across documents.
+    """
+    return _revision(element, '_content_revision')
+
+
+def note_content_change(element, *children):
+    """
+    Change the content revision of the XML document containing *element*,
+    invalidating caches of elements found by searching that document. Called
+    each time a child element is added to or removed from *element*, with
+    the added or removed elements as *children* when they are known. The
+    section revision changes as well when one of *children* is or contains
+    a ``<w:sectPr>`` element, or when *children* are not given. When a story
+    part has started allocating shape ids for the document, the next id is
+    advanced past any ``id`` attribute in *children*.
+    """
+    root = element.getroottree().getroot()
+    if not isinstance(root, BaseOxmlElement):
+        return
+    revision = root._content_revision = next(_content_revisions)
+    if not children or any(
+        next(child.iter(_W_SECTPR), None) is not None for child in children
+    ):
+        root._section_revision = revision
+    next_id = getattr(root, '_next_id', None)
+    if next_id is not None and children:
+        id_values = compiled_xpath('descendant-or-self::*/@id')
+        for child in children:
+            for id_str in id_values(child):
+                if id_str.isdigit() and int(id_str) >= next_id:
+                    next_id = int(id_str) + 1
+        root._next_id = next_id
+
+
+def section_revision(element):
+    """
+    Return the current section revision of the XML document containing
+    *element*, a number that changes only when a ``<w:sectPr>`` element is
+    added to or removed from that document, as noted by
+    |note_content_change|. A cache of the ``<w:sectPr>`` elements of
+    a document is valid while its section revision is the same.
+    """
+    return _revision(element, '_section_revision')
+
+
+def _revision(element, attr_name):
+    """
+    Return the revision stored as *attr_name* on the root of the XML
+    document containing *element*, first storing a new one if there is none.
+    """
+    root = element.getroottree().getroot()
+    revision = getattr(root, attr_name, None)
+    if revision is None:
+        revision = next(_content_revisions)
+        if isinstance(root, BaseOxmlElement):
+            setattr(root, attr_name, revision)
+    return revision
@@ -48,13 +48,24 @@ class Package(OpcPackage):
 
 
 class ImageParts(object):
-    """Collection of |ImagePart| objects corresponding to images in the package"""
+    """Collection of |ImagePart| objects corresponding to images in the package
+
+    Image parts are indexed by the digest of their blob so a matching part is found
+    without rescanning the collection. Each digest is computed at most once, and for
+    a part loaded from a file only when a lookup first needs it.
+    """
 
     def __init__(self):
         self._image_parts = []
+        self._image_part_set = set()
+        self._hash_name = 'sha1'
+        self._parts_by_digest = {}
+        self._indexed_count = 0
+        self._used_idxs = set()
+        self._next_free_idx = 1
 
     def __contains__(self, item):
-        return self._image_parts.__contains__(item)
+        return item in self._image_part_set
 
     def __iter__(self):
         return self._image_parts.__iter__()
@@ -64,6 +75,8 @@ class ImageParts(object):
 
     def append(self, item):
         self._image_parts.append(item)
+        self._image_part_set.add(item)
+        self._used_idxs.add(item.partname.idx)
 
     def get_or_add_image_part(self, image_descriptor):
         """Return |ImagePart| object containing image identified by *image_descriptor*.
@@ -72,11 +85,37 @@ class ImageParts(object):
         collection.
         """
         image = Image.from_file(image_descriptor)
-        matching_image_part = self._get_by_sha1(image.sha1)
+        return self.get_or_add_image_part_for(image)
+
+    def get_or_add_image_part_for(self, image):
+        """Return |ImagePart| object containing the bytes of the |Image| *image*.
+
+        The image-part is newly created if a part containing the same bytes is not
+        present in the collection.
+        """
+        matching_image_part = self._get_by_digest(image.digest(self.hash_name))
         if matching_image_part is not None:
             return matching_image_part
         return self._add_image_part(image)
 
+    @property
+    def hash_name(self):
+        """Name of the :mod:`hashlib` algorithm used to detect duplicate images.
+
+        Default is ``'sha1'``. A faster algorithm such as ``'blake2b'`` may be
+        assigned, where the Python version provides it. Assigning a new value
+        discards the digest index, which is rebuilt on the next lookup.
+        """
+        return self._hash_name
+
+    @hash_name.setter
+    def hash_name(self, value):
+        if value == self._hash_name:
+            return
+        self._hash_name = value
+        self._parts_by_digest = {}
+        self._indexed_count = 0
+
     def _add_image_part(self, image):
         """
         Return an |ImagePart| instance newly created from image and appended
@@ -87,15 +126,19 @@ class ImageParts(object):
         self.append(image_part)
         return image_part
 
-    def _get_by_sha1(self, sha1):
+    def _get_by_digest(self, digest):
         """
-        Return the image part in this collection having a SHA1 hash matching
-        *sha1*, or |None| if not found.
+        Return the first image part in this collection having a blob digest matching
+        *digest*, or |None| if not found. Parts appended since the last lookup are
+        added to the digest index first.
         """
-        for image_part in self._image_parts:
-            if image_part.sha1 == sha1:
-                return image_part
-        return None
+        parts_by_digest = self._parts_by_digest
+        image_parts = self._image_parts
+        hash_name = self._hash_name
+        for image_part in image_parts[self._indexed_count:]:
+            parts_by_digest.setdefault(image_part.digest(hash_name), image_part)
+        self._indexed_count = len(image_parts)
+        return parts_by_digest.get(digest)
 
     def _next_image_partname(self, ext):
         """
@@ -104,10 +147,11 @@ class ImageParts(object):
         partname is unique by number, without regard to the extension. *ext*
         does not include the leading period.
         """
-        def image_partname(n):
-            return PackURI('/word/media/image%d.%s' % (n, ext))
-        used_numbers = [image_part.partname.idx for image_part in self]
-        for n in range(1, len(self)+1):
-            if n not in used_numbers:
-                return image_partname(n)
-        return image_partname(len(self)+1)
+        # ---parts are never removed, so a number once used stays used and the
+        # ---search can resume from the last free number found
+        used_idxs = self._used_idxs
+        n = self._next_free_idx
+        while n in used_idxs:
+            n += 1
+        self._next_free_idx = n
+        return PackURI('/word/media/image%d.%s' % (n, ext))
@@ -14,6 +14,9 @@ from docx.parts.styles import StylesPart
 from docx.shape import InlineShapes
 from docx.shared import lazyproperty
 
+# name of the numbering definition added for a list whose style has none
+DEFAULT_LIST_NAME = 'Default Numbered List'
+
 
 class DocumentPart(BaseStoryPart):
     """Main document part of a WordprocessingML (WML) package, aka a .docx file.
@@ -55,6 +58,22 @@ class DocumentPart(BaseStoryPart):
         """Remove related header part identified by *rId*."""
         self.drop_rel(rId)
 
+    def effective_p(self, p):
+        """
+        Return a loose `w:p` element whose `w:pPr` child holds the effective
+        paragraph properties of *p*, as resolved against the styles part of
+        this document.
+        """
+        return self._styles_part.element.effective_p(p)
+
+    def effective_r(self, r):
+        """
+        Return a loose `w:r` element whose `w:rPr` child holds the effective
+        run properties of *r*, as resolved against the styles part of this
+        document.
+        """
+        return self._styles_part.element.effective_r(r)
+
     def footer_part(self, rId):
         """Return |FooterPart| related by *rId*."""
         return self.related_parts[rId]
@@ -89,6 +108,33 @@ class DocumentPart(BaseStoryPart):
         """
         return InlineShapes(self._element.body, self)
 
+    def list_numId(self, style_id, ilvls, restart):
+        """
+        Return the numId each paragraph in a new list having the paragraph
+        style identified by *style_id* should reference. This is the numId
+        of the numbering definition of that style or, when the style has
+        none, of a decimal numbering definition added to this document the
+        first time it is needed. When *restart* is |True|, a new `w:num`
+        element restarting that definition at each level in *ilvls* is added
+        and its numId returned. Otherwise the numId of the last `w:num`
+        element referencing the same abstract numbering definition is
+        returned, so the new list continues the previous one numbered from
+        that definition.
+        """
+        numbering = self.numbering_part.element
+        numId = self._styles_part.element.numId_of(style_id)
+        if numId is not None:
+            try:
+                numbering.num_having_numId(numId)
+            except KeyError:
+                numId = None
+        if numId is None:
+            numId = self._default_list_num(numbering).numId
+        if restart:
+            return numbering.add_restarted_num(numId, ilvls).numId
+        abstractNum_id = numbering.num_having_numId(numId).abstractNumId.val
+        return numbering.last_num_referencing(abstractNum_id).numId
+
     @lazyproperty
     def numbering_part(self):
         """
@@ -99,7 +145,7 @@ class DocumentPart(BaseStoryPart):
         try:
             return self.part_related_by(RT.NUMBERING)
         except KeyError:
-            numbering_part = NumberingPart.new()
+            numbering_part = NumberingPart.new(self.package)
             self.relate_to(numbering_part, RT.NUMBERING)
             return numbering_part
 
@@ -126,6 +172,21 @@ class DocumentPart(BaseStoryPart):
         """
         return self._styles_part.styles
 
+    @staticmethod
+    def _default_list_num(numbering):
+        """
+        Return the `w:num` element referencing the numbering definition used
+        for a list whose style has none, adding the definition and the `w:num`
+        element to *numbering* if not present.
+        """
+        abstractNum = numbering.abstractNum_having_name(DEFAULT_LIST_NAME)
+        if abstractNum is None:
+            abstractNum = numbering.add_abstractNum(DEFAULT_LIST_NAME)
+        num = numbering.num_referencing(abstractNum.abstractNumId)
+        if num is None:
+            num = numbering.add_num(abstractNum.abstractNumId)
+        return num
+
     @property
     def _settings_part(self):
         """
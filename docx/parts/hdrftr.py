@@ -7,7 +7,7 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 import os
 
 from docx.opc.constants import CONTENT_TYPE as CT
-from docx.oxml import parse_xml
+from docx.oxml import clone_prototype
 from docx.parts.story import BaseStoryPart
 
 
@@ -19,7 +19,7 @@ class FooterPart(BaseStoryPart):
         """Return newly created footer part."""
         partname = package.next_partname("/word/footer%d.xml")
         content_type = CT.WML_FOOTER
-        element = parse_xml(cls._default_footer_xml())
+        element = clone_prototype("default-footer.xml", cls._default_footer_xml)
         return cls(partname, content_type, element, package)
 
     @classmethod
@@ -41,7 +41,7 @@ class HeaderPart(BaseStoryPart):
         """Return newly created header part."""
         partname = package.next_partname("/word/header%d.xml")
         content_type = CT.WML_HEADER
-        element = parse_xml(cls._default_header_xml())
+        element = clone_prototype("default-header.xml", cls._default_header_xml)
         return cls(partname, content_type, element, package)
 
     @classmethod
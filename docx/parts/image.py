@@ -11,6 +11,7 @@ from __future__ import (
 import hashlib
 
 from docx.image.image import Image
+from docx.opc.blobstore import SpooledBlob, iter_blob, read_blob
 from docx.opc.part import Part
 from docx.shared import Emu, Inches
 
@@ -23,6 +24,18 @@ class ImagePart(Part):
     def __init__(self, partname, content_type, blob, image=None):
         super(ImagePart, self).__init__(partname, content_type, blob)
         self._image = image
+        self._digests = {}
+
+    @property
+    def blob(self):
+        """
+        Contents of this image part as a sequence of bytes. A part created
+        from an |Image| shares the bytes held by that image rather than
+        holding a copy.
+        """
+        if self._blob is None and self._image is not None:
+            return self._image.blob
+        return read_blob(self._blob)
 
     @property
     def default_cx(self):
@@ -46,6 +59,24 @@ class ImagePart(Part):
         height_in_emu = 914400 * px_height / horz_dpi
         return Emu(height_in_emu)
 
+    def digest(self, hash_name='sha1'):
+        """
+        Hex digest of the blob of this image part, computed with the
+        :mod:`hashlib` algorithm named by *hash_name*, e.g. ``'sha1'`` or
+        ``'blake2b'``. The digest for each algorithm is computed only once, and
+        not at all until it is first needed. The digest is taken from the
+        |Image| this part was created from, when there is one.
+        """
+        if self._image is not None:
+            return self._image.digest(hash_name)
+        digests = self._digests
+        if hash_name not in digests:
+            hash_ = hashlib.new(hash_name)
+            for chunk in iter_blob(self._blob):
+                hash_.update(chunk)
+            digests[hash_name] = hash_.hexdigest()
+        return digests[hash_name]
+
     @property
     def filename(self):
         """
@@ -65,7 +96,7 @@ class ImagePart(Part):
         Return an |ImagePart| instance newly created from *image* and
         assigned *partname*.
         """
-        return ImagePart(partname, image.content_type, image.blob, image)
+        return ImagePart(partname, image.content_type, None, image)
 
     @property
     def image(self):
@@ -79,11 +110,21 @@ class ImagePart(Part):
         Called by ``docx.opc.package.PartFactory`` to load an image part from
         a package being opened by ``Document(...)`` call.
         """
-        return cls(partname, content_type, blob)
+        return cls(partname, content_type, SpooledBlob.spool(blob))
+
+    def iter_blob_chunks(self):
+        """
+        Generate the contents of this image part as a sequence of
+        byte-strings, reading them in chunks from the image file or the
+        temporary file that holds them when they are not held in memory.
+        """
+        if self._blob is None and self._image is not None:
+            return self._image.iter_blob_chunks()
+        return iter_blob(self._blob)
 
     @property
     def sha1(self):
         """
         SHA1 hash digest of the blob of this image part.
         """
-        return hashlib.sha1(self._blob).hexdigest()
+        return self.digest('sha1')
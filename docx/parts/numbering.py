@@ -8,7 +8,10 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+from ..opc.constants import CONTENT_TYPE as CT
+from ..opc.packuri import PackURI
 from ..opc.part import XmlPart
+from ..oxml import OxmlElement
 from ..shared import lazyproperty
 
 
@@ -18,12 +21,15 @@ class NumberingPart(XmlPart):
     a document or glossary.
     """
     @classmethod
-    def new(cls):
+    def new(cls, package):
         """
-        Return newly created empty numbering part, containing only the root
-        ``<w:numbering>`` element.
+        Return newly created empty numbering part belonging to *package*,
+        containing only the root ``<w:numbering>`` element.
         """
-        raise NotImplementedError
+        partname = PackURI('/word/numbering.xml')
+        content_type = CT.WML_NUMBERING
+        element = OxmlElement('w:numbering')
+        return cls(partname, content_type, element, package)
 
     @lazyproperty
     def numbering_definitions(self):
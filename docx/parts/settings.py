@@ -13,7 +13,7 @@ import os
 from ..opc.constants import CONTENT_TYPE as CT
 from ..opc.packuri import PackURI
 from ..opc.part import XmlPart
-from ..oxml import parse_xml
+from ..oxml import clone_prototype
 from ..settings import Settings
 
 
@@ -29,7 +29,9 @@ class SettingsPart(XmlPart):
         """
         partname = PackURI('/word/settings.xml')
         content_type = CT.WML_SETTINGS
-        element = parse_xml(cls._default_settings_xml())
+        element = clone_prototype(
+            'default-settings.xml', cls._default_settings_xml
+        )
         return cls(partname, content_type, element, package)
 
     @property
@@ -4,6 +4,8 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from docx.compat import ThreadPoolExecutor
+from docx.image.image import Image
 from docx.opc.constants import RELATIONSHIP_TYPE as RT
 from docx.opc.part import XmlPart
 from docx.oxml.shape import CT_Inline
@@ -18,6 +20,22 @@ class BaseStoryPart(XmlPart):
     `.add_paragraph()`, `.add_table()` etc.
     """
 
+    def effective_p(self, p):
+        """Return loose `w:p` element holding the effective properties of *p*.
+
+        Its `w:pPr` child combines the properties applied directly to *p* with those
+        inherited from the document defaults and the styles that apply to it.
+        """
+        return self._document_part.effective_p(p)
+
+    def effective_r(self, r):
+        """Return loose `w:r` element holding the effective properties of *r*.
+
+        Its `w:rPr` child combines the properties applied directly to *r* with those
+        inherited from the document defaults and the styles that apply to it.
+        """
+        return self._document_part.effective_r(r)
+
     def get_or_add_image(self, image_descriptor):
         """Return (rId, image) pair for image identified by *image_descriptor*.
 
@@ -47,6 +65,15 @@ class BaseStoryPart(XmlPart):
         """
         return self._document_part.get_style_id(style_or_name, style_type)
 
+    def list_numId(self, style_id, ilvls, restart):
+        """Return numId for a new list of paragraphs having the style *style_id*.
+
+        The numbering definition of that style is used, or a default one when it has
+        none. A new `w:num` restarting numbering at each level in *ilvls* is added when
+        *restart* is |True|.
+        """
+        return self._document_part.list_numId(style_id, ilvls, restart)
+
     def new_pic_inline(self, image_descriptor, width, height):
         """Return a newly-created `w:inline` element.
 
@@ -55,9 +82,44 @@ class BaseStoryPart(XmlPart):
         """
         rId, image = self.get_or_add_image(image_descriptor)
         cx, cy = image.scaled_dimensions(width, height)
-        shape_id, filename = self.next_id, image.filename
+        shape_id, filename = self.allocate_id(), image.filename
         return CT_Inline.new_pic_inline(shape_id, rId, filename, cx, cy)
 
+    def new_pic_inlines(self, image_descriptors, width, height, workers=None):
+        """Return a list of newly-created `w:inline` elements, one for each image.
+
+        The images identified by *image_descriptors* are read, characterized and hashed
+        on a pool of at most *workers* threads, using the thread-pool default when
+        *workers* is |None| and the calling thread alone when it is 1. They are then
+        added to the package and related to this part, and their inlines are assigned
+        shape ids, in the order the images are given. Each image is scaled based on
+        the values of *width* and *height*.
+        """
+        image_parts = self._package.image_parts
+        images = self._load_images(image_descriptors, image_parts.hash_name, workers)
+        inlines = []
+        for image in images:
+            image_part = image_parts.get_or_add_image_part_for(image)
+            rId = self.relate_to(image_part, RT.IMAGE)
+            image = image_part.image
+            cx, cy = image.scaled_dimensions(width, height)
+            shape_id = self.allocate_id()
+            inlines.append(
+                CT_Inline.new_pic_inline(shape_id, rId, image.filename, cx, cy)
+            )
+        return inlines
+
+    def allocate_id(self):
+        """Return the next available positive integer id and reserve it.
+
+        The returned value is allocated to the caller, so it should be used for a new
+        element, otherwise it is left as a gap. The following call returns the value
+        after it.
+        """
+        next_id = self.next_id
+        self._element._next_id = next_id + 1
+        return next_id
+
     @property
     def next_id(self):
         """Next available positive integer id value in this story XML document.
@@ -65,14 +127,52 @@ class BaseStoryPart(XmlPart):
         The value is determined by incrementing the maximum existing id value. Gaps in
         the existing id sequence are not filled. The id attribute value is unique in the
         document, without regard to the element type it appears on.
+
+        Reading this property does not reserve the value; use `.allocate_id()` to
+        obtain an id for a new element. The story is scanned for existing ids only on
+        first access. After that the next id is kept on the story element and advanced
+        past the ids in any content added by a library method, as noted by
+        `note_content_change()`. Ids added by direct lxml editing are not seen.
         """
-        id_str_lst = self._element.xpath('//@id')
-        used_ids = [int(id_str) for id_str in id_str_lst if id_str.isdigit()]
-        if not used_ids:
-            return 1
-        return max(used_ids) + 1
+        element = self._element
+        next_id = getattr(element, '_next_id', None)
+        if next_id is None:
+            next_id = element._next_id = self._max_id + 1
+        return next_id
 
     @lazyproperty
     def _document_part(self):
         """|DocumentPart| object for this package."""
         return self.package.main_document_part
+
+    @property
+    def _max_id(self):
+        """Maximum positive integer id value in this story XML document, 0 if none.
+
+        This requires a scan of the whole story XML, so it is only used to seed
+        `.next_id`.
+        """
+        id_str_lst = self._element.xpath('//@id')
+        used_ids = [int(id_str) for id_str in id_str_lst if id_str.isdigit()]
+        if not used_ids:
+            return 0
+        return max(used_ids)
+
+    @staticmethod
+    def _load_images(image_descriptors, hash_name, workers):
+        """Return a list of |Image| objects, one for each of *image_descriptors*.
+
+        Each image is loaded and its *hash_name* digest computed on a pool of at most
+        *workers* threads, or on the calling thread when *workers* is 1 or a thread
+        pool is not available. The list is in the same order as *image_descriptors*.
+        """
+
+        def load_image(image_descriptor):
+            image = Image.from_file(image_descriptor)
+            image.digest(hash_name)
+            return image
+
+        if workers == 1 or ThreadPoolExecutor is None:
+            return [load_image(d) for d in image_descriptors]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(load_image, image_descriptors))
@@ -13,7 +13,7 @@ import os
 from ..opc.constants import CONTENT_TYPE as CT
 from ..opc.packuri import PackURI
 from ..opc.part import XmlPart
-from ..oxml import parse_xml
+from ..oxml import clone_prototype
 from ..styles.styles import Styles
 
 
@@ -30,7 +30,7 @@ class StylesPart(XmlPart):
         """
         partname = PackURI('/word/styles.xml')
         content_type = CT.WML_STYLES
-        element = parse_xml(cls._default_styles_xml())
+        element = clone_prototype('default-styles.xml', cls._default_styles_xml)
         return cls(partname, content_type, element, package)
 
     @property
@@ -7,8 +7,13 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 from docx.blkcntnr import BlockItemContainer
 from docx.compat import Sequence
 from docx.enum.section import WD_HEADER_FOOTER
+from docx.oxml.ns import qn
 from docx.shared import lazyproperty
 
+_HDRFTR_TYPES = (
+    WD_HEADER_FOOTER.PRIMARY, WD_HEADER_FOOTER.FIRST_PAGE, WD_HEADER_FOOTER.EVEN_PAGE
+)
+
 
 class Sections(Sequence):
     """Sequence of |Section| objects corresponding to the sections in the document.
@@ -16,6 +21,8 @@ class Sections(Sequence):
     Supports ``len()``, iteration, and indexed access.
     """
 
+    __slots__ = ('_document_elm', '_document_part')
+
     def __init__(self, document_elm, document_part):
         super(Sections, self).__init__()
         self._document_elm = document_elm
@@ -27,6 +34,12 @@ class Sections(Sequence):
                 Section(sectPr, self._document_part)
                 for sectPr in self._document_elm.sectPr_lst[key]
             ]
+        if key == -1:
+            # ---the last section is found without searching the document---
+            sectPr = self._document_elm.last_sectPr
+            if sectPr is None:
+                raise IndexError("section index out of range")
+            return Section(sectPr, self._document_part)
         return Section(self._document_elm.sectPr_lst[key], self._document_part)
 
     def __iter__(self):
@@ -36,6 +49,32 @@ class Sections(Sequence):
     def __len__(self):
         return len(self._document_elm.sectPr_lst)
 
+    def header_footer_map(self):
+        """Return dict of the header and footer parts in effect for each section.
+
+        Each key is a (section index, header/footer type) pair, where the type is one of
+        `WD_HEADER_FOOTER.PRIMARY` (the default header and footer), `.FIRST_PAGE` or
+        `.EVEN_PAGE`. Each value is a (header_part, footer_part) pair holding the
+        |HeaderPart| and |FooterPart| defined by that section or inherited from the
+        closest prior section defining one. Either is |None| when neither the section
+        nor any prior section defines one. The map is computed in a single pass over
+        the sections and no header or footer definitions are added.
+        """
+        document_part = self._document_part
+        header_tag, footer_tag = qn("w:headerReference"), qn("w:footerReference")
+
+        def part(get_part, rId):
+            return None if rId is None else get_part(rId)
+
+        hdrftr_map = {}
+        for idx, rIds in enumerate(self._document_elm.hdrftr_rIds):
+            for type_ in _HDRFTR_TYPES:
+                hdrftr_map[(idx, type_)] = (
+                    part(document_part.header_part, rIds.get((header_tag, type_))),
+                    part(document_part.footer_part, rIds.get((footer_tag, type_))),
+                )
+        return hdrftr_map
+
 
 class Section(object):
     """Document section, providing access to section and page setup settings.
@@ -43,6 +82,8 @@ class Section(object):
     Also provides access to headers and footers.
     """
 
+    __slots__ = ('_sectPr', '_document_part', '_footer', '_header')
+
     def __init__(self, sectPr, document_part):
         super(Section, self).__init__()
         self._sectPr = sectPr
@@ -262,6 +303,8 @@ class Section(object):
 class _BaseHeaderFooter(BlockItemContainer):
     """Base class for header and footer classes"""
 
+    __slots__ = ('_sectPr', '_document_part', '_hdrftr_index')
+
     def __init__(self, sectPr, document_part, header_footer_index):
         self._sectPr = sectPr
         self._document_part = document_part
@@ -324,22 +367,28 @@ class _BaseHeaderFooter(BlockItemContainer):
     def _get_or_add_definition(self):
         """Return HeaderPart or FooterPart object for this section.
 
-        If this header/footer inherits its content, the part for the prior header/footer
-        is returned; this process continue recursively until a definition is found. If
-        the definition cannot be inherited (because the header/footer belongs to the
-        first section), a new definition is added for that first section and then
-        returned.
+        If this header/footer inherits its content, the part of the closest prior
+        header/footer having a definition is returned, found using the document's
+        header/footer index rather than by visiting each prior section. If no section
+        up to this one has a definition, a new definition is added for the first section
+        and then returned.
         """
-        # ---note this method is called recursively to access inherited definitions---
         # ---case-1: definition is not inherited---
         if self._has_definition:
             return self._definition
-        # ---case-2: definition is inherited and belongs to second-or-later section---
-        prior_headerfooter = self._prior_headerfooter
-        if prior_headerfooter:
-            return prior_headerfooter._get_or_add_definition()
+        # ---case-2: definition is inherited from a second-or-later section---
+        prior_definition = self._prior_definition
+        if prior_definition is not None:
+            return prior_definition
         # ---case-3: definition is inherited, but belongs to first section---
-        return self._add_definition()
+        return self._first_headerfooter._add_definition()
+
+    @property
+    def _first_headerfooter(self):
+        """Header/footer of this type on the first section of the document."""
+        return type(self)(
+            self._sectPr.first_sectPr, self._document_part, self._hdrftr_index
+        )
 
     @property
     def _has_definition(self):
@@ -347,10 +396,11 @@ class _BaseHeaderFooter(BlockItemContainer):
         raise NotImplementedError("must be implemented by each subclass")
 
     @property
-    def _prior_headerfooter(self):
-        """|_Header| or |_Footer| proxy on prior sectPr element.
+    def _prior_definition(self):
+        """|HeaderPart| or |FooterPart| inherited from a prior section.
 
-        Returns None if this is first section.
+        Returns None if no prior section has a definition, including when this is the
+        first section.
         """
         raise NotImplementedError("must be implemented by each subclass")
 
@@ -365,6 +415,8 @@ class _Footer(_BaseHeaderFooter):
     leave an empty paragraph above the newly added one.
     """
 
+    __slots__ = ()
+
     def _add_definition(self):
         """Return newly-added footer part."""
         footer_part, rId = self._document_part.add_footer_part()
@@ -389,14 +441,10 @@ class _Footer(_BaseHeaderFooter):
         return False if footerReference is None else True
 
     @property
-    def _prior_headerfooter(self):
-        """|_Footer| proxy on prior sectPr element or None if this is first section."""
-        preceding_sectPr = self._sectPr.preceding_sectPr
-        return (
-            None
-            if preceding_sectPr is None
-            else _Footer(preceding_sectPr, self._document_part, self._hdrftr_index)
-        )
+    def _prior_definition(self):
+        """|FooterPart| inherited from a prior section or None if there is none."""
+        rId = self._sectPr.prior_hdrftr_rId("w:footerReference", self._hdrftr_index)
+        return None if rId is None else self._document_part.footer_part(rId)
 
 
 class _Header(_BaseHeaderFooter):
@@ -409,6 +457,8 @@ class _Header(_BaseHeaderFooter):
     leave an empty paragraph above the newly added one.
     """
 
+    __slots__ = ()
+
     def _add_definition(self):
         """Return newly-added header part."""
         header_part, rId = self._document_part.add_header_part()
@@ -433,11 +483,7 @@ class _Header(_BaseHeaderFooter):
         return False if headerReference is None else True
 
     @property
-    def _prior_headerfooter(self):
-        """|_Header| proxy on prior sectPr element or None if this is first section."""
-        preceding_sectPr = self._sectPr.preceding_sectPr
-        return (
-            None
-            if preceding_sectPr is None
-            else _Header(preceding_sectPr, self._document_part, self._hdrftr_index)
-        )
+    def _prior_definition(self):
+        """|HeaderPart| inherited from a prior section or None if there is none."""
+        rId = self._sectPr.prior_hdrftr_rId("w:headerReference", self._hdrftr_index)
+        return None if rId is None else self._document_part.header_part(rId)
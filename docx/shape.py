@@ -11,6 +11,7 @@ from __future__ import (
 
 from .enum.shape import WD_INLINE_SHAPE
 from .oxml.ns import nsmap
+from .oxml.xmlchemy import content_revision
 from .shared import Parented
 
 
@@ -18,10 +19,21 @@ class InlineShapes(Parented):
     """
     Sequence of |InlineShape| instances, supporting len(), iteration, and
     indexed access.
+
+    The inline shapes are found by searching the document once and cached,
+    so indexed access in a loop takes linear time. The cache is refreshed
+    after content is added or removed by python-docx, or after paragraphs are
+    added to or removed from the body directly with lxml, but not after other
+    direct edits of the XML.
     """
+
+    __slots__ = ('_body', '_inline_lst_cache', '_inline_lst_key')
+
     def __init__(self, body_elm, parent):
         super(InlineShapes, self).__init__(parent)
         self._body = body_elm
+        self._inline_lst_cache = None
+        self._inline_lst_key = None
 
     def __getitem__(self, idx):
         """
@@ -40,11 +52,42 @@ class InlineShapes(Parented):
     def __len__(self):
         return len(self._inline_lst)
 
+    def iter_with_context(self):
+        """
+        Generate an ``(inline_shape, paragraph, image_part)`` 3-tuple for each
+        inline shape in the document, in document order. *paragraph* is the
+        |Paragraph| containing the shape and *image_part* is the |ImagePart|
+        holding the image of an embedded picture, or |None| when the shape
+        has no embedded image, like a linked picture or a chart.
+        """
+        from .text.paragraph import Paragraph
+
+        part = self.part
+        related_parts = part.related_parts
+        for inline in self._inline_lst:
+            p = inline.getparent().getparent().getparent()
+            graphicData = inline.graphic.graphicData
+            image_part = None
+            if graphicData.uri == nsmap['pic']:
+                rId = graphicData.pic.blipFill.blip.embed
+                if rId is not None:
+                    image_part = related_parts[rId]
+            yield InlineShape(inline), Paragraph(p, part), image_part
+
     @property
     def _inline_lst(self):
+        """
+        List of the `wp:inline` elements in the document, searched for only
+        when the content revision of the document or the number of body
+        children has changed since the last search.
+        """
         body = self._body
-        xpath = '//w:p/w:r/w:drawing/wp:inline'
-        return body.xpath(xpath)
+        content_key = (content_revision(body), len(body))
+        if self._inline_lst_key != content_key:
+            xpath = '//w:p/w:r/w:drawing/wp:inline'
+            self._inline_lst_cache = body.xpath(xpath)
+            self._inline_lst_key = content_key
+        return self._inline_lst_cache
 
 
 class InlineShape(object):
@@ -52,6 +95,9 @@ class InlineShape(object):
     Proxy for an ``<wp:inline>`` element, representing the container for an
     inline graphical object.
     """
+
+    __slots__ = ('_inline',)
+
     def __init__(self, inline):
         super(InlineShape, self).__init__()
         self._inline = inline
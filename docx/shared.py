@@ -238,13 +238,22 @@ class Parented(object):
     such as add or drop a relationship. Provides ``self._parent`` attribute
     to subclasses.
     """
+
+    __slots__ = ('_parent', '_part')
+
     def __init__(self, parent):
         super(Parented, self).__init__()
         self._parent = parent
+        self._part = None
 
     @property
     def part(self):
         """
-        The package part containing this object
+        The package part containing this object. The part is found from the
+        parent on first access and kept, so later access doesn't climb the
+        chain of ancestor proxies.
         """
-        return self._parent.part
+        part = self._part
+        if part is None:
+            part = self._part = self._parent.part
+        return part
@@ -43,8 +43,9 @@ class LatentStyles(ElementProxy):
         defaults defined in this latent styles object for the built-in style
         having *name*.
         """
-        lsdException = self._element.add_lsdException()
-        lsdException.name = BabelFish.ui2internal(name)
+        lsdException = self._element.add_lsdException_named(
+            BabelFish.ui2internal(name)
+        )
         return _LatentStyle(lsdException)
 
     @property
@@ -127,6 +128,34 @@ class LatentStyles(ElementProxy):
     def load_count(self, value):
         self._element.count = value
 
+    def update(self, latent_styles):
+        """
+        Apply the property values in *latent_styles*, a dict mapping the
+        name of a built-in style to a dict of |_LatentStyle| property names
+        and values, such as ``{'Heading 1': {'hidden': False,
+        'priority': 9}}``. A latent style is added for each name not already
+        present. Each name is found using an index of the latent styles by
+        name, so updating many latent styles is a single pass. Raises
+        |AttributeError| for a name in a property dict that is not
+        a writable |_LatentStyle| property, before any change is made.
+        """
+        for props in latent_styles.values():
+            for prop_name in props:
+                prop = getattr(_LatentStyle, prop_name, None)
+                if not isinstance(prop, property) or prop.fset is None:
+                    raise AttributeError(
+                        "'%s' is not a writable latent style property" % prop_name
+                    )
+        latentStyles = self._element
+        for name, props in latent_styles.items():
+            style_name = BabelFish.ui2internal(name)
+            lsdException = latentStyles.get_by_name(style_name)
+            if lsdException is None:
+                lsdException = latentStyles.add_lsdException_named(style_name)
+            latent_style = _LatentStyle(lsdException)
+            for prop_name, value in props.items():
+                setattr(latent_style, prop_name, value)
+
 
 class _LatentStyle(ElementProxy):
     """
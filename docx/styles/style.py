@@ -167,6 +167,15 @@ class BaseStyle(ElementProxy):
     def unhide_when_used(self, value):
         self._element.unhideWhenUsed_val = value
 
+    def _reset_style_caches(self):
+        """
+        Discard lookups cached on the styles element containing this style,
+        such as resolved effective formatting, after a change that can
+        affect them. A style not contained in a styles element has nothing
+        to reset.
+        """
+        self._element._reset_styles_caches()
+
 
 class _CharacterStyle(BaseStyle):
     """
@@ -192,6 +201,7 @@ class _CharacterStyle(BaseStyle):
     def base_style(self, style):
         style_id = style.style_id if style is not None else None
         self._element.basedOn_val = style_id
+        self._reset_style_caches()
 
     @property
     def font(self):
@@ -26,10 +26,7 @@ class Styles(ElementProxy):
         Enables `in` operator on style name.
         """
         internal_name = BabelFish.ui2internal(name)
-        for style in self._element.style_lst:
-            if style.name_val == internal_name:
-                return True
-        return False
+        return self._element.get_by_name(internal_name) is not None
 
     def __getitem__(self, key):
         """
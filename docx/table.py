@@ -7,6 +7,7 @@ The |Table| object and related proxy classes.
 from __future__ import absolute_import, print_function, unicode_literals
 
 from .blkcntnr import BlockItemContainer
+from .compat import Unicode
 from .enum.style import WD_STYLE_TYPE
 from .oxml.simpletypes import ST_Merge
 from .shared import Inches, lazyproperty, Parented
@@ -16,6 +17,9 @@ class Table(Parented):
     """
     Proxy class for a WordprocessingML ``<w:tbl>`` element.
     """
+
+    __slots__ = ('_element', '_tbl', '_columns', '_rows')
+
     def __init__(self, tbl, parent):
         super(Table, self).__init__(parent)
         self._element = self._tbl = tbl
@@ -25,13 +29,16 @@ class Table(Parented):
         Return a |_Column| object of *width*, newly added rightmost to the
         table.
         """
-        tblGrid = self._tbl.tblGrid
-        gridCol = tblGrid.add_gridCol()
-        gridCol.w = width
-        for tr in self._tbl.tr_lst:
-            tc = tr.add_tc()
-            tc.width = width
-        return _Column(gridCol, self)
+        return self.add_columns(1, width)[0]
+
+    def add_columns(self, count, width):
+        """
+        Return a list of *count* new |_Column| objects, each of *width*,
+        newly added rightmost to the table. The new cells are added in
+        a single pass over the rows of the table.
+        """
+        gridCols = self._tbl.add_gridCols(count, width)
+        return [_Column(gridCol, self) for gridCol in gridCols]
 
     def add_row(self):
         """
@@ -88,6 +95,28 @@ class Table(Parented):
         idxs = range(column_idx, len(cells), self._column_count)
         return [cells[idx] for idx in idxs]
 
+    def delete_columns(self, column_idxs):
+        """
+        Remove the columns at each of *column_idxs* from this table, along
+        with their cells, in a single pass over the rows. A merged cell
+        extending beyond the deleted columns is narrowed rather than removed.
+        Negative indices count from the right. Raises |IndexError| if any
+        index is out of range, and |ValueError| if every column would be
+        deleted, leaving the table unchanged in either case.
+        """
+        self._tbl.delete_grid_cols(column_idxs)
+
+    def delete_rows(self, row_idxs):
+        """
+        Remove the rows at each of *row_idxs* from this table in a single
+        pass. A vertically merged cell whose top row is deleted begins at
+        its first remaining row. Negative indices count from the bottom.
+        Raises |IndexError| if any index is out of range, and |ValueError|
+        if every row would be deleted, leaving the table unchanged in either
+        case.
+        """
+        self._tbl.delete_trs(row_idxs)
+
     @lazyproperty
     def columns(self):
         """
@@ -112,6 +141,42 @@ class Table(Parented):
         """
         return _Rows(self._tbl, self)
 
+    def set_values(self, values, start=(0, 0), preserve_formatting=True):
+        """
+        Write the text values in *values*, a sequence of row sequences, into
+        the existing cells of this table in a single pass. The first value
+        is written to the cell at *start*, a (row_idx, col_idx) pair, and the
+        remaining values fill the grid to the right and below it. A value of
+        |None| leaves its cell unchanged; any other value is converted to
+        a string. A value falling on a merged cell is written to that merged
+        cell, as would `table.cell(row_idx, col_idx).text = value`, so the
+        last value written within a merged cell wins. When
+        *preserve_formatting* is |True|, the paragraph properties of the
+        first paragraph and the run properties of the first run in each cell
+        are reused for the new text. Raises |IndexError| if *start* is
+        negative or *values* extends beyond the table grid, in which case no
+        cell is changed.
+        """
+        row_offset, col_offset = start
+        if row_offset < 0 or col_offset < 0:
+            raise IndexError(
+                'cell (%d, %d) is out of range' % (row_offset, col_offset)
+            )
+        rows = [list(row_values) for row_values in values]
+        tc_grid = self._tc_grid
+        for row_idx, row_values in enumerate(rows, row_offset):
+            last_col_idx = col_offset + len(row_values) - 1
+            if row_idx >= len(tc_grid) or last_col_idx >= len(tc_grid[row_idx]):
+                raise IndexError(
+                    'cell (%d, %d) is out of range' % (row_idx, last_col_idx)
+                )
+        for row_idx, row_values in enumerate(rows, row_offset):
+            tcs = tc_grid[row_idx]
+            for col_idx, value in enumerate(row_values, col_offset):
+                if value is None:
+                    continue
+                tcs[col_idx].set_text(Unicode(value), preserve_formatting)
+
     @property
     def style(self):
         """
@@ -188,10 +253,38 @@ class Table(Parented):
     def _tblPr(self):
         return self._tbl.tblPr
 
+    @property
+    def _tc_grid(self):
+        """
+        A list of rows, each a list containing the ``<w:tc>`` element at each
+        grid column of that row. A ``<w:tc>`` element is repeated for each
+        grid column it spans and, like |Table._cells|, a vertically merged
+        continuation cell maps to the ``<w:tc>`` element above it.
+        """
+        tc_grid = []
+        prior_tcs = []
+        for tr in self._tbl.tr_lst:
+            tcs = []
+            for tc in tr.tc_lst:
+                for _ in range(tc.grid_span):
+                    grid_col = len(tcs)
+                    if (
+                        tc.vMerge == ST_Merge.CONTINUE and
+                        grid_col < len(prior_tcs)
+                    ):
+                        tcs.append(prior_tcs[grid_col])
+                    else:
+                        tcs.append(tc)
+            tc_grid.append(tcs)
+            prior_tcs = tcs
+        return tc_grid
+
 
 class _Cell(BlockItemContainer):
     """Table cell"""
 
+    __slots__ = ('_tc',)
+
     def __init__(self, tc, parent):
         super(_Cell, self).__init__(tc, parent)
         self._tc = self._element = tc
@@ -263,11 +356,7 @@ class _Cell(BlockItemContainer):
         Write-only. Set entire contents of cell to the string *text*. Any
         existing content or revisions are replaced.
         """
-        tc = self._tc
-        tc.clear_content()
-        p = tc.add_p()
-        r = p.add_r()
-        r.text = text
+        self._tc.set_text(text)
 
     @property
     def vertical_alignment(self):
@@ -303,6 +392,9 @@ class _Column(Parented):
     """
     Table column
     """
+
+    __slots__ = ('_gridCol',)
+
     def __init__(self, gridCol, parent):
         super(_Column, self).__init__(parent)
         self._gridCol = gridCol
@@ -346,6 +438,9 @@ class _Columns(Parented):
     Sequence of |_Column| instances corresponding to the columns in a table.
     Supports ``len()``, iteration and indexed access.
     """
+
+    __slots__ = ('_tbl',)
+
     def __init__(self, tbl, parent):
         super(_Columns, self).__init__(parent)
         self._tbl = tbl
@@ -389,6 +484,9 @@ class _Row(Parented):
     """
     Table row
     """
+
+    __slots__ = ('_tr', '_element')
+
     def __init__(self, tr, parent):
         super(_Row, self).__init__(parent)
         self._tr = self._element = tr
@@ -445,6 +543,9 @@ class _Rows(Parented):
     Sequence of |_Row| objects corresponding to the rows in a table.
     Supports ``len()``, iteration, indexed access, and slicing.
     """
+
+    __slots__ = ('_tbl',)
+
     def __init__(self, tbl, parent):
         super(_Rows, self).__init__(parent)
         self._tbl = tbl
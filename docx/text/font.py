@@ -9,10 +9,10 @@ from __future__ import (
 )
 
 from ..dml.color import ColorFormat
-from ..shared import ElementProxy
+from ..fmtproxy import FormatProxy
 
 
-class Font(ElementProxy):
+class Font(FormatProxy):
     """
     Proxy object wrapping the parent of a ``<w:rPr>`` element and providing
     access to character properties such as font name, font size, bold, and
@@ -11,6 +11,7 @@ from __future__ import (
 from ..enum.style import WD_STYLE_TYPE
 from .parfmt import ParagraphFormat
 from .run import Run
+from ..shape import InlineShape
 from ..shared import Parented
 
 
@@ -18,10 +19,36 @@ class Paragraph(Parented):
     """
     Proxy object wrapping ``<w:p>`` element.
     """
+
+    __slots__ = ('_p', '_element')
+
     def __init__(self, p, parent):
         super(Paragraph, self).__init__(parent)
         self._p = self._element = p
 
+    def add_pictures(
+            self, image_paths_or_streams, width=None, height=None,
+            workers=None):
+        """
+        Return a list of |InlineShape| instances, one for each image in
+        *image_paths_or_streams*, each added in its own run at the end of
+        this paragraph. Each item can be a path (a string) or a file-like
+        object containing a binary image, and each picture is scaled based
+        on *width* and *height* as described for :meth:`Run.add_picture`.
+        The images are read and characterized on a pool of at most *workers*
+        threads (one thread when *workers* is 1), then added in the order
+        given. This is much faster than adding a large number of pictures
+        one at a time.
+        """
+        inlines = self.part.new_pic_inlines(
+            image_paths_or_streams, width, height, workers
+        )
+        pictures = []
+        for inline in inlines:
+            self._p.add_r().add_drawing(inline)
+            pictures.append(InlineShape(inline))
+        return pictures
+
     def add_run(self, text=None, style=None):
         """
         Append a run to this paragraph containing *text* and having character
@@ -62,6 +89,18 @@ class Paragraph(Parented):
         self._p.clear_content()
         return self
 
+    @property
+    def effective_format(self):
+        """
+        A |ParagraphFormat| object reporting the paragraph formatting that
+        actually applies to this paragraph, taking into account the document
+        defaults, the table and paragraph styles in effect and the
+        formatting applied directly to the paragraph. The returned object is
+        a snapshot; changing it has no effect on the document. Use
+        :attr:`paragraph_format` to change the formatting of this paragraph.
+        """
+        return ParagraphFormat(self.part.effective_p(self._p))
+
     def insert_paragraph_before(self, text=None, style=None):
         """
         Return a newly created paragraph, inserted directly before this
@@ -9,11 +9,12 @@ from __future__ import (
 )
 
 from ..enum.text import WD_LINE_SPACING
-from ..shared import ElementProxy, Emu, lazyproperty, Length, Pt, Twips
+from ..shared import Emu, lazyproperty, Length, Pt, Twips
+from ..fmtproxy import FormatProxy
 from .tabstops import TabStops
 
 
-class ParagraphFormat(ElementProxy):
+class ParagraphFormat(FormatProxy):
     """
     Provides access to paragraph formatting such as justification,
     indentation, line spacing, space before and after, and widow/orphan
@@ -21,6 +21,9 @@ class Run(Parented):
     not specified directly on the run and its effective value is taken from
     the style hierarchy.
     """
+
+    __slots__ = ('_r', '_element', 'element')
+
     def __init__(self, r, parent):
         super(Run, self).__init__(parent)
         self._r = self._element = self.element = r
@@ -57,7 +60,10 @@ class Run(Parented):
         unspecified dimension, preserving the aspect ratio of the image. The
         native size of the picture is calculated using the dots-per-inch
         (dpi) value specified in the image file, defaulting to 72 dpi if no
-        value is specified, as is often the case.
+        value is specified, as is often the case. The image is read when it
+        is added, so the file or stream can be changed or removed afterward,
+        unless ``docx.image.image.Image.read_paths_lazily`` is set, in which
+        case an image file must stay in place until the document is saved.
         """
         inline = self.part.new_pic_inline(image_path_or_stream, width, height)
         self._r.add_drawing(inline)
@@ -99,6 +105,19 @@ class Run(Parented):
         self._r.clear_content()
         return self
 
+    @property
+    def effective_font(self):
+        """
+        A |Font| object reporting the character formatting that actually
+        applies to this run, taking into account the document defaults, the
+        table, paragraph, and character styles in effect and the formatting
+        applied directly to the run. A property is |None| only when it is
+        not defined anywhere in that hierarchy. The returned object is
+        a snapshot; changing it has no effect on the document. Use
+        :attr:`font` to change the formatting of this run.
+        """
+        return Font(self.part.effective_r(self._r))
+
     @property
     def font(self):
         """
@@ -186,6 +205,9 @@ class _Text(object):
     """
     Proxy object wrapping ``<w:t>`` element.
     """
+
+    __slots__ = ('_t',)
+
     def __init__(self, t_elm):
         super(_Text, self).__init__()
         self._t = t_elm
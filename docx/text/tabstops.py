@@ -8,11 +8,11 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
-from ..shared import ElementProxy
+from ..fmtproxy import FormatProxy
 from docx.enum.text import WD_TAB_ALIGNMENT, WD_TAB_LEADER
 
 
-class TabStops(ElementProxy):
+class TabStops(FormatProxy):
     """
     A sequence of |TabStop| objects providing access to the tab stops of
     a paragraph or paragraph style. Supports iteration, indexed access, del,
@@ -39,6 +39,7 @@ class TabStops(ElementProxy):
 
         if len(tabs) == 0:
             self._pPr.remove(tabs)
+        self._note_style_change()
 
     def __getitem__(self, idx):
         """
@@ -79,6 +80,7 @@ class TabStops(ElementProxy):
         """
         tabs = self._pPr.get_or_add_tabs()
         tab = tabs.insert_tab_in_order(position, alignment, leader)
+        self._note_style_change()
         return TabStop(tab)
 
     def clear_all(self):
@@ -86,9 +88,10 @@ class TabStops(ElementProxy):
         Remove all custom tab stops.
         """
         self._pPr._remove_tabs()
+        self._note_style_change()
 
 
-class TabStop(ElementProxy):
+class TabStop(FormatProxy):
     """
     An individual tab stop applying to a paragraph or style. Accessed using
     list semantics on its containing |TabStops| object.
@@ -139,5 +142,7 @@ class TabStop(ElementProxy):
     def position(self, value):
         tab = self._tab
         tabs = tab.getparent()
-        self._tab = tabs.insert_tab_in_order(value, tab.val, tab.leader)
+        self._tab = self._element = tabs.insert_tab_in_order(
+            value, tab.val, tab.leader
+        )
         tabs.remove(tab)
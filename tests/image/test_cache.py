@@ -0,0 +1,106 @@
+# encoding: utf-8
+
+"""Unit test suite for docx.image.cache module"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import os
+import shutil
+
+import pytest
+
+from docx.compat import BytesIO
+from docx.image.cache import ImageCache
+from docx.image.image import Image
+
+from ..unitutil.file import test_file
+
+
+class DescribeImageCache(object):
+
+    def it_is_disabled_by_default(self):
+        assert ImageCache.current() is None
+
+    def it_can_be_enabled_and_disabled_for_the_process(self, request):
+        request.addfinalizer(ImageCache.disable)
+
+        cache = ImageCache.enable(maxsize=4)
+
+        assert ImageCache.current() is cache
+        assert cache.maxsize == 4
+        ImageCache.disable()
+        assert ImageCache.current() is None
+
+    def it_caches_an_image_loaded_by_path(self, image_path):
+        cache = ImageCache()
+
+        image = cache.get(image_path)
+
+        assert isinstance(image, Image)
+        assert image.filename == 'python-icon.png'
+        assert image.px_width == 24
+        assert cache.get(image_path) is image
+        assert len(cache) == 1
+
+    def it_reloads_an_image_file_that_changed(self, image_path):
+        cache = ImageCache()
+        image = cache.get(image_path)
+        stat = os.stat(image_path)
+
+        os.utime(image_path, (stat.st_atime, stat.st_mtime + 10))
+
+        assert cache.get(image_path) is not image
+        assert len(cache) == 2
+
+    def it_caches_an_image_read_from_a_stream_by_digest(self):
+        with open(test_file('python-icon.png'), 'rb') as f:
+            blob = f.read()
+        cache = ImageCache()
+
+        image = cache.get(BytesIO(blob))
+
+        assert cache.get(BytesIO(blob)) is image
+        assert image.blob is cache.get(BytesIO(blob)).blob
+        assert image.sha1 == Image(blob, None, None).sha1
+
+    def it_evicts_the_least_recently_used_image_when_full(self, tmpdir):
+        paths = []
+        for name in ('a.png', 'b.png', 'c.png'):
+            path = str(tmpdir.join(name))
+            shutil.copy(test_file('python-icon.png'), path)
+            paths.append(path)
+        a, b, c = paths
+        cache = ImageCache(maxsize=2)
+        image_a = cache.get(a)
+        image_b = cache.get(b)
+
+        cache.get(a)
+        cache.get(c)
+
+        assert len(cache) == 2
+        assert cache.get(a) is image_a
+        assert cache.get(b) is not image_b
+
+    def it_is_consulted_by_Image_from_file_when_enabled(
+            self, request, image_path):
+        request.addfinalizer(ImageCache.disable)
+        cache = ImageCache.enable()
+
+        image = Image.from_file(image_path)
+
+        assert cache.get(image_path) is image
+        assert Image.from_file(image_path) is image
+
+    def it_can_be_cleared(self, image_path):
+        cache = ImageCache()
+        cache.get(image_path)
+        cache.clear()
+        assert len(cache) == 0
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def image_path(self, tmpdir):
+        path = str(tmpdir.join('python-icon.png'))
+        shutil.copy(test_file('python-icon.png'), path)
+        return path
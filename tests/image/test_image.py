@@ -4,11 +4,13 @@
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+import os
+
 import pytest
 
 from docx.compat import BytesIO
 from docx.image.bmp import Bmp
-from docx.image.exceptions import UnrecognizedImageError
+from docx.image.exceptions import ImageFileChangedError, UnrecognizedImageError
 from docx.image.gif import Gif
 from docx.image.image import BaseImageHeader, Image, _ImageHeaderFactory
 from docx.image.jpeg import Exif, Jfif
@@ -41,13 +43,60 @@ class DescribeImage(object):
         assert image is image_
 
     def it_can_construct_from_an_image_path(self, from_path_fixture):
-        image_path, _from_stream_, stream_, blob, filename, image_ = (
-            from_path_fixture
-        )
+        image_path, _from_stream_, blob, filename, image_ = from_path_fixture
         image = Image.from_file(image_path)
-        _from_stream_.assert_called_once_with(stream_, blob, filename)
+        _from_stream_.assert_called_once_with(ANY, blob, filename)
         assert image is image_
 
+    def it_reads_a_path_image_once_when_loaded(self, tmpdir):
+        image_path = str(tmpdir.join('image.png'))
+        with open(test_file('python-icon.png'), 'rb') as f:
+            blob = f.read()
+        with open(image_path, 'wb') as f:
+            f.write(blob)
+
+        image = Image.from_file(image_path)
+        with open(image_path, 'wb') as f:
+            f.write(b'f00b4r')
+
+        assert image.blob == blob
+        assert image.sha1 == Image(blob, None, None).sha1
+        assert image.px_width == 24
+
+    def it_can_read_a_path_image_lazily(self, image_file, read_paths_lazily):
+        image_path, blob = image_file
+
+        image = Image.from_file(image_path)
+
+        assert image._blob is None
+        assert image.px_width == 24
+        assert image.blob == blob
+        assert b''.join(image.iter_blob_chunks(chunk_size=100)) == blob
+        assert image.sha1 == Image(blob, None, None).sha1
+
+    def but_it_refuses_to_read_a_lazy_image_file_changed_since(
+        self, image_file, read_paths_lazily
+    ):
+        image_path, blob = image_file
+        image = Image.from_file(image_path)
+
+        with open(image_path, 'wb') as f:
+            f.write(blob + b'f00b4r')
+
+        with pytest.raises(ImageFileChangedError):
+            image.blob
+
+    def and_it_refuses_to_read_a_lazy_image_file_removed_since(
+        self, image_file, read_paths_lazily
+    ):
+        image_path, _ = image_file
+        image = Image.from_file(image_path)
+
+        os.remove(image_path)
+
+        with pytest.raises(ImageFileChangedError):
+            list(image.iter_blob_chunks())
+
     def it_can_construct_from_an_image_file_like(self, from_filelike_fixture):
         image_stream, _from_stream_, blob, image_ = from_filelike_fixture
         image = Image.from_file(image_stream)
@@ -62,7 +111,9 @@ class DescribeImage(object):
         image = Image._from_stream(stream_, blob_, filename_in)
 
         _ImageHeaderFactory_.assert_called_once_with(stream_)
-        Image__init_.assert_called_once_with(ANY, blob_, filename_out, image_header_)
+        Image__init_.assert_called_once_with(
+            ANY, blob_, filename_out, image_header_, None
+        )
         assert isinstance(image, Image)
 
     def it_provides_access_to_the_image_blob(self):
@@ -116,6 +167,11 @@ class DescribeImage(object):
         image = Image(blob, None, None)
         assert image.sha1 == '4921e7002ddfba690a937d54bda226a7b8bdeb68'
 
+    def it_can_compute_other_digests_of_its_image(self):
+        image = Image(b'fO0Bar', None, None)
+        assert image.digest('md5') == '75f52646fe38212ed93452ed046527fe'
+        assert image.digest('md5') is image.digest('md5')
+
     def it_correctly_characterizes_known_images(self, known_image_fixture):
         image_path, characteristics = known_image_fixture
         ext, content_type, px_width, px_height, horz_dpi, vert_dpi = (
@@ -152,6 +208,23 @@ class DescribeImage(object):
         image_header_.vert_dpi = vert_dpi
         return image_header_, horz_dpi, vert_dpi
 
+    @pytest.fixture
+    def image_file(self, tmpdir):
+        image_path = str(tmpdir.join('image.png'))
+        with open(test_file('python-icon.png'), 'rb') as f:
+            blob = f.read()
+        with open(image_path, 'wb') as f:
+            f.write(blob)
+        return image_path, blob
+
+    @pytest.fixture
+    def read_paths_lazily(self, request):
+        def fin():
+            Image.read_paths_lazily = False
+
+        Image.read_paths_lazily = True
+        request.addfinalizer(fin)
+
     @pytest.fixture
     def from_filelike_fixture(self, _from_stream_, image_):
         image_path = test_file('python-icon.png')
@@ -161,12 +234,12 @@ class DescribeImage(object):
         return image_stream, _from_stream_, blob, image_
 
     @pytest.fixture
-    def from_path_fixture(self, _from_stream_, BytesIO_, stream_, image_):
+    def from_path_fixture(self, _from_stream_, image_):
         filename = 'python-icon.png'
         image_path = test_file(filename)
         with open(image_path, 'rb') as f:
             blob = f.read()
-        return image_path, _from_stream_, stream_, blob, filename, image_
+        return image_path, _from_stream_, blob, filename, image_
 
     @pytest.fixture(params=['foobar.png', None])
     def from_stream_fixture(
@@ -511,6 +511,19 @@ class Describe_MarkerFinder(object):
         marker_code, segment_offset = marker_finder.next(start)
         assert (marker_code, segment_offset) == expected_code_and_offset
 
+    @pytest.mark.parametrize('block_size', [1, 2, 3, 5])
+    def it_finds_markers_that_span_read_blocks(self, block_size):
+        bytes_ = b'\xFF\xD8\xFF\xE0\x00\x01\xFF\x00\xFF\xFF\xFF\xD9'
+        marker_finder = _MarkerFinder(StreamReader(BytesIO(bytes_), BIG_ENDIAN))
+        marker_finder._block_size = block_size
+
+        found = [marker_finder.next(start) for start in (0, 1, 3, 8)]
+
+        assert found == [
+            (JPEG_MARKER_CODE.SOI, 2), (JPEG_MARKER_CODE.APP0, 4),
+            (JPEG_MARKER_CODE.EOI, 12), (JPEG_MARKER_CODE.EOI, 12),
+        ]
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -309,15 +309,17 @@ class Describe_ChunkParser(object):
             return_value=iter(chunk_offsets)
         )
 
-    @pytest.fixture
-    def iter_offsets_fixture(self):
-        bytes_ = b'-filler-\x00\x00\x00\x00IHDRxxxx\x00\x00\x00\x00IEND'
+    @pytest.fixture(params=[
+        (b'-filler-\x00\x00\x00\x00IHDRxxxx\x00\x00\x00\x00IEND',
+         [(PNG_CHUNK_TYPE.IHDR, 16), (PNG_CHUNK_TYPE.IEND, 28)]),
+        (b'-filler-\x00\x00\x00\x00IHDRxxxx\x00\x00\x00\x01IDATxyyyy'
+         b'\x00\x00\x00\x00IDAT',
+         [(PNG_CHUNK_TYPE.IHDR, 16), (PNG_CHUNK_TYPE.IDAT, 28)]),
+    ])
+    def iter_offsets_fixture(self, request):
+        bytes_, expected_chunk_offsets = request.param
         stream_rdr = StreamReader(BytesIO(bytes_), BIG_ENDIAN)
         chunk_parser = _ChunkParser(stream_rdr)
-        expected_chunk_offsets = [
-            (PNG_CHUNK_TYPE.IHDR, 16),
-            (PNG_CHUNK_TYPE.IEND, 28),
-        ]
         return chunk_parser, expected_chunk_offsets
 
     @pytest.fixture
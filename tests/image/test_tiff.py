@@ -99,7 +99,7 @@ class Describe_TiffParser(object):
 
         _make_stream_reader_.assert_called_once_with(stream_)
         _IfdEntries_.from_stream.assert_called_once_with(
-            stream_rdr_, ifd0_offset_
+            stream_rdr_, ifd0_offset_, _TiffParser._tags
         )
         _TiffParser__init_.assert_called_once_with(ANY, ifd_entries_)
         assert isinstance(tiff_parser, _TiffParser)
@@ -221,7 +221,7 @@ class Describe_IfdEntries(object):
 
         ifd_entries = _IfdEntries.from_stream(stream_, offset_)
 
-        _IfdParser_.assert_called_once_with(stream_, offset_)
+        _IfdParser_.assert_called_once_with(stream_, offset_, None)
         _IfdEntries__init_.assert_called_once_with(ANY, entries_)
         assert isinstance(ifd_entries, _IfdEntries)
 
@@ -278,6 +278,26 @@ class Describe_IfdParser(object):
         ]
         assert entries == expected_entries
 
+    def it_can_iterate_through_only_the_entries_it_needs(
+            self, _IfdEntryFactory_, ifd_entry_, ifd_entry_2_):
+        bytes_ = (
+            b'\x00\x05'
+            b'\x00\x01' + b'\x00' * 10 +
+            b'\x00\x02' + b'\x00' * 10 +
+            b'\x00\x03' + b'\x00' * 10 +
+            b'\x00\x04' + b'\x00' * 10
+        )
+        stream_rdr = StreamReader(BytesIO(bytes_), BIG_ENDIAN)
+        ifd_parser = _IfdParser(stream_rdr, 0, (3, 1))
+
+        entries = [e for e in ifd_parser.iter_entries()]
+
+        assert _IfdEntryFactory_.call_args_list == [
+            call(stream_rdr, 2),
+            call(stream_rdr, 26),
+        ]
+        assert entries == [ifd_entry_, ifd_entry_2_]
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -0,0 +1,161 @@
+# encoding: utf-8
+
+"""Unit test suite for the docx.opc.blobstore module"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import os
+import threading
+
+import pytest
+
+from docx.opc import blobstore
+from docx.compat import BytesIO
+from docx.opc.blobstore import SpooledBlob, iter_blob, read_blob
+
+
+class DescribeSpooledBlob(object):
+
+    def it_leaves_a_blob_in_memory_when_spilling_is_disabled(self):
+        blob = b"foobar"
+        assert SpooledBlob.spool(blob) is blob
+        assert SpooledBlob.spool(None) is None
+
+    def it_can_spool_a_blob_when_spilling_is_enabled(self, spill_threshold):
+        spooled_blob = SpooledBlob.spool(b"foobar")
+
+        assert isinstance(spooled_blob, SpooledBlob)
+        assert len(spooled_blob) == 6
+        assert spooled_blob.read() == b"foobar"
+
+    def it_moves_a_blob_to_disk_once_past_the_threshold(self, spill_threshold):
+        small_blob = SpooledBlob.spool(b"x" * 4)
+        large_blob = SpooledBlob.spool(b"x" * 5)
+        assert small_blob.is_spilled is False
+        assert large_blob.is_spilled is True
+        assert large_blob.read() == b"x" * 5
+
+    def it_keeps_every_spilled_blob_in_one_shared_file(self, spill_threshold):
+        blobs = [SpooledBlob.spool(b"%05d" % n) for n in range(200)]
+
+        assert all(blob.is_spilled for blob in blobs)
+        assert [blob.read() for blob in blobs] == [b"%05d" % n for n in range(200)]
+        assert blobstore._spill_file._file is not None
+
+    def it_writes_the_chunks_it_spills_as_they_arrive(self, spill_file):
+        written_before = []
+
+        def chunks():
+            for chunk in (b"ab", b"cd", b"ef", b"gh"):
+                if spill_file._file is not None:
+                    written_before.append(spill_file._file.tell())
+                yield chunk
+
+        spooled_blob = SpooledBlob(chunks(), 3)
+
+        assert written_before == [4, 6]
+        assert spooled_blob.is_spilled is True
+        assert spooled_blob.read() == b"abcdefgh"
+
+    def it_can_spool_a_stream_in_chunks(self, spill_threshold):
+        stream = BytesIO(b"foobarbaz")
+
+        spooled_blob = SpooledBlob.spool_stream(stream, chunk_size=2)
+
+        assert spooled_blob.is_spilled is True
+        assert spooled_blob.read() == b"foobarbaz"
+
+    def it_gives_back_the_space_of_a_released_blob(self, spill_file):
+        first = SpooledBlob((b"first",), 0)
+        middle = SpooledBlob((b"middle",), 0)
+        last = SpooledBlob((b"last",), 0)
+
+        del middle
+        assert spill_file._end == 15
+        del last
+        assert spill_file._end == 5
+        assert os.fstat(spill_file._file.fileno()).st_size == 5
+        assert first.read() == b"first"
+        del first
+        assert spill_file._file is None
+
+    def it_stops_writing_to_a_spill_file_shared_by_a_fork(self, spill_file):
+        before_fork = SpooledBlob((b"before",), 0)
+
+        blobstore._freeze_spill_file()
+        after_fork = SpooledBlob((b"after",), 0)
+
+        assert after_fork._spill_file is not spill_file
+        assert after_fork._offset == 0
+        del before_fork
+        assert spill_file._file is None
+        assert after_fork.read() == b"after"
+
+    def but_it_never_truncates_a_frozen_spill_file(self, spill_file):
+        first = SpooledBlob((b"first",), 0)
+        last = SpooledBlob((b"last",), 0)
+
+        spill_file.freeze()
+        del last
+
+        assert os.fstat(spill_file._file.fileno()).st_size == 9
+        assert first.read() == b"first"
+
+    def it_can_be_read_from_more_than_one_thread(self, spill_threshold):
+        blobs = [SpooledBlob.spool(bytes(bytearray([n]) * 4096)) for n in range(8)]
+        errors = []
+
+        def read_all(blob, expected):
+            for _ in range(50):
+                if b"".join(blob.iter_chunks(chunk_size=100)) != expected:
+                    errors.append(blob)
+
+        threads = [
+            threading.Thread(target=read_all, args=(blob, blob.read()))
+            for blob in blobs + blobs
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+
+    def it_can_generate_its_bytes_in_chunks(self):
+        spooled_blob = SpooledBlob((b"foo", b"bar", b"baz"), None)
+
+        chunks = list(spooled_blob.iter_chunks(chunk_size=4))
+
+        assert chunks == [b"foob", b"arba", b"z"]
+        assert list(spooled_blob.iter_chunks(chunk_size=4)) == chunks
+
+    def it_provides_blob_helpers_for_bytes_or_a_spooled_blob(self):
+        spooled_blob = SpooledBlob((b"foobar",), None)
+        assert read_blob(b"foobar") == b"foobar"
+        assert read_blob(spooled_blob) == b"foobar"
+        assert read_blob(None) is None
+        assert list(iter_blob(b"foobar")) == [b"foobar"]
+        assert list(iter_blob(spooled_blob, 4)) == [b"foob", b"ar"]
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture
+    def spill_threshold(self, request):
+        def fin():
+            SpooledBlob.spill_threshold = None
+
+        SpooledBlob.spill_threshold = 4
+        request.addfinalizer(fin)
+        return 4
+
+    @pytest.fixture
+    def spill_file(self, request):
+        spill_file = blobstore._SpillFile()
+        saved_spill_file = blobstore._spill_file
+
+        def fin():
+            blobstore._spill_file = saved_spill_file
+
+        blobstore._spill_file = spill_file
+        request.addfinalizer(fin)
+        return spill_file
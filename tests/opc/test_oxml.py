@@ -4,9 +4,15 @@
 Test suite for opc.oxml module
 """
 
+import threading
+
+import pytest
+
+from docx.opc import oxml as opc_oxml
 from docx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM
 from docx.opc.oxml import (
-    CT_Default, CT_Override, CT_Relationship, CT_Relationships, CT_Types
+    CT_Default, CT_Override, CT_Relationship, CT_Relationships, CT_Types,
+    parse_xml, thread_parser
 )
 from docx.oxml.xmlchemy import serialize_for_reading
 
@@ -131,3 +137,24 @@ class DescribeCT_Types(object):
         types.add_override('/docProps/thumbnail.jpeg', 'image/jpeg')
         expected_types_xml = a_Types().xml
         assert types.xml == expected_types_xml
+
+
+class DescribeThreadParser(object):
+
+    def it_provides_a_separate_parser_for_each_thread(self):
+        results = []
+
+        def parse():
+            results.append((thread_parser(), parse_xml(a_Types().xml)))
+
+        thread = threading.Thread(target=parse)
+        thread.start()
+        thread.join()
+
+        parser, types = results[0]
+        assert parser is not thread_parser()
+        assert isinstance(types, CT_Types)
+
+    def it_resolves_the_deprecated_oxml_parser_in_the_calling_thread(self):
+        with pytest.warns(DeprecationWarning):
+            assert opc_oxml.oxml_parser is thread_parser()
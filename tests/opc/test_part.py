@@ -6,6 +6,7 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import pytest
 
+from docx.opc.blobstore import SpooledBlob
 from docx.opc.package import OpcPackage
 from docx.opc.packuri import PackURI
 from docx.opc.part import Part, PartFactory, XmlPart
@@ -62,6 +63,15 @@ class DescribePart(object):
         part, load_blob = blob_fixture
         assert part.blob is load_blob
 
+    def it_can_hold_its_blob_out_of_memory(self):
+        part = Part(None, None, SpooledBlob((b"foo", b"bar"), None), None)
+        assert part.blob == b"foobar"
+        assert b"".join(part.iter_blob_chunks()) == b"foobar"
+
+    def it_generates_an_in_memory_blob_as_a_single_chunk(self):
+        part = Part(None, None, b"foobar", None)
+        assert list(part.iter_blob_chunks()) == [b"foobar"]
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -12,6 +12,8 @@ except ImportError:
     from StringIO import StringIO as BytesIO
 
 import hashlib
+import struct
+import sys
 import pytest
 
 from zipfile import ZIP_DEFLATED, ZipFile
@@ -174,6 +176,66 @@ class DescribeZipPkgWriter(object):
         retrieved_blob_sha1 = hashlib.sha1(retrieved_blob).hexdigest()
         assert retrieved_blob_sha1 == written_blob_sha1
 
+    def it_can_write_a_blob_in_chunks(self, pkg_file):
+        pack_uri = PackURI('/word/media/image1.png')
+        chunks = [b'foo', b'bar', b'baz']
+
+        pkg_writer = PhysPkgWriter(pkg_file)
+        pkg_writer.write_chunks(pack_uri, iter(chunks))
+        pkg_writer.close()
+
+        zipf = ZipFile(pkg_file, 'r')
+        zinfo = zipf.getinfo(pack_uri.membername)
+        retrieved_blob = zipf.read(pack_uri.membername)
+        zipf.close()
+        assert retrieved_blob == b'foobarbaz'
+        assert zinfo.compress_type == ZIP_DEFLATED
+
+    @pytest.mark.skipif(
+        sys.version_info < (3, 6), reason='chunks are joined before 3.6'
+    )
+    def it_streams_a_chunked_blob_with_zip64_extensions(self, pkg_file):
+        chunked_uri = PackURI('/word/media/image1.png')
+        whole_uri = PackURI('/word/document.xml')
+
+        pkg_writer = PhysPkgWriter(pkg_file)
+        pkg_writer.write_chunks(chunked_uri, iter([b'foo', b'bar']))
+        pkg_writer.write_chunks(whole_uri, iter([b'foobar']))
+        pkg_writer.close()
+
+        zipf = ZipFile(pkg_file, 'r')
+        offsets = dict(
+            (name, zipf.getinfo(name).header_offset)
+            for name in (chunked_uri.membername, whole_uri.membername)
+        )
+        assert zipf.read(chunked_uri.membername) == b'foobar'
+        zipf.close()
+        zip_bytes = pkg_file.getvalue()
+        chunked_offset = offsets[chunked_uri.membername]
+        whole_offset = offsets[whole_uri.membername]
+        assert self._local_extra_ids(zip_bytes, chunked_offset) == [1]
+        assert self._local_extra_ids(zip_bytes, whole_offset) == []
+
+    # helpers ----------------------------------------------
+
+    @staticmethod
+    def _local_extra_ids(zip_bytes, header_offset):
+        """
+        Return the id of each extra field in the local file header at
+        *header_offset*, where 1 identifies the ZIP64 extended information.
+        """
+        name_len, extra_len = struct.unpack(
+            '<HH', zip_bytes[header_offset + 26:header_offset + 30]
+        )
+        extra_start = header_offset + 30 + name_len
+        extra = zip_bytes[extra_start:extra_start + extra_len]
+        ids = []
+        while extra:
+            field_id, field_len = struct.unpack('<HH', extra[:4])
+            ids.append(field_id)
+            extra = extra[4 + field_len:]
+        return ids
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
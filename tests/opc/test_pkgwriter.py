@@ -68,12 +68,13 @@ class DescribePackageWriter(object):
         # exercise ---------------------
         PackageWriter._write_parts(phys_writer, [part1, part2])
         # verify -----------------------
-        expected_calls = [
-            call(part1.partname, part1.blob),
+        assert phys_writer.write_chunks.mock_calls == [
+            call(part1.partname, part1.iter_blob_chunks.return_value),
+            call(part2.partname, part2.iter_blob_chunks.return_value),
+        ]
+        assert phys_writer.write.mock_calls == [
             call(part1.partname.rels_uri, part1._rels.xml),
-            call(part2.partname, part2.blob),
         ]
-        assert phys_writer.write.mock_calls == expected_calls
 
     # fixtures ---------------------------------------------
 
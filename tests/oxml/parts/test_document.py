@@ -8,9 +8,122 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 import pytest
 
+from docx.enum.section import WD_HEADER_FOOTER
+from docx.oxml.ns import qn
+from docx.oxml.xmlchemy import note_content_change
+
 from ...unitutil.cxml import element, xml
 
 
+class DescribeCT_Document(object):
+
+    def it_knows_its_sectPr_elements(self):
+        document = element(
+            'w:document/w:body/(w:p/w:pPr/w:sectPr,w:p,w:p/w:pPr/w:sectPr,w:sectPr)'
+        )
+        sectPrs = document.xpath('//w:sectPr')
+
+        assert document.sectPr_lst == sectPrs
+        assert [document.sectPr_idx(s) for s in sectPrs] == [0, 1, 2]
+
+    def and_it_searches_again_for_a_sectPr_added_without_notice(self):
+        document = element('w:document/w:body/(w:p,w:sectPr)')
+        sectPr_lst = document.sectPr_lst
+        sectPr = element('w:sectPr')
+
+        document.body[0].get_or_add_pPr()._insert_sectPr(sectPr)
+
+        assert document.sectPr_idx(sectPr) == 0
+        assert document.sectPr_lst is not sectPr_lst
+        assert document.sectPr_lst[1] is document.body[-1]
+
+    def it_searches_for_sectPr_elements_again_after_a_content_change(self):
+        document = element('w:document/w:body/w:sectPr')
+        sectPr_lst = document.sectPr_lst
+
+        assert document.sectPr_lst is sectPr_lst
+
+        document.body.add_section_break()
+
+        assert document.sectPr_lst is not sectPr_lst
+        assert len(document.sectPr_lst) == 2
+
+    def but_it_keeps_them_when_block_content_without_a_sectPr_is_added(self):
+        document = element('w:document/w:body/(w:p,w:sectPr)')
+        sectPr_lst = document.sectPr_lst
+
+        document.body.add_p()
+        document.body.add_tbl()
+        document.body[0].add_p_before()
+        document.body[0].clear_content()
+
+        assert document.sectPr_lst is sectPr_lst
+
+    def but_it_searches_again_when_a_sectPr_is_removed(self):
+        document = element('w:document/w:body/(w:p/w:pPr/w:sectPr,w:sectPr)')
+        assert len(document.sectPr_lst) == 2
+
+        document.body[0].pPr._remove_sectPr()
+
+        assert len(document.sectPr_lst) == 1
+
+    def and_it_searches_again_when_a_sectPr_paragraph_is_removed_by_lxml(self):
+        document = element(
+            'w:document/w:body/(w:p/w:pPr/w:sectPr/w:headerReference'
+            '{w:type=default,r:id=rId1},w:sectPr)'
+        )
+        assert len(document.sectPr_lst) == 2
+        assert len(document.hdrftr_rIds) == 2
+        p = document.body[0]
+
+        p.getparent().remove(p)
+
+        assert document.sectPr_lst == [document.body[-1]]
+        assert document.hdrftr_rIds == [{}]
+
+    def it_knows_the_header_and_footer_rIds_in_effect_for_each_section(self):
+        document = element(
+            'w:document/w:body/('
+            'w:p/w:pPr/w:sectPr/w:headerReference{w:type=default,r:id=rId1},'
+            'w:p/w:pPr/w:sectPr,'
+            'w:sectPr/(w:headerReference{w:type=default,r:id=rId2},'
+            'w:footerReference{w:type=first,r:id=rId3}))'
+        )
+        header_key = (qn('w:headerReference'), WD_HEADER_FOOTER.PRIMARY)
+        footer_key = (qn('w:footerReference'), WD_HEADER_FOOTER.FIRST_PAGE)
+
+        hdrftr_rIds = document.hdrftr_rIds
+
+        assert hdrftr_rIds == [
+            {header_key: 'rId1'},
+            {header_key: 'rId1'},
+            {header_key: 'rId2', footer_key: 'rId3'},
+        ]
+        assert document.hdrftr_rIds is hdrftr_rIds
+
+    def it_knows_its_last_sectPr(self, last_sectPr_fixture):
+        document, expected_xpath = last_sectPr_fixture
+        expected_value = (
+            None if expected_xpath is None else document.xpath(expected_xpath)[0]
+        )
+        note_content_change(document)
+
+        assert document.last_sectPr is expected_value
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        ('w:document', None),
+        ('w:document/w:body', None),
+        ('w:document/w:body/w:p', None),
+        ('w:document/w:body/(w:p/w:pPr/w:sectPr,w:sectPr)', 'w:body/w:sectPr'),
+        ('w:document/w:body/(w:p/w:pPr/w:sectPr,w:p)', 'w:body/w:p/w:pPr/w:sectPr'),
+    ])
+    def last_sectPr_fixture(self, request):
+        document_cxml, expected_xpath = request.param
+        return element(document_cxml), expected_xpath
+
+
 class DescribeCT_Body(object):
 
     def it_can_clear_all_its_content(self, clear_fixture):
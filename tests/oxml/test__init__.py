@@ -6,15 +6,73 @@ Test suite for pptx.oxml.__init__.py module, primarily XML parser-related.
 
 from __future__ import print_function, unicode_literals
 
+import threading
+
 import pytest
 
 from lxml import etree
 
+from docx import oxml
 from docx.oxml import (
-    OxmlElement, oxml_parser, parse_xml, register_element_cls
+    OxmlElement, clone_prototype, compiled_xpath, parse_xml,
+    register_element_cls, thread_parser
 )
-from docx.oxml.ns import qn
+from docx.oxml.ns import nsmap, qn
 from docx.oxml.shared import BaseOxmlElement
+from docx.oxml.text.paragraph import CT_P
+
+
+class DescribeClonePrototype(object):
+
+    def it_parses_the_prototype_only_once(self):
+        load_calls = []
+
+        def load_xml():
+            load_calls.append(None)
+            return '<w:p xmlns:w="%s"><w:r/></w:p>' % nsmap['w']
+
+        p = clone_prototype('test:w:p/w:r', load_xml)
+        p.append(OxmlElement('w:r'))
+        p_2 = clone_prototype('test:w:p/w:r', load_xml)
+
+        assert len(load_calls) == 1
+        assert p_2 is not p
+        assert isinstance(p_2, CT_P)
+        assert len(p_2) == 1
+
+
+class DescribeCompiledXpath(object):
+
+    def it_compiles_each_expression_once(self):
+        xpath = compiled_xpath('./w:r[@w:rsidR=$rsid]')
+        assert compiled_xpath('./w:r[@w:rsidR=$rsid]') is xpath
+        assert isinstance(xpath, etree.XPath)
+
+    def but_it_compiles_a_separate_one_for_each_thread(self):
+        xpath = compiled_xpath('./w:r')
+        results = []
+
+        def compile_():
+            results.append((compiled_xpath('./w:r'), compiled_xpath('./w:r')))
+
+        thread = threading.Thread(target=compile_)
+        thread.start()
+        thread.join()
+
+        thread_xpath, same_xpath = results[0]
+        assert same_xpath is thread_xpath
+        assert thread_xpath is not xpath
+        assert compiled_xpath('./w:r') is xpath
+
+    def it_binds_xpath_variables_to_keyword_arguments(self):
+        p = parse_xml(
+            '<w:p xmlns:w="%s"><w:r w:rsidR="1"/><w:r w:rsidR=\'"2"\'/></w:p>'
+            % nsmap['w']
+        )
+        xpath = compiled_xpath('./w:r[@w:rsidR=$rsid]')
+        assert xpath(p, rsid='1') == [p[0]]
+        assert xpath(p, rsid='"2"') == [p[1]]
+        assert p.xpath('./w:r[@w:rsidR=$rsid]', rsid='"2"') == [p[1]]
 
 
 class DescribeOxmlElement(object):
@@ -46,7 +104,7 @@ class DescribeOxmlParser(object):
 
     def it_strips_whitespace_between_elements(self, whitespace_fixture):
         pretty_xml_text, stripped_xml_text = whitespace_fixture
-        element = etree.fromstring(pretty_xml_text, oxml_parser)
+        element = etree.fromstring(pretty_xml_text, thread_parser())
         xml_text = etree.tostring(element, encoding='unicode')
         assert xml_text == stripped_xml_text
 
@@ -120,6 +178,41 @@ class DescribeRegisterElementCls(object):
         )
 
 
+class DescribeThreadParser(object):
+
+    def it_provides_a_separate_parser_for_each_thread(self):
+        results = []
+
+        def parse():
+            results.append((thread_parser(), thread_parser(), parse_xml(
+                '<w:p xmlns:w="%s"><w:r/></w:p>' % nsmap['w']
+            )))
+
+        thread = threading.Thread(target=parse)
+        thread.start()
+        thread.join()
+
+        parser, same_parser, p = results[0]
+        assert same_parser is parser
+        assert parser is not thread_parser()
+        assert type(p) is CT_P
+
+    def it_resolves_the_deprecated_oxml_parser_in_the_calling_thread(self):
+        results = []
+
+        def get_oxml_parser():
+            with pytest.warns(DeprecationWarning):
+                results.append((oxml.oxml_parser, thread_parser()))
+
+        thread = threading.Thread(target=get_oxml_parser)
+        thread.start()
+        thread.join()
+
+        oxml_parser, parser = results[0]
+        assert oxml_parser is parser
+        assert oxml_parser is not thread_parser()
+
+
 # ===========================================================================
 # static fixture
 # ===========================================================================
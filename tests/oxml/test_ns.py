@@ -8,7 +8,7 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 import pytest
 
-from docx.oxml.ns import NamespacePrefixedTag
+from docx.oxml.ns import NamespacePrefixedTag, qn
 
 
 class DescribeNamespacePrefixedTag(object):
@@ -38,6 +38,11 @@ class DescribeNamespacePrefixedTag(object):
     def it_knows_its_namespace_uri(self, nsptag, namespace_uri_a):
         assert nsptag.nsuri == namespace_uri_a
 
+    def it_is_created_once_for_each_tag(self, nsptag_str, clark_name):
+        nsptag = NamespacePrefixedTag(nsptag_str)
+        assert NamespacePrefixedTag(nsptag_str) is nsptag
+        assert NamespacePrefixedTag.from_clark_name(clark_name) is nsptag
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -59,3 +64,19 @@ class DescribeNamespacePrefixedTag(object):
     @pytest.fixture
     def nsptag_str(self, local_part):
         return 'a:%s' % local_part
+
+
+class DescribeQn(object):
+
+    def it_converts_a_prefixed_tag_to_a_clark_name(self):
+        assert qn('w:p') == (
+            '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}p'
+        )
+
+    def it_computes_each_clark_name_once(self):
+        tag = 'w:%s' % 'qnCached'
+        assert qn(tag) is qn('w:%s' % 'qnCached')
+
+    def it_raises_on_an_unknown_namespace_prefix(self):
+        with pytest.raises(KeyError):
+            qn('foo:bar')
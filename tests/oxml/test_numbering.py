@@ -0,0 +1,112 @@
+# encoding: utf-8
+
+"""Test suite for the docx.oxml.numbering module"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import pytest
+
+from docx.oxml.numbering import CT_AbstractNum
+
+from ..unitutil.cxml import element
+
+
+class DescribeCT_AbstractNum(object):
+
+    def it_can_create_a_new_abstractNum_element(self):
+        abstractNum = CT_AbstractNum.new(3, "Foo")
+
+        assert abstractNum.abstractNumId == 3
+        assert abstractNum.name_val == "Foo"
+        assert abstractNum.xpath("w:lvl/@w:ilvl") == [str(n) for n in range(9)]
+        assert abstractNum.xpath("w:lvl/w:numFmt/@w:val")[:4] == [
+            "decimal", "lowerLetter", "lowerRoman", "decimal"
+        ]
+
+    def and_each_new_element_is_a_separate_copy(self):
+        abstractNum = CT_AbstractNum.new(1, "Foo")
+        other = CT_AbstractNum.new(2, "Bar")
+
+        assert other is not abstractNum
+        assert abstractNum.abstractNumId == 1
+        assert abstractNum.name_val == "Foo"
+
+
+class DescribeCT_Numbering(object):
+
+    @pytest.mark.parametrize(
+        "numbering_cxml, expected_value",
+        [
+            ("w:numbering", 1),
+            ("w:numbering/w:num{w:numId=1}/w:abstractNumId{w:val=0}", 2),
+            (
+                "w:numbering/(w:num{w:numId=1}/w:abstractNumId{w:val=0},"
+                "w:num{w:numId=3}/w:abstractNumId{w:val=0})",
+                2,
+            ),
+        ],
+    )
+    def it_allocates_the_first_unused_numId(self, numbering_cxml, expected_value):
+        numbering = element(numbering_cxml)
+        assert numbering.add_num(0).numId == expected_value
+
+    def it_can_add_an_abstractNum_having_the_first_unused_id(self):
+        numbering = element(
+            "w:numbering/(w:abstractNum{w:abstractNumId=0},"
+            "w:num{w:numId=1}/w:abstractNumId{w:val=0})"
+        )
+
+        abstractNum = numbering.add_abstractNum("Foo")
+
+        assert abstractNum.abstractNumId == 1
+        assert numbering.abstractNum_lst == [numbering[0], abstractNum]
+        assert numbering[2].tag == numbering.num_lst[0].tag
+        assert numbering.abstractNum_having_name("Foo") is abstractNum
+        assert numbering.abstractNum_having_name("Bar") is None
+
+    def it_can_find_a_num_by_numId(self):
+        numbering = element(
+            "w:numbering/(w:num{w:numId=4}/w:abstractNumId{w:val=0},"
+            "w:num{w:numId=2}/w:abstractNumId{w:val=1})"
+        )
+        assert numbering.num_having_numId(2) is numbering[1]
+        assert numbering.num_referencing(0) is numbering[0]
+        assert numbering.num_referencing(9) is None
+        with pytest.raises(KeyError):
+            numbering.num_having_numId(1)
+
+    def it_can_add_a_num_restarting_the_numbering_of_another(self):
+        numbering = element("w:numbering/w:num{w:numId=1}/w:abstractNumId{w:val=5}")
+
+        num = numbering.add_restarted_num(1, [0, 2])
+
+        assert num.numId == 2
+        assert num.abstractNumId.val == 5
+        assert num.xpath("w:lvlOverride/@w:ilvl") == ["0", "2"]
+        assert num.xpath("w:lvlOverride/w:startOverride/@w:val") == ["1", "1"]
+
+    def it_keeps_its_index_current_when_changed_directly(self):
+        numbering = element("w:numbering/w:num{w:numId=1}/w:abstractNumId{w:val=0}")
+        num = numbering.num_having_numId(1)
+
+        num.numId = 7
+        assert numbering.num_having_numId(7) is num
+        with pytest.raises(KeyError):
+            numbering.num_having_numId(1)
+
+        numbering.remove(num)
+        assert numbering.add_num(0).numId == 1
+
+    def it_does_not_rebuild_its_index_on_a_miss(self):
+        numbering = element(
+            "w:numbering/(w:abstractNum{w:abstractNumId=0}/w:name{w:val=Foo},"
+            "w:num{w:numId=1}/w:abstractNumId{w:val=0})"
+        )
+        index = numbering._numbering_index
+
+        with pytest.raises(KeyError):
+            numbering.num_having_numId(9)
+        assert numbering.num_referencing(9) is None
+        assert numbering.abstractNum_having_name("Bar") is None
+
+        assert numbering._numbering_index is index
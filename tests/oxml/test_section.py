@@ -0,0 +1,83 @@
+# encoding: utf-8
+
+"""Test suite for the docx.oxml.section module"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import pytest
+
+from docx.enum.section import WD_HEADER_FOOTER
+from docx.oxml.ns import qn
+
+from ..unitutil.cxml import element
+
+
+class DescribeCT_SectPr(object):
+
+    @pytest.mark.parametrize(
+        "root_cxml",
+        [
+            "w:document/w:body/(w:p/w:pPr/w:sectPr,w:sectPr)",
+            "w:body/(w:p/w:pPr/w:sectPr,w:sectPr)",
+        ],
+    )
+    def it_knows_the_first_sectPr_in_the_document(self, root_cxml):
+        root = element(root_cxml)
+        sectPrs = root.xpath("//w:sectPr")
+
+        assert [sectPr.first_sectPr for sectPr in sectPrs] == [sectPrs[0]] * 2
+
+    def and_it_is_the_first_sectPr_when_it_is_not_in_a_document(self):
+        sectPr = element("w:sectPr")
+        assert sectPr.first_sectPr is sectPr
+
+    def it_knows_its_header_and_footer_rIds(self):
+        sectPr = element(
+            "w:sectPr/(w:headerReference{w:type=default,r:id=rId1},"
+            "w:footerReference{w:type=even,r:id=rId2},w:pgSz)"
+        )
+        assert sectPr.hdrftr_rIds == {
+            (qn("w:headerReference"), WD_HEADER_FOOTER.PRIMARY): "rId1",
+            (qn("w:footerReference"), WD_HEADER_FOOTER.EVEN_PAGE): "rId2",
+        }
+
+    @pytest.mark.parametrize(
+        "root_cxml",
+        [
+            "w:document/w:body/("
+            "w:p/w:pPr/w:sectPr/w:headerReference{w:type=default,r:id=rId1},"
+            "w:p/w:pPr/w:sectPr/w:footerReference{w:type=default,r:id=rId2},"
+            "w:sectPr)",
+            "w:body/("
+            "w:p/w:pPr/w:sectPr/w:headerReference{w:type=default,r:id=rId1},"
+            "w:p/w:pPr/w:sectPr/w:footerReference{w:type=default,r:id=rId2},"
+            "w:sectPr)",
+        ],
+    )
+    def it_knows_the_header_or_footer_it_inherits(self, root_cxml):
+        root = element(root_cxml)
+        sectPrs = root.xpath("//w:sectPr")
+        PRIMARY, EVEN_PAGE = WD_HEADER_FOOTER.PRIMARY, WD_HEADER_FOOTER.EVEN_PAGE
+
+        assert [
+            sectPr.prior_hdrftr_rId("w:headerReference", PRIMARY) for sectPr in sectPrs
+        ] == [None, "rId1", "rId1"]
+        assert [
+            sectPr.prior_hdrftr_rId("w:footerReference", PRIMARY) for sectPr in sectPrs
+        ] == [None, None, "rId2"]
+        assert sectPrs[2].prior_hdrftr_rId("w:headerReference", EVEN_PAGE) is None
+
+    @pytest.mark.parametrize(
+        "root_cxml",
+        [
+            "w:document/w:body/(w:p/w:pPr/w:sectPr,w:p/w:pPr/w:sectPr,w:sectPr)",
+            "w:body/(w:p/w:pPr/w:sectPr,w:p/w:pPr/w:sectPr,w:sectPr)",
+        ],
+    )
+    def it_knows_the_sectPr_preceding_it(self, root_cxml):
+        root = element(root_cxml)
+        sectPrs = root.xpath("//w:sectPr")
+
+        preceding_sectPrs = [sectPr.preceding_sectPr for sectPr in sectPrs]
+
+        assert preceding_sectPrs == [None, sectPrs[0], sectPrs[1]]
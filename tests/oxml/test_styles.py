@@ -15,6 +15,42 @@ from docx.enum.style import WD_STYLE_TYPE
 from ..unitutil.cxml import element, xml
 
 
+class DescribeCT_LatentStyles(object):
+
+    def it_can_get_an_lsdException_by_name(self):
+        latentStyles = element(
+            'w:latentStyles/(w:lsdException{w:name=Foo},w:lsdException{w:name'
+            '=Bar},w:lsdException{w:name=Foo})'
+        )
+        assert latentStyles.get_by_name('Foo') is latentStyles[0]
+        assert latentStyles.get_by_name('Bar') is latentStyles[1]
+        assert latentStyles.get_by_name('Baz') is None
+
+    def and_it_finds_the_next_one_when_the_indexed_one_is_renamed(self):
+        latentStyles = element(
+            'w:latentStyles/(w:lsdException{w:name=Foo},w:lsdException{w:name'
+            '=Foo})'
+        )
+        assert latentStyles.get_by_name('Foo') is latentStyles[0]
+
+        latentStyles[0].name = 'Bar'
+
+        assert latentStyles.get_by_name('Foo') is latentStyles[1]
+        assert latentStyles.get_by_name('Bar') is latentStyles[0]
+
+    def it_can_add_an_lsdException_having_a_name(self):
+        latentStyles = element('w:latentStyles/w:lsdException{w:name=Foo}')
+        assert latentStyles.get_by_name('Bar') is None
+
+        lsdException = latentStyles.add_lsdException_named('Bar')
+
+        assert latentStyles.xml == xml(
+            'w:latentStyles/(w:lsdException{w:name=Foo},w:lsdException{w:nam'
+            'e=Bar})'
+        )
+        assert latentStyles.get_by_name('Bar') is lsdException
+
+
 class DescribeCT_Styles(object):
 
     def it_can_add_a_style_of_type(self, add_fixture):
@@ -23,6 +59,98 @@ class DescribeCT_Styles(object):
         assert styles.xml == expected_xml
         assert style is styles[-1]
 
+    def it_can_get_a_style_by_id(self, get_by_id_fixture):
+        styles, styleId, expected_idx = get_by_id_fixture
+        style = styles.get_by_id(styleId)
+        expected = None if expected_idx is None else styles[expected_idx]
+        assert style is expected
+
+    def it_can_get_a_style_by_name(self, get_by_name_fixture):
+        styles, name, expected_idx = get_by_name_fixture
+        style = styles.get_by_name(name)
+        expected = None if expected_idx is None else styles[expected_idx]
+        assert style is expected
+
+    def it_can_resolve_the_effective_run_properties(self, eff_r_fixture):
+        styles, r, expected_xml = eff_r_fixture
+        effective_r = styles.effective_r(r)
+        assert effective_r.xml == expected_xml
+
+    def it_can_resolve_the_effective_paragraph_properties(self, eff_p_fixture):
+        styles, p, expected_xml = eff_p_fixture
+        effective_p = styles.effective_p(p)
+        assert effective_p.xml == expected_xml
+
+    def it_knows_the_numId_of_a_paragraph_style(self, numId_fixture):
+        styles, style_id, expected_value = numId_fixture
+        assert styles.numId_of(style_id) == expected_value
+
+    def it_applies_the_default_table_style_only_within_a_table(self):
+        styles = element(
+            'w:styles/w:style{w:type=table,w:default=1,w:styleId=TableNormal'
+            '}/(w:pPr/(w:jc{w:val=center},w:numPr/w:numId{w:val=3}),w:rPr/w:b'
+            ')'
+        )
+        body = element('w:body/(w:p/w:r,w:tbl/(w:tblPr,w:tr/w:tc/w:p/w:r))')
+        body_p, tbl_p = body.xpath('.//w:p')
+        body_r, tbl_r = body.xpath('.//w:r')
+
+        assert styles.effective_p(body_p).xml == xml('w:p/w:pPr')
+        assert styles.effective_r(body_r).xml == xml('w:r/w:rPr')
+        assert styles.numId_of(None) is None
+        assert styles.effective_p(tbl_p).xpath('w:pPr/w:jc/@w:val') == [
+            'center'
+        ]
+        assert styles.effective_r(tbl_r).xml == xml('w:r/w:rPr/w:b')
+
+    def it_resolves_formatting_against_current_styles(self):
+        styles = element(
+            'w:styles/(w:style{w:type=paragraph,w:styleId=Foo}/w:rPr/w:b,w:s'
+            'tyle{w:type=paragraph,w:styleId=Bar}/w:rPr/w:i)'
+        )
+        p = element('w:p/(w:pPr/w:pStyle{w:val=Foo},w:r)')
+        r = p[1]
+        assert styles.effective_r(r).xml == xml('w:r/w:rPr/w:b')
+
+        styles[0].delete()
+        assert styles.effective_r(r).xml == xml('w:r/w:rPr')
+
+        styles[0].styleId = 'Foo'
+        assert styles.effective_r(r).xml == xml('w:r/w:rPr/w:i')
+
+    def it_keeps_its_style_index_current(self):
+        styles = element(
+            'w:styles/(w:style{w:styleId=Foo}/w:name{w:val=Foo},w:style{w:st'
+            'yleId=Bar}/w:name{w:val=Bar})'
+        )
+        foo, bar = styles[0], styles[1]
+        assert styles.get_by_name('Foo') is foo
+
+        foo.name_val = 'Baz'
+        assert styles.get_by_name('Foo') is None
+        assert styles.get_by_name('Baz') is foo
+
+        bar.delete()
+        assert styles.get_by_id('Bar') is None
+
+        new_style = styles.add_style_of_type('Bar', WD_STYLE_TYPE.PARAGRAPH,
+                                             False)
+        assert styles.get_by_id('Bar') is new_style
+        assert styles.get_by_name('Bar') is new_style
+
+        new_style.styleId = 'Qux'
+        assert styles.get_by_id('Bar') is None
+        assert styles.get_by_id('Qux') is new_style
+
+    def it_does_not_rebuild_its_style_index_on_a_miss(self):
+        styles = element('w:styles/w:style{w:styleId=Foo}/w:name{w:val=Foo}')
+        style_index = styles._style_index
+
+        assert styles.get_by_id('Missing') is None
+        assert styles.get_by_name('Missing') is None
+        assert styles.get_by_id('Foo') is styles[0]
+        assert styles._style_index is style_index
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture(params=[
@@ -38,3 +166,138 @@ class DescribeCT_Styles(object):
         styles = element(styles_cxml)
         expected_xml = xml(expected_cxml)
         return styles, name, style_type, builtin, expected_xml
+
+    @pytest.fixture(params=[
+        # ---document defaults---
+        ('w:styles/w:docDefaults/w:pPrDefault/w:pPr/w:jc{w:val=center}',
+         'w:p', 'w:p/w:pPr/w:jc{w:val=center}'),
+        # ---default paragraph style and its base style---
+        ('w:styles/(w:style{w:type=paragraph,w:default=1,w:styleId=A}/(w:ba'
+         'sedOn{w:val=B},w:pPr/w:ind{w:left=720}),w:style{w:type=paragraph,'
+         'w:styleId=B}/w:pPr/(w:keepNext,w:ind{w:firstLine=360}))',
+         'w:p',
+         'w:p/w:pPr/(w:keepNext,w:ind{w:firstLine=360,w:left=720})'),
+        # ---direct formatting overrides style---
+        ('w:styles/w:style{w:type=paragraph,w:styleId=A}/w:pPr/(w:ind{w:fi'
+         'rstLine=360},w:jc{w:val=center})',
+         'w:p/w:pPr/(w:pStyle{w:val=A},w:ind{w:hanging=180})',
+         'w:p/w:pPr/(w:ind{w:hanging=180},w:jc{w:val=center})'),
+    ])
+    def eff_p_fixture(self, request):
+        styles_cxml, p_cxml, expected_cxml = request.param
+        return element(styles_cxml), element(p_cxml), xml(expected_cxml)
+
+    @pytest.fixture(params=[
+        # ---nothing defined anywhere---
+        ('w:styles', 'w:p/w:r', 'w:r/w:rPr'),
+        # ---document defaults---
+        ('w:styles/w:docDefaults/w:rPrDefault/w:rPr/w:sz{w:val=24}',
+         'w:p/w:r', 'w:r/w:rPr/w:sz{w:val=24}'),
+        # ---paragraph style overrides defaults---
+        ('w:styles/(w:docDefaults/w:rPrDefault/w:rPr/w:sz{w:val=24},w:style'
+         '{w:type=paragraph,w:styleId=A}/w:rPr/w:sz{w:val=32})',
+         'w:p/(w:pPr/w:pStyle{w:val=A},w:r)', 'w:r/w:rPr/w:sz{w:val=32}'),
+        # ---character style and direct formatting---
+        ('w:styles/(w:style{w:type=paragraph,w:styleId=A}/w:rPr/(w:b,w:i),w'
+         ':style{w:type=character,w:styleId=C}/w:rPr/(w:i{w:val=0},w:sz{w:v'
+         'al=20}))',
+         'w:p/(w:pPr/w:pStyle{w:val=A},w:r/w:rPr/(w:rStyle{w:val=C},w:u{w:v'
+         'al=single}))',
+         'w:r/w:rPr/(w:b,w:i,w:sz{w:val=20},w:u{w:val=single})'),
+        # ---a toggle property on in two style layers cancels out---
+        ('w:styles/(w:style{w:type=paragraph,w:styleId=A}/w:rPr/(w:i,w:caps'
+         '),w:style{w:type=character,w:styleId=C}/w:rPr/(w:i,w:caps{w:val=0'
+         '}))',
+         'w:p/(w:pPr/w:pStyle{w:val=A},w:r/w:rPr/w:rStyle{w:val=C})',
+         'w:r/w:rPr/(w:i{w:val=0},w:caps)'),
+        # ---toggle properties cancel across the table style layer too---
+        ('w:styles/(w:style{w:type=table,w:styleId=T}/w:rPr/(w:b,w:strike),'
+         'w:style{w:type=paragraph,w:styleId=A}/w:rPr/w:b,w:style{w:type=ch'
+         'aracter,w:styleId=C}/w:rPr/w:strike)',
+         'w:tbl/(w:tblPr/w:tblStyle{w:val=T},w:tr/w:tc/w:p/(w:pPr/w:pStyle{'
+         'w:val=A},w:r/w:rPr/w:rStyle{w:val=C}))',
+         'w:r/w:rPr/(w:b{w:val=0},w:strike{w:val=0})'),
+        # ---three layers set a toggle property on, which leaves it on---
+        ('w:styles/(w:style{w:type=table,w:styleId=T}/w:rPr/w:b,w:style{w:'
+         'type=paragraph,w:styleId=A}/w:rPr/w:b,w:style{w:type=character,w:'
+         'styleId=C}/w:rPr/w:b)',
+         'w:tbl/(w:tblPr/w:tblStyle{w:val=T},w:tr/w:tc/w:p/(w:pPr/w:pStyle{'
+         'w:val=A},w:r/w:rPr/w:rStyle{w:val=C}))',
+         'w:r/w:rPr/w:b'),
+        # ---a based-on style overrides, and direct formatting replaces---
+        ('w:styles/(w:style{w:type=paragraph,w:styleId=A}/w:rPr/w:i,w:style'
+         '{w:type=paragraph,w:styleId=B}/(w:basedOn{w:val=A},w:rPr/w:i),w:s'
+         'tyle{w:type=character,w:styleId=C}/w:rPr/(w:i,w:b))',
+         'w:p/(w:pPr/w:pStyle{w:val=B},w:r/w:rPr/(w:rStyle{w:val=C},w:i))',
+         'w:r/w:rPr/(w:b,w:i)'),
+        # ---a document default is replaced, not toggled, by a style---
+        ('w:styles/(w:docDefaults/w:rPrDefault/w:rPr/w:b,w:style{w:type=pa'
+         'ragraph,w:styleId=A}/w:rPr/w:b)',
+         'w:p/(w:pPr/w:pStyle{w:val=A},w:r)', 'w:r/w:rPr/w:b'),
+        # ---table style applies under the paragraph style---
+        ('w:styles/(w:style{w:type=table,w:styleId=T}/w:rPr/(w:b,w:sz{w:val'
+         '=20}),w:style{w:type=paragraph,w:default=1,w:styleId=A}/w:rPr/w:s'
+         'z{w:val=22})',
+         'w:tbl/(w:tblPr/w:tblStyle{w:val=T},w:tr/w:tc/w:p/w:r)',
+         'w:r/w:rPr/(w:b,w:sz{w:val=22})'),
+        # ---rFonts attributes merge individually---
+        ('w:styles/w:docDefaults/w:rPrDefault/w:rPr/w:rFonts{w:ascii=Foo,w:'
+         'hAnsi=Foo}',
+         'w:p/w:r/w:rPr/w:rFonts{w:ascii=Bar}',
+         'w:r/w:rPr/w:rFonts{w:ascii=Bar,w:hAnsi=Foo}'),
+        # ---cyclic basedOn chain is tolerated---
+        ('w:styles/(w:style{w:type=paragraph,w:styleId=A}/(w:basedOn{w:val='
+         'B},w:rPr/w:b),w:style{w:type=paragraph,w:styleId=B}/(w:basedOn{w:'
+         'val=A},w:rPr/w:i))',
+         'w:p/(w:pPr/w:pStyle{w:val=A},w:r)', 'w:r/w:rPr/(w:b,w:i)'),
+    ])
+    def eff_r_fixture(self, request):
+        styles_cxml, p_cxml, expected_cxml = request.param
+        p = element(p_cxml)
+        r = next(p.iter('{*}r'))
+        return element(styles_cxml), r, xml(expected_cxml)
+
+    @pytest.fixture(params=[
+        ('w:styles',                                              'Foo', None),
+        ('w:styles/w:style{w:styleId=Foo}',                       'Foo', 0),
+        ('w:styles/(w:style{w:styleId=Bar},w:style{w:styleId=Foo})', 'Foo', 1),
+        ('w:styles/(w:style{w:styleId=Foo},w:style{w:styleId=Foo})', 'Foo', 0),
+        ('w:styles/w:style{w:styleId=Foo}',                       'Bar', None),
+    ])
+    def get_by_id_fixture(self, request):
+        styles_cxml, styleId, expected_idx = request.param
+        return element(styles_cxml), styleId, expected_idx
+
+    @pytest.fixture(params=[
+        ('w:styles',                                     'Foo',   None),
+        ('w:styles/w:style/w:name{w:val=Foo}',           'Foo',   0),
+        ('w:styles/(w:style,w:style/w:name{w:val=Foo})', 'Foo',   1),
+        ('w:styles/w:style/w:name{w:val=Foo}',           'Bar',   None),
+        ('w:styles/w:style',                             'a"b\'c', 0),
+    ])
+    def get_by_name_fixture(self, request):
+        styles_cxml, name, expected_idx = request.param
+        styles = element(styles_cxml)
+        if expected_idx is not None and styles[expected_idx].name is None:
+            styles[expected_idx].name_val = name
+        return styles, name, expected_idx
+
+    @pytest.fixture(params=[
+        ('w:styles/w:style{w:type=paragraph,w:styleId=A}', 'A', None),
+        ('w:styles/w:style{w:type=paragraph,w:styleId=A}/w:pPr/w:numPr/w:nu'
+         'mId{w:val=4}', 'A', 4),
+        # ---inherited from base style---
+        ('w:styles/(w:style{w:type=paragraph,w:styleId=A}/w:basedOn{w:val=B'
+         '},w:style{w:type=paragraph,w:styleId=B}/w:pPr/w:numPr/w:numId{w:v'
+         'al=2})', 'A', 2),
+        # ---numId 0 removes numbering---
+        ('w:styles/(w:style{w:type=paragraph,w:styleId=A}/(w:basedOn{w:val='
+         'B},w:pPr/w:numPr/w:numId{w:val=0}),w:style{w:type=paragraph,w:sty'
+         'leId=B}/w:pPr/w:numPr/w:numId{w:val=2})', 'A', None),
+        # ---default paragraph style---
+        ('w:styles/w:style{w:type=paragraph,w:default=1,w:styleId=A}/w:pPr/'
+         'w:numPr/w:numId{w:val=3}', None, 3),
+    ])
+    def numId_fixture(self, request):
+        styles_cxml, style_id, expected_value = request.param
+        return element(styles_cxml), style_id, expected_value
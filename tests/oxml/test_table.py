@@ -8,7 +8,8 @@ import pytest
 
 from docx.exceptions import InvalidSpanError
 from docx.oxml import parse_xml
-from docx.oxml.table import CT_Row, CT_Tc
+from docx.oxml.table import CT_Row, CT_Tbl, CT_Tc
+from docx.shared import Inches
 
 from ..unitutil.cxml import element, xml
 from ..unitutil.file import snippet_seq
@@ -49,6 +50,38 @@ class DescribeCT_Row(object):
         return tr, col_idx
 
 
+class DescribeCT_Tbl(object):
+
+    def it_can_construct_a_new_tbl(self, new_fixture):
+        rows, cols, width, expected_twips = new_fixture
+        tbl = CT_Tbl.new_tbl(rows, cols, width)
+        assert tbl.xpath('w:tblPr/w:tblW/@w:type') == ['auto']
+        assert tbl.xpath('w:tblGrid/w:gridCol/@w:w') == expected_twips
+        assert len(tbl.tr_lst) == rows
+        for tr in tbl.tr_lst:
+            assert tr.xpath('w:tc/w:tcPr/w:tcW/@w:w') == expected_twips
+            assert len(tr.xpath('w:tc/w:p')) == cols
+
+    def it_constructs_each_tbl_independently(self):
+        tbl = CT_Tbl.new_tbl(1, 1, Inches(1))
+        tbl.tr_lst[0].tc_lst[0].width = Inches(2)
+        other_tbl = CT_Tbl.new_tbl(1, 1, Inches(1))
+        assert other_tbl.xpath('w:tr/w:tc/w:tcPr/w:tcW/@w:w') == ['1440']
+        assert other_tbl.tr_lst[0] is not tbl.tr_lst[0]
+
+    # fixtures -------------------------------------------------------
+
+    @pytest.fixture(params=[
+        (0, 0, Inches(1), []),
+        (0, 2, Inches(2), ['1440', '1440']),
+        (1, 1, Inches(1), ['1440']),
+        (3, 2, Inches(1), ['720', '720']),
+    ])
+    def new_fixture(self, request):
+        rows, cols, width, expected_twips = request.param
+        return rows, cols, width, expected_twips
+
+
 class DescribeCT_Tc(object):
 
     def it_can_merge_to_another_tc(
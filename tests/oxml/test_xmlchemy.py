@@ -16,10 +16,12 @@ from docx.oxml.simpletypes import BaseIntType
 from docx.oxml.xmlchemy import (
     BaseOxmlElement, Choice, serialize_for_reading, OneOrMore, OneAndOnlyOne,
     OptionalAttribute, RequiredAttribute, ZeroOrMore, ZeroOrOne,
-    ZeroOrOneChoice, XmlString
+    ZeroOrOneChoice, XmlString, content_revision, note_content_change
 )
 
 from ..unitdata import BaseBuilder
+from ..unitutil.cxml import element
+from ..unitutil.mock import function_mock
 from .unitdata.text import a_b, a_u, an_i, an_rPr
 
 
@@ -65,6 +67,7 @@ class DescribeBaseOxmlElement(object):
         ('',   'b', 'iu', 'b'),
         ('bu', 'i', 'u',  'biu'),
         ('bi', 'u', '',   'biu'),
+        ('iu', 'b', 'ui', 'biu'),
     ])
     def insert_fixture(self, request):
         present, new, successors, after = request.param
@@ -108,6 +111,41 @@ class DescribeBaseOxmlElement(object):
         return rPr_bldr
 
 
+class DescribeContentRevision(object):
+
+    def it_changes_each_time_a_content_change_is_noted(self):
+        document = element('w:document/w:body/w:p')
+        revisions = [content_revision(document)]
+        for _ in range(3):
+            note_content_change(document[0][0])
+            revisions.append(content_revision(document))
+        assert len(set(revisions)) == 4
+
+    def it_changes_when_a_child_is_added_or_removed_by_a_library_method(self):
+        document = element('w:document/w:body/w:tbl/w:tr/w:tc/w:p')
+        body, p = document[0], document.xpath('.//w:p')[0]
+        revisions = [content_revision(document)]
+
+        p.add_r()
+        revisions.append(content_revision(document))
+        body.get_or_add_sectPr()
+        revisions.append(content_revision(document))
+        body._remove_sectPr()
+        revisions.append(content_revision(document))
+
+        assert len(set(revisions)) == 4
+
+    def but_it_changes_only_for_the_document_that_changed(self):
+        document, other = element('w:document/w:body'), element('w:document/w:body')
+        revision, other_revision = content_revision(document), content_revision(other)
+
+        note_content_change(other[0])
+
+        assert content_revision(document[0]) == revision
+        assert content_revision(other) != other_revision
+        assert revision != other_revision
+
+
 class DescribeSerializeForReading(object):
 
     def it_pretty_prints_an_lxml_element(self, pretty_fixture):
@@ -622,6 +660,18 @@ class DescribeZeroOrOne(object):
         parent._remove_zooChild()
         assert parent.xml == expected_xml
 
+    def it_computes_clark_names_when_the_class_is_created(self, qn_):
+        parent = self.parent_bldr(False).element
+
+        zooChild = parent.get_or_add_zooChild()
+        parent.optAttr = 42
+
+        assert parent.zooChild is zooChild
+        assert parent.optAttr == 42
+        parent._remove_zooChild()
+        assert parent.zooChild is None
+        assert qn_.call_count == 0
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -671,6 +721,10 @@ class DescribeZeroOrOne(object):
 
     # fixture components ---------------------------------------------
 
+    @pytest.fixture
+    def qn_(self, request):
+        return function_mock(request, 'docx.oxml.xmlchemy.qn')
+
     def parent_bldr(self, zooChild_is_present):
         parent_bldr = a_parent().with_nsdecls()
         if zooChild_is_present:
@@ -10,6 +10,8 @@ from __future__ import (
 
 import pytest
 
+from docx.oxml.xmlchemy import content_revision
+
 from ...unitutil.cxml import element, xml
 
 
@@ -20,6 +22,32 @@ class DescribeCT_R(object):
         r.add_t(text)
         assert r.xml == expected_xml
 
+    def it_notes_a_content_change_when_it_adds_a_drawing(self):
+        r = element('w:r')
+        revision = content_revision(r)
+
+        r.add_drawing(element('wp:inline'))
+
+        assert content_revision(r) != revision
+
+    def it_notes_a_content_change_when_it_clears_a_drawing(self):
+        r = element('w:r/(w:rPr,w:t"foo",w:drawing)')
+        revision = content_revision(r)
+
+        r.clear_content()
+
+        assert r.xml == xml('w:r/w:rPr')
+        assert content_revision(r) != revision
+
+    def but_it_does_not_when_it_clears_only_text(self):
+        r = element('w:r/(w:rPr,w:t"foo")')
+        revision = content_revision(r)
+
+        r.clear_content()
+
+        assert r.xml == xml('w:r/w:rPr')
+        assert content_revision(r) == revision
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture(params=[
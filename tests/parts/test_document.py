@@ -10,7 +10,7 @@ from docx.enum.style import WD_STYLE_TYPE
 from docx.opc.constants import RELATIONSHIP_TYPE as RT
 from docx.opc.coreprops import CoreProperties
 from docx.package import Package
-from docx.parts.document import DocumentPart
+from docx.parts.document import DEFAULT_LIST_NAME, DocumentPart
 from docx.parts.hdrftr import FooterPart, HeaderPart
 from docx.parts.numbering import NumberingPart
 from docx.parts.settings import SettingsPart
@@ -20,6 +20,7 @@ from docx.styles.style import BaseStyle
 from docx.styles.styles import Styles
 
 from ..oxml.parts.unitdata.document import a_body, a_document
+from ..unitutil.cxml import element
 from ..unitutil.mock import class_mock, instance_mock, method_mock, property_mock
 
 
@@ -119,18 +120,100 @@ class DescribeDocumentPart(object):
         assert numbering_part is numbering_part_
 
     def and_it_creates_a_numbering_part_if_not_present(
-        self, part_related_by_, relate_to_, NumberingPart_, numbering_part_
+        self, package_, part_related_by_, relate_to_, NumberingPart_, numbering_part_
     ):
         part_related_by_.side_effect = KeyError
         NumberingPart_.new.return_value = numbering_part_
-        document_part = DocumentPart(None, None, None, None)
+        document_part = DocumentPart(None, None, None, package_)
 
         numbering_part = document_part.numbering_part
 
-        NumberingPart_.new.assert_called_once_with()
+        NumberingPart_.new.assert_called_once_with(package_)
         relate_to_.assert_called_once_with(document_part, numbering_part_, RT.NUMBERING)
         assert numbering_part is numbering_part_
 
+    def it_numbers_a_list_using_the_numbering_of_its_style(
+        self, numbering_part_prop_, numbering_part_, _styles_part_prop_, styles_part_
+    ):
+        numbering_part_prop_.return_value = numbering_part_
+        numbering_part_.element = numbering = element(
+            "w:numbering/(w:abstractNum{w:abstractNumId=0},"
+            "w:num{w:numId=1}/w:abstractNumId{w:val=0})"
+        )
+        _styles_part_prop_.return_value = styles_part_
+        styles_part_.element = element(
+            "w:styles/w:style{w:type=paragraph,w:styleId=Foo}/w:pPr/w:numPr/"
+            "w:numId{w:val=1}"
+        )
+        document_part = DocumentPart(None, None, None, None)
+
+        assert document_part.list_numId("Foo", [0], False) == 1
+        assert document_part.list_numId("Foo", [0, 1], True) == 2
+        num = numbering.num_having_numId(2)
+        assert num.abstractNumId.val == 0
+        assert num.xpath("w:lvlOverride/@w:ilvl") == ["0", "1"]
+        assert num.xpath("w:lvlOverride/w:startOverride/@w:val") == ["1", "1"]
+
+    def and_it_continues_the_previous_list_when_not_restarting(
+        self, numbering_part_prop_, numbering_part_, _styles_part_prop_, styles_part_
+    ):
+        numbering_part_prop_.return_value = numbering_part_
+        numbering_part_.element = element(
+            "w:numbering/(w:abstractNum{w:abstractNumId=0},"
+            "w:abstractNum{w:abstractNumId=1},"
+            "w:num{w:numId=1}/w:abstractNumId{w:val=0},"
+            "w:num{w:numId=2}/w:abstractNumId{w:val=1})"
+        )
+        _styles_part_prop_.return_value = styles_part_
+        styles_part_.element = element(
+            "w:styles/(w:style{w:type=paragraph,w:styleId=Foo}/w:pPr/w:numPr/"
+            "w:numId{w:val=1},w:style{w:type=paragraph,w:styleId=Bar}/w:pPr/"
+            "w:numPr/w:numId{w:val=2})"
+        )
+        document_part = DocumentPart(None, None, None, None)
+
+        restarted_numId = document_part.list_numId("Foo", [0], True)
+        document_part.list_numId("Bar", [0], True)
+
+        assert restarted_numId == 3
+        assert document_part.list_numId("Foo", [0], False) == restarted_numId
+        assert document_part.list_numId("Foo", [0], False) == restarted_numId
+
+    def but_it_adds_a_default_numbering_when_its_style_has_none(
+        self, numbering_part_prop_, numbering_part_, _styles_part_prop_, styles_part_
+    ):
+        numbering_part_prop_.return_value = numbering_part_
+        numbering_part_.element = numbering = element("w:numbering")
+        _styles_part_prop_.return_value = styles_part_
+        styles_part_.element = element(
+            "w:styles/w:style{w:type=paragraph,w:styleId=Foo}"
+        )
+        document_part = DocumentPart(None, None, None, None)
+
+        numId = document_part.list_numId("Foo", [0], False)
+        numId_again = document_part.list_numId("Foo", [0], False)
+
+        abstractNum = numbering.abstractNum_having_name(DEFAULT_LIST_NAME)
+        assert abstractNum is not None
+        assert numbering.num_referencing(abstractNum.abstractNumId).numId == numId
+        assert numId_again == numId
+        assert len(numbering.abstractNum_lst) == 1
+
+    def it_can_resolve_effective_formatting(self, _styles_part_prop_, styles_part_):
+        _styles_part_prop_.return_value = styles_part_
+        styles_elm = styles_part_.element
+        styles_elm.effective_p.return_value = "effective_p"
+        styles_elm.effective_r.return_value = "effective_r"
+        document_part = DocumentPart(None, None, None, None)
+
+        effective_p = document_part.effective_p("p")
+        effective_r = document_part.effective_r("r")
+
+        styles_elm.effective_p.assert_called_once_with("p")
+        styles_elm.effective_r.assert_called_once_with("r")
+        assert effective_p == "effective_p"
+        assert effective_r == "effective_r"
+
     def it_can_get_a_style_by_id(self, styles_prop_, styles_, style_):
         styles_prop_.return_value = styles_
         styles_.get_by_id.return_value = style_
@@ -276,6 +359,10 @@ class DescribeDocumentPart(object):
     def numbering_part_(self, request):
         return instance_mock(request, NumberingPart)
 
+    @pytest.fixture
+    def numbering_part_prop_(self, request):
+        return property_mock(request, DocumentPart, 'numbering_part')
+
     @pytest.fixture
     def package_(self, request):
         return instance_mock(request, Package)
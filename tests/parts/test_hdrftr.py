@@ -32,18 +32,18 @@ class DescribeFooterPart(object):
         assert part is footer_part_
 
     def it_can_create_a_new_footer_part(
-        self, package_, _default_footer_xml_, parse_xml_, _init_
+        self, package_, _default_footer_xml_, clone_prototype_, _init_
     ):
         ftr = element("w:ftr")
         package_.next_partname.return_value = "/word/footer24.xml"
-        _default_footer_xml_.return_value = "<w:ftr>"
-        parse_xml_.return_value = ftr
+        clone_prototype_.return_value = ftr
 
         footer_part = FooterPart.new(package_)
 
         package_.next_partname.assert_called_once_with("/word/footer%d.xml")
-        _default_footer_xml_.assert_called_once_with()
-        parse_xml_.assert_called_once_with("<w:ftr>")
+        clone_prototype_.assert_called_once_with(
+            "default-footer.xml", _default_footer_xml_
+        )
         _init_.assert_called_once_with(
             footer_part, "/word/footer24.xml", CT.WML_FOOTER, ftr, package_
         )
@@ -59,6 +59,10 @@ class DescribeFooterPart(object):
 
     # fixture components ---------------------------------------------
 
+    @pytest.fixture
+    def clone_prototype_(self, request):
+        return function_mock(request, "docx.parts.hdrftr.clone_prototype")
+
     @pytest.fixture
     def _default_footer_xml_(self, request):
         return method_mock(request, FooterPart, "_default_footer_xml", autospec=False)
@@ -79,10 +83,6 @@ class DescribeFooterPart(object):
     def package_(self, request):
         return instance_mock(request, Package)
 
-    @pytest.fixture
-    def parse_xml_(self, request):
-        return function_mock(request, "docx.parts.hdrftr.parse_xml")
-
 
 class DescribeHeaderPart(object):
 
@@ -101,18 +101,18 @@ class DescribeHeaderPart(object):
         assert part is header_part_
 
     def it_can_create_a_new_header_part(
-        self, package_, _default_header_xml_, parse_xml_, _init_
+        self, package_, _default_header_xml_, clone_prototype_, _init_
     ):
         hdr = element("w:hdr")
         package_.next_partname.return_value = "/word/header42.xml"
-        _default_header_xml_.return_value = "<w:hdr>"
-        parse_xml_.return_value = hdr
+        clone_prototype_.return_value = hdr
 
         header_part = HeaderPart.new(package_)
 
         package_.next_partname.assert_called_once_with("/word/header%d.xml")
-        _default_header_xml_.assert_called_once_with()
-        parse_xml_.assert_called_once_with("<w:hdr>")
+        clone_prototype_.assert_called_once_with(
+            "default-header.xml", _default_header_xml_
+        )
         _init_.assert_called_once_with(
             header_part, "/word/header42.xml", CT.WML_HEADER, hdr, package_
         )
@@ -128,6 +128,10 @@ class DescribeHeaderPart(object):
 
     # fixture components ---------------------------------------------
 
+    @pytest.fixture
+    def clone_prototype_(self, request):
+        return function_mock(request, "docx.parts.hdrftr.clone_prototype")
+
     @pytest.fixture
     def _default_header_xml_(self, request):
         return method_mock(request, HeaderPart, "_default_header_xml", autospec=False)
@@ -147,7 +151,3 @@ class DescribeHeaderPart(object):
     @pytest.fixture
     def package_(self, request):
         return instance_mock(request, Package)
-
-    @pytest.fixture
-    def parse_xml_(self, request):
-        return function_mock(request, "docx.parts.hdrftr.parse_xml")
@@ -7,6 +7,7 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 import pytest
 
 from docx.image.image import Image
+from docx.opc.blobstore import SpooledBlob
 from docx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
 from docx.opc.packuri import PackURI
 from docx.opc.part import PartFactory
@@ -14,7 +15,9 @@ from docx.package import Package
 from docx.parts.image import ImagePart
 
 from ..unitutil.file import test_file
-from ..unitutil.mock import ANY, initializer_mock, instance_mock, method_mock
+from ..unitutil.mock import (
+    ANY, function_mock, initializer_mock, instance_mock, method_mock
+)
 
 
 class DescribeImagePart(object):
@@ -37,10 +40,26 @@ class DescribeImagePart(object):
         image_part = ImagePart.from_image(image_, partname_)
 
         _init_.assert_called_once_with(
-            ANY, partname_, image_.content_type, image_.blob, image_
+            ANY, partname_, image_.content_type, None, image_
         )
         assert isinstance(image_part, ImagePart)
 
+    def it_gets_its_blob_from_its_image_when_it_has_none(self, image_):
+        image_.blob = b'fO0Bar'
+        assert ImagePart(None, None, None, image_).blob == b'fO0Bar'
+        assert ImagePart(None, None, b'b4z', image_).blob == b'b4z'
+
+    def it_generates_its_blob_in_chunks(self, image_):
+        image_.iter_blob_chunks.return_value = iter([b'fO0', b'Bar'])
+        spooled_blob = SpooledBlob((b'b4z',), None)
+
+        assert list(ImagePart(None, None, None, image_).iter_blob_chunks()) == [
+            b'fO0', b'Bar'
+        ]
+        assert list(ImagePart(None, None, spooled_blob).iter_blob_chunks()) == [
+            b'b4z'
+        ]
+
     def it_knows_its_default_dimensions_in_EMU(self, dimensions_fixture):
         image_part, cx, cy = dimensions_fixture
         assert image_part.default_cx == cx
@@ -55,6 +74,26 @@ class DescribeImagePart(object):
         image_part = ImagePart(None, None, blob)
         assert image_part.sha1 == '4921e7002ddfba690a937d54bda226a7b8bdeb68'
 
+    def it_computes_each_digest_of_its_blob_once(self, request):
+        new_ = function_mock(request, 'docx.parts.image.hashlib.new')
+        new_.return_value.hexdigest.return_value = 'd1935'
+        image_part = ImagePart(None, None, b'fO0Bar')
+
+        digests = [image_part.digest('blake2b') for _ in range(2)]
+
+        new_.assert_called_once_with('blake2b')
+        new_.return_value.update.assert_called_once_with(b'fO0Bar')
+        assert digests == ['d1935', 'd1935']
+
+    def it_uses_the_digest_of_its_image_when_it_has_one(self, image_):
+        image_.digest.return_value = 'd1935'
+        image_part = ImagePart(None, None, None, image_)
+
+        digest = image_part.digest('blake2b')
+
+        image_.digest.assert_called_once_with('blake2b')
+        assert digest == 'd1935'
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -8,6 +8,8 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 import pytest
 
+from docx.opc.constants import CONTENT_TYPE as CT
+from docx.opc.package import OpcPackage
 from docx.oxml.numbering import CT_Numbering
 from docx.parts.numbering import NumberingPart, _NumberingDefinitions
 
@@ -17,6 +19,15 @@ from ..unitutil.mock import class_mock, instance_mock
 
 class DescribeNumberingPart(object):
 
+    def it_can_create_a_new_numbering_part(self, package_):
+        numbering_part = NumberingPart.new(package_)
+
+        assert numbering_part.partname == '/word/numbering.xml'
+        assert numbering_part.content_type == CT.WML_NUMBERING
+        assert isinstance(numbering_part.element, CT_Numbering)
+        assert len(numbering_part.element) == 0
+        assert numbering_part.package is package_
+
     def it_provides_access_to_the_numbering_definitions(
             self, num_defs_fixture):
         (numbering_part, _NumberingDefinitions_, numbering_elm_,
@@ -54,6 +65,10 @@ class DescribeNumberingPart(object):
     def numbering_elm_(self, request):
         return instance_mock(request, CT_Numbering)
 
+    @pytest.fixture
+    def package_(self, request):
+        return instance_mock(request, OpcPackage)
+
 
 class Describe_NumberingDefinitions(object):
 
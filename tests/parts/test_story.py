@@ -9,15 +9,15 @@ import pytest
 from docx.enum.style import WD_STYLE_TYPE
 from docx.image.image import Image
 from docx.opc.constants import RELATIONSHIP_TYPE as RT
-from docx.package import Package
+from docx.package import ImageParts, Package
 from docx.parts.document import DocumentPart
 from docx.parts.image import ImagePart
 from docx.parts.story import BaseStoryPart
 from docx.styles.style import BaseStyle
 
 from ..unitutil.cxml import element
-from ..unitutil.file import snippet_text
-from ..unitutil.mock import instance_mock, method_mock, property_mock
+from ..unitutil.file import snippet_text, test_file
+from ..unitutil.mock import call, instance_mock, method_mock, property_mock
 
 
 class DescribeBaseStoryPart(object):
@@ -62,11 +62,27 @@ class DescribeBaseStoryPart(object):
         document_part_.get_style_id.assert_called_once_with(style_, style_type)
         assert style_id == "BodyText"
 
-    def it_can_create_a_new_pic_inline(self, get_or_add_image_, image_, next_id_prop_):
+    def it_can_resolve_effective_formatting(
+        self, _document_part_prop_, document_part_
+    ):
+        _document_part_prop_.return_value = document_part_
+        document_part_.effective_p.return_value = "effective_p"
+        document_part_.effective_r.return_value = "effective_r"
+        story_part = BaseStoryPart(None, None, None, None)
+
+        effective_p = story_part.effective_p("p")
+        effective_r = story_part.effective_r("r")
+
+        document_part_.effective_p.assert_called_once_with("p")
+        document_part_.effective_r.assert_called_once_with("r")
+        assert effective_p == "effective_p"
+        assert effective_r == "effective_r"
+
+    def it_can_create_a_new_pic_inline(self, get_or_add_image_, image_, allocate_id_):
         get_or_add_image_.return_value = "rId42", image_
         image_.scaled_dimensions.return_value = 444, 888
         image_.filename = "bar.png"
-        next_id_prop_.return_value = 24
+        allocate_id_.return_value = 24
         expected_xml = snippet_text("inline")
         story_part = BaseStoryPart(None, None, None, None)
 
@@ -76,6 +92,47 @@ class DescribeBaseStoryPart(object):
         image_.scaled_dimensions.assert_called_once_with(100, 200)
         assert inline.xml == expected_xml
 
+    def it_can_create_new_pic_inlines_in_a_batch(
+        self, _load_images_, package_, image_parts_, image_part_, image_, relate_to_,
+        allocate_id_,
+    ):
+        package_.image_parts = image_parts_
+        image_parts_.hash_name = "sha1"
+        _load_images_.return_value = ["image_1", "image_2"]
+        image_parts_.get_or_add_image_part_for.return_value = image_part_
+        relate_to_.side_effect = ["rId42", "rId43"]
+        image_part_.image = image_
+        image_.scaled_dimensions.return_value = 444, 888
+        image_.filename = "bar.png"
+        allocate_id_.side_effect = [24, 25]
+        story_part = BaseStoryPart(None, None, None, package_)
+
+        inlines = story_part.new_pic_inlines(["a.png", "b.png"], 100, 200, 4)
+
+        _load_images_.assert_called_once_with(["a.png", "b.png"], "sha1", 4)
+        assert image_parts_.get_or_add_image_part_for.call_args_list == [
+            call("image_1"),
+            call("image_2"),
+        ]
+        assert relate_to_.call_args_list == [
+            call(story_part, image_part_, RT.IMAGE),
+            call(story_part, image_part_, RT.IMAGE),
+        ]
+        assert inlines[0].xml == snippet_text("inline")
+        assert [inline.docPr.id for inline in inlines] == [24, 25]
+        assert inlines[1].graphic.graphicData.pic.blipFill.blip.embed == "rId43"
+
+    @pytest.mark.parametrize("workers", [1, 2, None])
+    def it_loads_images_in_order_to_help(self, workers):
+        paths = [test_file("python-icon.png"), test_file("sonic.gif")] * 2
+
+        images = BaseStoryPart._load_images(paths, "sha1", workers)
+
+        assert [image.filename for image in images] == [
+            "python-icon.png", "sonic.gif", "python-icon.png", "sonic.gif"
+        ]
+        assert all("sha1" in image._digests for image in images)
+
     def it_knows_the_next_available_xml_id(self, next_id_fixture):
         story_element, expected_value = next_id_fixture
         story_part = BaseStoryPart(None, None, story_element, None)
@@ -84,6 +141,44 @@ class DescribeBaseStoryPart(object):
 
         assert next_id == expected_value
 
+    def it_allocates_successive_ids_after_scanning_once(self, _max_id_prop_):
+        _max_id_prop_.return_value = 41
+        story_part = BaseStoryPart(None, None, element("w:document"), None)
+
+        ids = [story_part.allocate_id() for _ in range(3)]
+
+        assert ids == [42, 43, 44]
+        _max_id_prop_.assert_called_once_with()
+
+    def but_it_does_not_reserve_an_id_when_only_reading_the_next_one(self):
+        story_part = BaseStoryPart(None, None, element("w:document/w:p{id=7}"), None)
+
+        assert story_part.next_id == 8
+        assert story_part.next_id == 8
+        assert story_part.allocate_id() == 8
+        assert story_part.next_id == 9
+
+    def but_it_scans_again_when_its_element_is_replaced(self):
+        story_part = BaseStoryPart(None, None, element("w:document/w:p{id=7}"), None)
+        story_part.allocate_id()
+        story_part._element = element("w:document/w:p{id=41}")
+
+        next_id = story_part.allocate_id()
+
+        assert next_id == 42
+
+    def and_it_skips_ids_in_content_added_between_allocations(self):
+        story_part = BaseStoryPart(
+            None, None, element("w:document/w:body/w:p{id=7}"), None
+        )
+        r = story_part.element.body.add_p().add_r()
+
+        assert story_part.allocate_id() == 8
+        r.add_drawing(element("wp:inline/wp:docPr{id=20}"))
+        assert story_part.allocate_id() == 21
+        r.add_drawing(element("wp:inline/wp:docPr{id=9}"))
+        assert story_part.allocate_id() == 22
+
     def it_knows_the_main_document_part_to_help(self, package_, document_part_):
         package_.main_document_part = document_part_
         story_part = BaseStoryPart(None, None, None, package_)
@@ -114,6 +209,10 @@ class DescribeBaseStoryPart(object):
 
     # fixture components ---------------------------------------------
 
+    @pytest.fixture
+    def allocate_id_(self, request):
+        return method_mock(request, BaseStoryPart, "allocate_id")
+
     @pytest.fixture
     def document_part_(self, request):
         return instance_mock(request, DocumentPart)
@@ -135,8 +234,16 @@ class DescribeBaseStoryPart(object):
         return instance_mock(request, ImagePart)
 
     @pytest.fixture
-    def next_id_prop_(self, request):
-        return property_mock(request, BaseStoryPart, "next_id")
+    def image_parts_(self, request):
+        return instance_mock(request, ImageParts)
+
+    @pytest.fixture
+    def _load_images_(self, request):
+        return method_mock(request, BaseStoryPart, "_load_images")
+
+    @pytest.fixture
+    def _max_id_prop_(self, request):
+        return property_mock(request, BaseStoryPart, "_max_id")
 
     @pytest.fixture
     def package_(self, request):
@@ -8,9 +8,12 @@ from __future__ import (
     absolute_import, division, print_function, unicode_literals
 )
 
+from collections import OrderedDict
+
 import pytest
 
 from docx.styles.latent import _LatentStyle, LatentStyles
+from docx.styles.styles import Styles
 
 from ..unitutil.cxml import element, xml
 
@@ -161,6 +164,69 @@ class DescribeLatentStyles(object):
         with pytest.raises(KeyError):
             latent_styles[name]
 
+    def it_keeps_its_name_index_current(self):
+        latent_styles = LatentStyles(element(
+            'w:latentStyles/(w:lsdException{w:name=Foo},w:lsdException{w:nam'
+            'e=Bar})'
+        ))
+        foo = latent_styles['Foo']
+        assert latent_styles['Bar'].element is latent_styles.element[1]
+
+        foo.delete()
+        with pytest.raises(KeyError):
+            latent_styles['Foo']
+
+        baz = latent_styles.add_latent_style('Baz')
+        assert latent_styles['Baz'] == baz
+
+        latent_styles.element.append(element('w:lsdException{w:name=Foo}'))
+        assert latent_styles['Foo'].element is latent_styles.element[2]
+
+    def it_builds_its_name_index_once_per_styles_element(self):
+        styles = Styles(element(
+            'w:styles/w:latentStyles/(w:lsdException{w:name=Foo},w:lsdExcepti'
+            'on{w:name=Bar})'
+        ))
+        assert styles.latent_styles['Foo'].name == 'Foo'
+        index = styles.element._lsdException_index_cache
+
+        assert styles.latent_styles['Bar'].name == 'Bar'
+        with pytest.raises(KeyError):
+            styles.latent_styles['Baz']
+        assert styles.element._lsdException_index_cache is index
+
+    def it_can_update_many_latent_styles_at_once(self):
+        latent_styles = LatentStyles(element(
+            'w:latentStyles/w:lsdException{w:name=heading 1,w:uiPriority=9}'
+        ))
+
+        latent_styles.update({
+            'Heading 1': {'hidden': True, 'priority': 1},
+            'Foo': {'quick_style': False},
+        })
+
+        assert latent_styles.element.xml == xml(
+            'w:latentStyles/(w:lsdException{w:name=heading 1,w:uiPriority=1,'
+            'w:semiHidden=1},w:lsdException{w:name=Foo,w:qFormat=0})'
+        )
+
+    def but_it_raises_on_an_unknown_latent_style_property(self):
+        latent_styles = LatentStyles(element('w:latentStyles'))
+        with pytest.raises(AttributeError):
+            latent_styles.update({'Foo': {'color': 'red'}})
+
+    def and_it_changes_nothing_when_it_raises(self):
+        latentStyles = element('w:latentStyles/w:lsdException{w:name=Foo}')
+        latent_styles = LatentStyles(latentStyles)
+        with pytest.raises(AttributeError):
+            latent_styles.update(
+                OrderedDict([
+                    ('Foo', {'hidden': True}),
+                    ('Bar', {'priority': 3, 'name': 'Baz'}),
+                ])
+            )
+        assert latentStyles.xml == xml('w:latentStyles/w:lsdException{w:name=Foo}')
+
     def it_knows_its_default_priority(self, priority_get_fixture):
         latent_styles, expected_value = priority_get_fixture
         assert latent_styles.default_priority == expected_value
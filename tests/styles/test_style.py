@@ -10,6 +10,7 @@ from __future__ import (
 
 import pytest
 
+from docx.enum.dml import MSO_THEME_COLOR
 from docx.enum.style import WD_STYLE_TYPE
 from docx.styles.style import (
     BaseStyle, _CharacterStyle, _ParagraphStyle, _NumberingStyle,
@@ -391,6 +392,57 @@ class Describe_CharacterStyle(object):
         style.base_style = value
         assert style._element.xml == expected_xml
 
+    def it_invalidates_resolved_formatting_when_changed(self):
+        styles = element(
+            'w:styles/(w:style{w:type=character,w:styleId=A}/w:rPr/w:b,w:sty'
+            'le{w:type=character,w:styleId=B}/w:rPr/w:i)'
+        )
+        r = element('w:r/w:rPr/w:rStyle{w:val=B}')
+        style_a, style_b = _CharacterStyle(styles[0]), _CharacterStyle(styles[1])
+        assert styles.effective_r(r).xml == xml('w:r/w:rPr/w:i')
+
+        style_b.base_style = style_a
+        assert styles.effective_r(r).xml == xml('w:r/w:rPr/(w:b,w:i)')
+
+        style_a.font.bold = False
+        assert styles.effective_r(r).xml == xml('w:r/w:rPr/(w:b{w:val=0},w:i)')
+
+    def but_it_has_nothing_to_invalidate_outside_a_styles_element(self):
+        base_style = _CharacterStyle(element('w:style{w:styleId=A}'))
+        detached_style = _CharacterStyle(element('w:style'))
+        foreign_style = _CharacterStyle(element('w:foo/w:style')[0])
+
+        detached_style.base_style = base_style
+        foreign_style.base_style = base_style
+
+        assert detached_style._element.basedOn_val == 'A'
+        assert foreign_style._element.basedOn_val == 'A'
+
+    def and_it_invalidates_it_when_a_font_obtained_earlier_is_changed(self):
+        styles = element('w:styles/w:style{w:type=character,w:styleId=A}')
+        r = element('w:r/w:rPr/w:rStyle{w:val=A}')
+        font = _CharacterStyle(styles[0]).font
+        assert styles.effective_r(r).xml == xml('w:r/w:rPr')
+
+        font.italic = True
+        assert styles.effective_r(r).xml == xml('w:r/w:rPr/w:i')
+
+        font.color.theme_color = MSO_THEME_COLOR.ACCENT_1
+        assert styles.effective_r(r).xpath('w:rPr/w:color/@w:themeColor') == [
+            'accent1'
+        ]
+
+    def but_it_keeps_resolved_formatting_when_its_font_is_read(self):
+        styles = element('w:styles/w:style{w:type=character,w:styleId=A}')
+        r = element('w:r/w:rPr/w:rStyle{w:val=A}')
+        style = _CharacterStyle(styles[0])
+        effective_r = styles.effective_r(r)
+
+        style.font.italic
+
+        assert styles._style_props_cache
+        assert styles.effective_r(r).xml == effective_r.xml
+
     def it_provides_access_to_its_font(self, font_fixture):
         style, Font_, font_ = font_fixture
         font = style.font
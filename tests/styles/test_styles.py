@@ -185,6 +185,7 @@ class DescribeStyles(object):
         name, name_, style_type, builtin = request.param
         styles = Styles(styles_elm_)
         _getitem_.return_value = None
+        styles_elm_.get_by_name.return_value = None
         styles_elm_.add_style_of_type.return_value = style_elm_
         StyleFactory_.return_value = style_
         return (
@@ -13,6 +13,7 @@ import pytest
 import docx
 
 from docx.api import Document
+from docx.compat import BytesIO, ThreadPoolExecutor
 from docx.opc.constants import CONTENT_TYPE as CT
 
 from .unitutil.mock import function_mock, instance_mock, class_mock
@@ -37,6 +38,32 @@ class DescribeDocument(object):
         with pytest.raises(ValueError):
             Document(not_a_docx)
 
+    @pytest.mark.skipif(
+        ThreadPoolExecutor is None, reason='requires concurrent.futures'
+    )
+    def it_can_open_and_save_documents_in_parallel(self):
+        def round_trip(idx):
+            document = Document()
+            for n in range(20):
+                document.add_paragraph('%d-%d' % (idx, n), 'List Bullet')
+            document.add_table(2, 2).cell(1, 1).text = 'cell %d' % idx
+            stream = BytesIO()
+            document.save(stream)
+            stream.seek(0)
+            document = Document(stream)
+            return (
+                [p.text for p in document.paragraphs],
+                document.tables[0].cell(1, 1).text,
+            )
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(round_trip, range(16)))
+
+        assert results == [
+            (['%d-%d' % (idx, n) for n in range(20)], 'cell %d' % idx)
+            for idx in range(16)
+        ]
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
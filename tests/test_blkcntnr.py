@@ -7,13 +7,17 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 import pytest
 
 from docx.blkcntnr import BlockItemContainer
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml.ns import qn
+from docx.parts.document import DocumentPart
 from docx.shared import Inches
-from docx.table import Table
+from docx.table import _Cell, Table
 from docx.text.paragraph import Paragraph
+from docx.text.run import Run
 
 from .unitutil.cxml import element, xml
 from .unitutil.file import snippet_seq
-from .unitutil.mock import call, instance_mock, method_mock
+from .unitutil.mock import call, instance_mock, method_mock, property_mock
 
 
 class DescribeBlockItemContainer(object):
@@ -30,6 +34,34 @@ class DescribeBlockItemContainer(object):
         assert paragraph.style == style
         assert paragraph is paragraph_
 
+    def it_can_add_a_list(self, part_prop_, document_part_):
+        part_prop_.return_value = document_part_
+        document_part_.get_style_id.return_value = 'ListNumber'
+        document_part_.list_numId.return_value = 7
+        blkcntnr = BlockItemContainer(element('w:body/w:sectPr'), None)
+
+        paragraphs = blkcntnr.add_list(['Foo', ('Bar', 1), ''], 'List Number')
+
+        document_part_.get_style_id.assert_called_once_with(
+            'List Number', WD_STYLE_TYPE.PARAGRAPH
+        )
+        document_part_.list_numId.assert_called_once_with('ListNumber', [0, 1], True)
+        assert blkcntnr._element.xml == xml(
+            'w:body/(w:p/(w:pPr/(w:pStyle{w:val=ListNumber},w:numPr/(w:ilvl{w:va'
+            'l=0},w:numId{w:val=7})),w:r/w:t"Foo"),w:p/(w:pPr/(w:pStyle{w:val=Li'
+            'stNumber},w:numPr/(w:ilvl{w:val=1},w:numId{w:val=7})),w:r/w:t"Bar")'
+            ',w:p/w:pPr/(w:pStyle{w:val=ListNumber},w:numPr/(w:ilvl{w:val=0},w:n'
+            'umId{w:val=7})),w:sectPr)'
+        )
+        assert [p._p for p in paragraphs] == blkcntnr._element.xpath('w:p')
+        assert all(p._parent is blkcntnr for p in paragraphs)
+
+    def but_it_adds_nothing_for_an_empty_list(self, part_prop_):
+        blkcntnr = BlockItemContainer(element('w:body'), None)
+        assert blkcntnr.add_list([]) == []
+        assert part_prop_.call_count == 0
+        assert blkcntnr._element.xml == xml('w:body')
+
     def it_can_add_a_table(self, add_table_fixture):
         blkcntnr, rows, cols, width, expected_xml = add_table_fixture
         table = blkcntnr.add_table(rows, cols, width)
@@ -62,6 +94,79 @@ class DescribeBlockItemContainer(object):
             count += 1
         assert count == expected_count
 
+    def it_can_iterate_its_tables_recursively(self, iter_tables_fixture):
+        blkcntnr, recursive, expected_items = iter_tables_fixture
+        body = blkcntnr._element
+        tbl_elms = list(body.iter(qn('w:tbl')))
+
+        items = list(blkcntnr.iter_tables(recursive))
+
+        assert [
+            (tbl_elms.index(table._tbl), depth, path)
+            for table, depth, path in items
+        ] == expected_items
+        for table, depth, path in items:
+            assert isinstance(table, Table)
+            if depth == 0:
+                assert table._parent is blkcntnr
+            else:
+                assert isinstance(table._parent, _Cell)
+                assert isinstance(table._parent._parent, Table)
+
+    def it_can_query_its_content(self, query_fixture):
+        blkcntnr, xpath, variables, expected_types, expected_tags = (
+            query_fixture
+        )
+
+        results = blkcntnr.query(xpath, **variables)
+
+        assert [type(result) for result in results] == expected_types
+        assert [result._element.tag for result in results] == expected_tags
+
+    def and_it_gives_each_selected_item_its_real_parent(self):
+        body = element(
+            'w:body/(w:p/w:r,w:tbl/w:tr/w:tc/(w:p/w:r,w:tbl/w:tr/w:tc/w:p))'
+        )
+        blkcntnr = BlockItemContainer(body, None)
+        p, tbl = body[0], body[1]
+        cell_p, nested_tbl = tbl[0][0][0], tbl[0][0][1]
+
+        results = blkcntnr.query('.//w:p|.//w:r|.//w:tbl')
+
+        by_element = dict((result._element, result) for result in results)
+        assert by_element[p]._parent is blkcntnr
+        assert by_element[tbl]._parent is blkcntnr
+        assert by_element[p[0]]._parent is by_element[p]
+        cell = by_element[cell_p]._parent
+        assert isinstance(cell, _Cell)
+        assert cell._tc is tbl[0][0]
+        assert cell._parent is by_element[tbl]
+        assert by_element[cell_p[0]]._parent is by_element[cell_p]
+        assert by_element[nested_tbl]._parent is cell
+        nested_cell = by_element[nested_tbl[0][0][0]]._parent
+        assert nested_cell._parent is by_element[nested_tbl]
+
+    def and_it_returns_a_selected_table_cell_as_a_cell(self):
+        body = element('w:body/w:tbl/w:tr/(w:tc/w:p,w:tc/w:p)')
+        blkcntnr = BlockItemContainer(body, None)
+        tcs = body.xpath('.//w:tc')
+
+        results = blkcntnr.query('.//w:tc|.//w:tc/w:p')
+
+        cells = [result for result in results if isinstance(result, _Cell)]
+        assert [cell._tc for cell in cells] == tcs
+        assert all(isinstance(cell._parent, Table) for cell in cells)
+        assert cells[0]._parent is cells[1]._parent
+        assert cells[0]._parent._parent is blkcntnr
+        assert results[1]._parent is cells[0]
+
+    def it_returns_other_query_results_as_selected(self):
+        blkcntnr = BlockItemContainer(
+            element('w:body/(w:p/w:pPr/w:pStyle{w:val=Foo},w:p)'), None
+        )
+        assert blkcntnr.query('count(w:p)') == 2.0
+        assert blkcntnr.query('w:p/w:pPr/w:pStyle/@w:val') == ['Foo']
+
     def it_adds_a_paragraph_to_help(self, _add_paragraph_fixture):
         blkcntnr, expected_xml = _add_paragraph_fixture
         new_paragraph = blkcntnr._add_paragraph()
@@ -97,6 +202,47 @@ class DescribeBlockItemContainer(object):
         expected_xml = snippet_seq('new-tbl')[0]
         return blkcntnr, rows, cols, width, expected_xml
 
+    @pytest.fixture(params=[
+        ('w:body/(w:p,w:sdt/w:tbl)', True, []),
+        ('w:body/(w:tbl,w:p,w:tbl)', True, [(0, 0, (0,)), (1, 0, (1,))]),
+        ('w:body/(w:tbl/w:tr/(w:tc/w:p,w:tc/(w:tbl,w:p,w:tbl)),w:tbl)', True,
+         [(0, 0, (0,)), (1, 1, (0, 0, 1, 0)), (2, 1, (0, 0, 1, 1)),
+          (3, 0, (1,))]),
+        ('w:body/(w:tbl/w:tr/(w:tc/w:p,w:tc/(w:tbl,w:p,w:tbl)),w:tbl)', False,
+         [(0, 0, (0,)), (3, 0, (1,))]),
+        ('w:body/w:tbl/(w:tr/w:tc/w:p,w:tr/(w:tc/(w:tcPr/w:gridSpan{w:val=2}'
+         ',w:p),w:tc/w:tbl/w:tr/w:tc/w:tbl))', True,
+         [(0, 0, (0,)), (1, 1, (0, 1, 2, 0)), (2, 2, (0, 1, 2, 0, 0, 0, 0))]),
+    ])
+    def iter_tables_fixture(self, request):
+        blkcntnr_cxml, recursive, expected_items = request.param
+        blkcntnr = BlockItemContainer(element(blkcntnr_cxml), None)
+        return blkcntnr, recursive, expected_items
+
+    @pytest.fixture(params=[
+        ('.//w:p[w:pPr/w:pStyle/@w:val=$style_id]', {'style_id': 'Foo'},
+         [Paragraph, Paragraph], ['w:p', 'w:p']),
+        ('.//w:p[w:pPr/w:pStyle/@w:val=$style_id]', {'style_id': "O'Foo"},
+         [Paragraph], ['w:p']),
+        ('.//w:r[w:rPr/w:b]', {}, [Run], ['w:r']),
+        ('.//w:tbl[w:tblPr/w:tblStyle/@w:val=$style_id]',
+         {'style_id': 'Grid'}, [Table, Table], ['w:tbl', 'w:tbl']),
+        ('w:p|w:tbl', {}, [Paragraph, Table, Paragraph],
+         ['w:p', 'w:tbl', 'w:p']),
+    ])
+    def query_fixture(self, request):
+        xpath, variables, expected_types, expected_tagnames = request.param
+        body = element(
+            'w:body/(w:p/(w:pPr/w:pStyle{w:val=Foo},w:r/w:rPr/w:b),w:tbl/(w:t'
+            'blPr/w:tblStyle{w:val=Grid},w:tr/w:tc/(w:p/w:pPr/w:pStyle{w:val='
+            'Foo},w:tbl/w:tblPr/w:tblStyle{w:val=Grid})),w:p/(w:pPr/w:pStyle,'
+            'w:r))'
+        )
+        body[-1].pPr.pStyle.set(qn('w:val'), "O'Foo")
+        blkcntnr = BlockItemContainer(body, None)
+        expected_tags = [qn(tagname) for tagname in expected_tagnames]
+        return blkcntnr, xpath, variables, expected_types, expected_tags
+
     @pytest.fixture(params=[
         ('w:body',                 0),
         ('w:body/w:p',             1),
@@ -127,6 +273,14 @@ class DescribeBlockItemContainer(object):
     def _add_paragraph_(self, request):
         return method_mock(request, BlockItemContainer, '_add_paragraph')
 
+    @pytest.fixture
+    def document_part_(self, request):
+        return instance_mock(request, DocumentPart)
+
     @pytest.fixture
     def paragraph_(self, request):
         return instance_mock(request, Paragraph)
+
+    @pytest.fixture
+    def part_prop_(self, request):
+        return property_mock(request, BlockItemContainer, 'part')
@@ -10,6 +10,7 @@ from docx.document import _Body, Document
 from docx.enum.section import WD_SECTION
 from docx.enum.text import WD_BREAK
 from docx.opc.coreprops import CoreProperties
+from docx.oxml.ns import qn
 from docx.parts.document import DocumentPart
 from docx.section import Section, Sections
 from docx.settings import Settings
@@ -43,6 +44,18 @@ class DescribeDocument(object):
         with pytest.raises(ValueError):
             document.add_heading(level=10)
 
+    def it_can_add_a_list(self, body_prop_):
+        body_ = body_prop_.return_value
+        body_.add_list.return_value = ['p1', 'p2']
+        document = Document(None, None)
+
+        paragraphs = document.add_list(['Foo', ('Bar', 1)], restart=False)
+
+        body_.add_list.assert_called_once_with(
+            ['Foo', ('Bar', 1)], 'List Number', False
+        )
+        assert paragraphs == ['p1', 'p2']
+
     def it_can_add_a_page_break(self, add_paragraph_, paragraph_, run_):
         add_paragraph_.return_value = paragraph_
         paragraph_.add_run.return_value = run_
@@ -67,6 +80,22 @@ class DescribeDocument(object):
         run_.add_picture.assert_called_once_with(path, width, height)
         assert picture is picture_
 
+    def it_can_add_pictures(self, document_part_):
+        document_elm = element('w:document/w:body/w:sectPr')
+        inlines = [element('wp:inline'), element('wp:inline')]
+        document_part_.new_pic_inlines.return_value = inlines
+        document = Document(document_elm, document_part_)
+
+        pictures = document.add_pictures(['a.png', 'b.png'], 42, 24, workers=2)
+
+        document_part_.new_pic_inlines.assert_called_once_with(
+            ['a.png', 'b.png'], 42, 24, 2
+        )
+        body = document_elm.body
+        assert body.xpath('w:p/w:r/w:drawing/wp:inline') == inlines
+        assert body[-1].tag == qn('w:sectPr')
+        assert [p._inline for p in pictures] == inlines
+
     def it_can_add_a_section(
         self, add_section_fixture, Section_, section_, document_part_
     ):
@@ -107,6 +136,16 @@ class DescribeDocument(object):
         paragraphs = document.paragraphs
         assert paragraphs is paragraphs_
 
+    def it_provides_access_to_its_header_footer_map(self, sections_prop_, sections_):
+        sections_.header_footer_map.return_value = {"hdrftr": "map"}
+        sections_prop_.return_value = sections_
+        document = Document(None, None)
+
+        header_footer_map = document.header_footer_map()
+
+        sections_.header_footer_map.assert_called_once_with()
+        assert header_footer_map == {"hdrftr": "map"}
+
     def it_provides_access_to_its_sections(self, document_part_, Sections_, sections_):
         document_elm = element('w:document')
         Sections_.return_value = sections_
@@ -130,6 +169,26 @@ class DescribeDocument(object):
         tables = document.tables
         assert tables is tables_
 
+    def it_can_iterate_its_tables_including_nested_ones(self, body_prop_):
+        body_ = body_prop_.return_value
+        document = Document(None, None)
+
+        table_items = document.iter_tables(False)
+
+        body_.iter_tables.assert_called_once_with(False)
+        assert table_items is body_.iter_tables.return_value
+
+    def it_can_query_its_body(self, body_prop_):
+        body_ = body_prop_.return_value
+        document = Document(None, None)
+
+        results = document.query('.//w:p[@w:rsidR=$rsid]', rsid='00AB')
+
+        body_.query.assert_called_once_with(
+            './/w:p[@w:rsidR=$rsid]', rsid='00AB'
+        )
+        assert results is body_.query.return_value
+
     def it_provides_access_to_the_document_part(self, part_fixture):
         document, part_ = part_fixture
         assert document.part is part_
@@ -0,0 +1,45 @@
+# encoding: utf-8
+
+"""Test suite for the docx.fmtproxy module"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+from docx.shared import Pt
+from docx.text.font import Font
+from docx.text.parfmt import ParagraphFormat
+
+from .unitutil.cxml import element, xml
+
+
+class DescribeFormatProxy(object):
+
+    def it_invalidates_resolved_formatting_when_a_default_is_changed(self):
+        styles = element(
+            "w:styles/w:docDefaults/(w:rPrDefault/w:rPr,w:pPrDefault/w:pPr)"
+        )
+        rPrDefault, pPrDefault = styles[0][0], styles[0][1]
+        p = element("w:p/w:r")
+        assert styles.effective_r(p[0]).xml == xml("w:r/w:rPr")
+        assert styles.effective_p(p).xml == xml("w:p/w:pPr")
+
+        Font(rPrDefault).bold = True
+        ParagraphFormat(pPrDefault).space_after = Pt(6)
+
+        assert styles.effective_r(p[0]).xml == xml("w:r/w:rPr/w:b")
+        assert styles.effective_p(p).xpath("w:pPr/w:spacing/@w:after") == ["120"]
+
+    def but_it_leaves_them_alone_when_document_content_is_changed(self):
+        styles = element("w:styles/w:style{w:type=paragraph,w:default=1}")
+        document = element("w:document/w:body/w:p/w:r")
+        p = document[0][0]
+        r = p[0]
+        styles.effective_r(r)
+        style_props_cache = styles._style_props_cache
+
+        font = Font(r)
+        font.bold = True
+        ParagraphFormat(p).tab_stops.add_tab_stop(Pt(36))
+
+        assert font._styles is None
+        assert styles._style_props_cache is style_props_cache
+        assert styles.effective_r(r).xml == xml("w:r/w:rPr/w:b")
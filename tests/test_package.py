@@ -54,35 +54,76 @@ class DescribePackage(object):
 class DescribeImageParts(object):
 
     def it_can_get_a_matching_image_part(
-        self, Image_, image_, _get_by_sha1_, image_part_
+        self, Image_, image_, _get_by_digest_, image_part_
     ):
         Image_.from_file.return_value = image_
-        image_.sha1 = "f005ba11"
-        _get_by_sha1_.return_value = image_part_
+        image_.digest.return_value = "f005ba11"
+        _get_by_digest_.return_value = image_part_
         image_parts = ImageParts()
 
         image_part = image_parts.get_or_add_image_part("image.jpg")
 
         Image_.from_file.assert_called_once_with("image.jpg")
-        _get_by_sha1_.assert_called_once_with(image_parts, "f005ba11")
+        image_.digest.assert_called_once_with("sha1")
+        _get_by_digest_.assert_called_once_with(image_parts, "f005ba11")
         assert image_part is image_part_
 
     def but_it_adds_a_new_image_part_when_match_fails(
-        self, Image_, image_, _get_by_sha1_, _add_image_part_, image_part_
+        self, Image_, image_, _get_by_digest_, _add_image_part_, image_part_
     ):
         Image_.from_file.return_value = image_
-        image_.sha1 = "fa1afe1"
-        _get_by_sha1_.return_value = None
+        image_.digest.return_value = "fa1afe1"
+        _get_by_digest_.return_value = None
         _add_image_part_.return_value = image_part_
         image_parts = ImageParts()
 
         image_part = image_parts.get_or_add_image_part("image.png")
 
         Image_.from_file.assert_called_once_with("image.png")
-        _get_by_sha1_.assert_called_once_with(image_parts, "fa1afe1")
+        _get_by_digest_.assert_called_once_with(image_parts, "fa1afe1")
         _add_image_part_.assert_called_once_with(image_parts, image_)
         assert image_part is image_part_
 
+    def it_can_get_or_add_an_image_part_for_a_loaded_image(
+        self, image_, _get_by_digest_, _add_image_part_, image_part_
+    ):
+        image_.digest.return_value = "b0a710ad"
+        _get_by_digest_.return_value = None
+        _add_image_part_.return_value = image_part_
+        image_parts = ImageParts()
+
+        image_part = image_parts.get_or_add_image_part_for(image_)
+
+        image_.digest.assert_called_once_with("sha1")
+        _get_by_digest_.assert_called_once_with(image_parts, "b0a710ad")
+        _add_image_part_.assert_called_once_with(image_parts, image_)
+        assert image_part is image_part_
+
+    def it_finds_an_image_part_by_digest(self, request):
+        def image_part_(n, digest):
+            partname = PackURI("/word/media/image%d.png" % n)
+            image_part_ = instance_mock(request, ImagePart, partname=partname)
+            image_part_.digest.return_value = digest
+            return image_part_
+
+        image_parts = ImageParts()
+        foo, foo_2 = image_part_(1, "f00"), image_part_(2, "f00")
+        image_parts.append(foo)
+        image_parts.append(foo_2)
+        assert image_parts._get_by_digest("f00") is foo
+        assert image_parts._get_by_digest("ba2") is None
+
+        bar = image_part_(3, "ba2")
+        image_parts.append(bar)
+        assert image_parts._get_by_digest("ba2") is bar
+        assert image_parts._get_by_digest("f00") is foo
+        foo.digest.assert_called_once_with("sha1")
+        bar.digest.assert_called_once_with("sha1")
+
+        image_parts.hash_name = "blake2b"
+        image_parts._get_by_digest("f00")
+        bar.digest.assert_called_with("blake2b")
+
     def it_knows_the_next_available_image_partname(self, next_partname_fixture):
         image_parts, ext, expected_partname = next_partname_fixture
         assert image_parts._next_image_partname(ext) == expected_partname
@@ -102,7 +143,7 @@ class DescribeImageParts(object):
 
     # fixtures -------------------------------------------------------
 
-    @pytest.fixture(params=[((2, 3), 1), ((1, 3), 2), ((1, 2), 3)])
+    @pytest.fixture(params=[((2, 3), 1), ((1, 3), 2), ((1, 2), 3), ((), 1)])
     def next_partname_fixture(self, request):
 
         def image_part_with_partname_(n):
@@ -128,8 +169,8 @@ class DescribeImageParts(object):
         return method_mock(request, ImageParts, '_add_image_part')
 
     @pytest.fixture
-    def _get_by_sha1_(self, request):
-        return method_mock(request, ImageParts, '_get_by_sha1')
+    def _get_by_digest_(self, request):
+        return method_mock(request, ImageParts, '_get_by_digest')
 
     @pytest.fixture
     def Image_(self, request):
@@ -58,6 +58,24 @@ class DescribeSections(object):
         ]
         assert section_lst == [section_, section_, section_]
 
+    def it_can_access_its_last_Section_without_a_search(
+        self, Section_, section_, document_part_
+    ):
+        document_elm = element("w:document/w:body/(w:p/w:pPr/w:sectPr,w:sectPr)")
+        sectPr = document_elm.xpath("w:body/w:sectPr")[0]
+        Section_.return_value = section_
+        sections = Sections(document_elm, document_part_)
+
+        section = sections[-1]
+
+        Section_.assert_called_once_with(sectPr, document_part_)
+        assert section is section_
+
+    def but_it_raises_when_the_document_has_no_sections(self, document_part_):
+        sections = Sections(element("w:document/w:body/w:p"), document_part_)
+        with pytest.raises(IndexError):
+            sections[-1]
+
     def it_can_access_its_Section_instances_by_slice(
         self, Section_, section_, document_part_
     ):
@@ -75,6 +93,37 @@ class DescribeSections(object):
         ]
         assert section_lst == [section_, section_]
 
+    def it_can_map_each_section_to_its_header_and_footer_parts(self, document_part_):
+        document_elm = element(
+            "w:document/w:body/("
+            "w:p/w:pPr/w:sectPr/(w:headerReference{w:type=default,r:id=rId1},"
+            "w:footerReference{w:type=first,r:id=rId2}),"
+            "w:p/w:pPr/w:sectPr/w:headerReference{w:type=even,r:id=rId3},"
+            "w:sectPr/w:headerReference{w:type=default,r:id=rId4})"
+        )
+        document_part_.header_part.side_effect = lambda rId: "header-%s" % rId
+        document_part_.footer_part.side_effect = lambda rId: "footer-%s" % rId
+        sections = Sections(document_elm, document_part_)
+
+        header_footer_map = sections.header_footer_map()
+
+        PRIMARY, FIRST_PAGE, EVEN_PAGE = (
+            WD_HEADER_FOOTER.PRIMARY,
+            WD_HEADER_FOOTER.FIRST_PAGE,
+            WD_HEADER_FOOTER.EVEN_PAGE,
+        )
+        assert header_footer_map == {
+            (0, PRIMARY): ("header-rId1", None),
+            (0, FIRST_PAGE): (None, "footer-rId2"),
+            (0, EVEN_PAGE): (None, None),
+            (1, PRIMARY): ("header-rId1", None),
+            (1, FIRST_PAGE): (None, "footer-rId2"),
+            (1, EVEN_PAGE): ("header-rId3", None),
+            (2, PRIMARY): ("header-rId4", None),
+            (2, FIRST_PAGE): (None, "footer-rId2"),
+            (2, EVEN_PAGE): ("header-rId3", None),
+        }
+
     # fixture components ---------------------------------------------
 
     @pytest.fixture
@@ -532,39 +581,49 @@ class Describe_BaseHeaderFooter(object):
         assert header_part is header_part_
 
     def but_it_gets_the_prior_definition_when_it_is_linked(
-        self,
-        _has_definition_prop_,
-        _prior_headerfooter_prop_,
-        prior_headerfooter_,
-        header_part_,
+        self, _has_definition_prop_, _prior_definition_prop_, header_part_
     ):
         _has_definition_prop_.return_value = False
-        _prior_headerfooter_prop_.return_value = prior_headerfooter_
-        prior_headerfooter_._get_or_add_definition.return_value = header_part_
+        _prior_definition_prop_.return_value = header_part_
         header = _BaseHeaderFooter(None, None, None)
 
         header_part = header._get_or_add_definition()
 
-        prior_headerfooter_._get_or_add_definition.assert_called_once_with()
         assert header_part is header_part_
 
-    def and_it_adds_a_definition_when_it_is_linked_and_the_first_section(
+    def and_it_adds_a_definition_to_the_first_section_when_none_is_inherited(
         self,
         _has_definition_prop_,
-        _prior_headerfooter_prop_,
-        _add_definition_,
+        _prior_definition_prop_,
+        _first_headerfooter_prop_,
+        first_headerfooter_,
         header_part_
     ):
         _has_definition_prop_.return_value = False
-        _prior_headerfooter_prop_.return_value = None
-        _add_definition_.return_value = header_part_
+        _prior_definition_prop_.return_value = None
+        _first_headerfooter_prop_.return_value = first_headerfooter_
+        first_headerfooter_._add_definition.return_value = header_part_
         header = _BaseHeaderFooter(None, None, None)
 
         header_part = header._get_or_add_definition()
 
-        _add_definition_.assert_called_once_with(header)
+        first_headerfooter_._add_definition.assert_called_once_with()
         assert header_part is header_part_
 
+    def it_provides_access_to_the_first_section_header_or_footer_to_help(
+        self, document_part_
+    ):
+        doc_elm = element("w:document/(w:sectPr,w:sectPr)")
+        first_sectPr, sectPr = doc_elm[0], doc_elm[1]
+        header = _Header(sectPr, document_part_, WD_HEADER_FOOTER.EVEN_PAGE)
+
+        first_header = header._first_headerfooter
+
+        assert isinstance(first_header, _Header)
+        assert first_header._sectPr is first_sectPr
+        assert first_header._document_part is document_part_
+        assert first_header._hdrftr_index == WD_HEADER_FOOTER.EVEN_PAGE
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture(params=[(False, True), (True, False)])
@@ -607,16 +666,24 @@ class Describe_BaseHeaderFooter(object):
         return property_mock(request, _BaseHeaderFooter, "_has_definition")
 
     @pytest.fixture
-    def header_part_(self, request):
-        return instance_mock(request, HeaderPart)
+    def document_part_(self, request):
+        return instance_mock(request, DocumentPart)
 
     @pytest.fixture
-    def prior_headerfooter_(self, request):
+    def first_headerfooter_(self, request):
         return instance_mock(request, _BaseHeaderFooter)
 
     @pytest.fixture
-    def _prior_headerfooter_prop_(self, request):
-        return property_mock(request, _BaseHeaderFooter, "_prior_headerfooter")
+    def _first_headerfooter_prop_(self, request):
+        return property_mock(request, _BaseHeaderFooter, "_first_headerfooter")
+
+    @pytest.fixture
+    def header_part_(self, request):
+        return instance_mock(request, HeaderPart)
+
+    @pytest.fixture
+    def _prior_definition_prop_(self, request):
+        return property_mock(request, _BaseHeaderFooter, "_prior_definition")
 
 
 class Describe_Footer(object):
@@ -663,30 +730,30 @@ class Describe_Footer(object):
 
         assert has_definition is expected_value
 
-    def it_provides_access_to_the_prior_Footer_to_help(
-        self, request, document_part_, footer_
+    def it_provides_access_to_the_prior_footer_part_to_help(
+        self, document_part_, footer_part_
     ):
-        doc_elm = element("w:document/(w:sectPr,w:sectPr)")
-        prior_sectPr, sectPr = doc_elm[0], doc_elm[1]
-        footer = _Footer(sectPr, document_part_, WD_HEADER_FOOTER.EVEN_PAGE)
-        # ---mock must occur after construction of "real" footer---
-        _Footer_ = class_mock(request, "docx.section._Footer", return_value=footer_)
+        doc_elm = element(
+            "w:document/(w:sectPr/w:footerReference{w:type=even,r:id=rId6},w:sectPr,"
+            "w:sectPr)"
+        )
+        document_part_.footer_part.return_value = footer_part_
+        footer = _Footer(doc_elm[2], document_part_, WD_HEADER_FOOTER.EVEN_PAGE)
 
-        prior_footer = footer._prior_headerfooter
+        prior_definition = footer._prior_definition
 
-        _Footer_.assert_called_once_with(
-            prior_sectPr, document_part_, WD_HEADER_FOOTER.EVEN_PAGE
-        )
-        assert prior_footer is footer_
+        document_part_.footer_part.assert_called_once_with("rId6")
+        assert prior_definition is footer_part_
 
-    def but_it_returns_None_when_its_the_first_footer(self):
-        doc_elm = element("w:document/w:sectPr")
-        sectPr = doc_elm[0]
-        footer = _Footer(sectPr, None, None)
+    def but_it_returns_None_when_no_prior_footer_is_defined(self):
+        doc_elm = element(
+            "w:document/(w:sectPr/w:footerReference{w:type=even,r:id=rId6},w:sectPr)"
+        )
+        footer = _Footer(doc_elm[1], None, WD_HEADER_FOOTER.PRIMARY)
 
-        prior_footer = footer._prior_headerfooter
+        prior_definition = footer._prior_definition
 
-        assert prior_footer is None
+        assert prior_definition is None
 
     # fixtures -------------------------------------------------------
 
@@ -706,10 +773,6 @@ class Describe_Footer(object):
     def document_part_(self, request):
         return instance_mock(request, DocumentPart)
 
-    @pytest.fixture
-    def footer_(self, request):
-        return instance_mock(request, _Footer)
-
     @pytest.fixture
     def footer_part_(self, request):
         return instance_mock(request, FooterPart)
@@ -759,30 +822,28 @@ class Describe_Header(object):
 
         assert has_definition is expected_value
 
-    def it_provides_access_to_the_prior_Header_to_help(
-        self, request, document_part_, header_
+    def it_provides_access_to_the_prior_header_part_to_help(
+        self, document_part_, header_part_
     ):
-        doc_elm = element("w:document/(w:sectPr,w:sectPr)")
-        prior_sectPr, sectPr = doc_elm[0], doc_elm[1]
-        header = _Header(sectPr, document_part_, WD_HEADER_FOOTER.PRIMARY)
-        # ---mock must occur after construction of "real" header---
-        _Header_ = class_mock(request, "docx.section._Header", return_value=header_)
+        doc_elm = element(
+            "w:document/(w:sectPr/w:headerReference{w:type=default,r:id=rId3},"
+            "w:sectPr/w:headerReference{w:type=default,r:id=rId5},w:sectPr)"
+        )
+        document_part_.header_part.return_value = header_part_
+        header = _Header(doc_elm[2], document_part_, WD_HEADER_FOOTER.PRIMARY)
 
-        prior_header = header._prior_headerfooter
+        prior_definition = header._prior_definition
 
-        _Header_.assert_called_once_with(
-            prior_sectPr, document_part_, WD_HEADER_FOOTER.PRIMARY
-        )
-        assert prior_header is header_
+        document_part_.header_part.assert_called_once_with("rId5")
+        assert prior_definition is header_part_
 
     def but_it_returns_None_when_its_the_first_header(self):
         doc_elm = element("w:document/w:sectPr")
-        sectPr = doc_elm[0]
-        header = _Header(sectPr, None, None)
+        header = _Header(doc_elm[0], None, WD_HEADER_FOOTER.PRIMARY)
 
-        prior_header = header._prior_headerfooter
+        prior_definition = header._prior_definition
 
-        assert prior_header is None
+        assert prior_definition is None
 
     # fixtures -------------------------------------------------------
 
@@ -802,10 +863,6 @@ class Describe_Header(object):
     def document_part_(self, request):
         return instance_mock(request, DocumentPart)
 
-    @pytest.fixture
-    def header_(self, request):
-        return instance_mock(request, _Header)
-
     @pytest.fixture
     def header_part_(self, request):
         return instance_mock(request, HeaderPart)
@@ -8,8 +8,12 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 import pytest
 
+from docx.api import Document
 from docx.enum.shape import WD_INLINE_SHAPE
 from docx.oxml.ns import nsmap
+from docx.oxml.xmlchemy import note_content_change
+from docx.parts.document import DocumentPart
+from docx.parts.image import ImagePart
 from docx.shape import InlineShape, InlineShapes
 from docx.shared import Length
 
@@ -17,7 +21,8 @@ from .oxml.unitdata.dml import (
     a_blip, a_blipFill, a_graphic, a_graphicData, a_pic, an_inline,
 )
 from .unitutil.cxml import element, xml
-from .unitutil.mock import loose_mock
+from .unitutil.file import test_file
+from .unitutil.mock import instance_mock, loose_mock
 
 
 class DescribeInlineShapes(object):
@@ -53,6 +58,63 @@ class DescribeInlineShapes(object):
             too_high = inline_shape_count
             inline_shapes[too_high]
 
+    def it_caches_its_inline_shapes_until_content_changes(self):
+        body = element('w:body/w:p/w:r/w:drawing/wp:inline')
+        inline_shapes = InlineShapes(body, None)
+        inline_lst = inline_shapes._inline_lst
+        body[0].append(element('w:r/w:drawing/wp:inline'))
+
+        assert inline_shapes._inline_lst is inline_lst
+        assert len(inline_shapes) == 1
+
+        note_content_change(body)
+
+        assert len(inline_shapes) == 2
+
+    def and_it_searches_again_when_a_paragraph_is_added_directly(self):
+        body = element('w:body/w:p/w:r/w:drawing/wp:inline')
+        inline_shapes = InlineShapes(body, None)
+        assert len(inline_shapes) == 1
+
+        body.append(element('w:p/w:r/w:drawing/wp:inline'))
+
+        assert len(inline_shapes) == 2
+
+    def and_it_finds_a_picture_added_to_a_table_cell(self):
+        document = Document()
+        document.add_paragraph().add_run().add_picture(
+            test_file('monty-truth.png')
+        )
+        cell = document.add_table(1, 1).cell(0, 0)
+        assert len(document.inline_shapes) == 1
+
+        cell.paragraphs[0].add_run().add_picture(test_file('python-icon.png'))
+
+        assert len(document.inline_shapes) == 2
+
+    def it_can_iterate_over_its_shapes_with_context(self, request):
+        body = element(
+            'w:body/(w:p/w:r/w:drawing/wp:inline/a:graphic/a:graphicData{uri=%s}'
+            '/pic:pic/pic:blipFill/a:blip{r:embed=rId9},w:p/w:r/w:drawing/wp:inline'
+            '/a:graphic/a:graphicData{uri=foobar})' % nsmap['pic']
+        )
+        image_part_ = instance_mock(request, ImagePart)
+        document_part_ = instance_mock(
+            request, DocumentPart, related_parts={'rId9': image_part_}
+        )
+        document_part_.part = document_part_
+        inline_shapes = InlineShapes(body, document_part_)
+
+        items = list(inline_shapes.iter_with_context())
+
+        inlines = body.xpath('w:p/w:r/w:drawing/wp:inline')
+        assert [shape._inline for shape, _, _ in items] == inlines
+        assert [paragraph._p for _, paragraph, _ in items] == body.xpath('w:p')
+        assert [paragraph.part for _, paragraph, _ in items] == [
+            document_part_, document_part_
+        ]
+        assert [image_part for _, _, image_part in items] == [image_part_, None]
+
     def it_knows_the_part_it_belongs_to(self, inline_shapes_with_parent_):
         inline_shapes, parent_ = inline_shapes_with_parent_
         part = inline_shapes.part
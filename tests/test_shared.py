@@ -12,11 +12,11 @@ import pytest
 
 from docx.opc.part import XmlPart
 from docx.shared import (
-    ElementProxy, Length, Cm, Emu, Inches, Mm, Pt, RGBColor, Twips
+    ElementProxy, Length, Cm, Emu, Inches, Mm, Parented, Pt, RGBColor, Twips
 )
 
 from .unitutil.cxml import element
-from .unitutil.mock import instance_mock
+from .unitutil.mock import instance_mock, property_mock
 
 
 class DescribeElementProxy(object):
@@ -117,6 +117,33 @@ class DescribeLength(object):
         return emu, units_prop_name, expected_length_in_units, type_
 
 
+class DescribeParented(object):
+
+    def it_finds_its_part_from_its_parent_once(self, part_prop_, part_):
+        part_prop_.return_value = part_
+        parented = Parented(ElementProxy(None))
+
+        part = parented.part
+        part_2 = parented.part
+
+        assert part is part_
+        assert part_2 is part_
+        part_prop_.assert_called_once_with()
+
+    def it_has_no_instance_dict(self):
+        assert not hasattr(Parented(None), '__dict__')
+
+    # fixture components ---------------------------------------------
+
+    @pytest.fixture
+    def part_(self, request):
+        return instance_mock(request, XmlPart)
+
+    @pytest.fixture
+    def part_prop_(self, request):
+        return property_mock(request, ElementProxy, 'part')
+
+
 class DescribeRGBColor(object):
 
     def it_is_natively_constructed_using_three_ints_0_to_255(self):
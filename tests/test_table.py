@@ -42,6 +42,50 @@ class DescribeTable(object):
         assert column._gridCol is table._tbl.tblGrid.gridCol_lst[-1]
         assert column._parent is table
 
+    def it_can_add_several_columns_at_once(self, add_columns_fixture):
+        table, count, width, expected_xml = add_columns_fixture
+        columns = table.add_columns(count, width)
+        assert table._tbl.xml == expected_xml
+        assert len(columns) == count
+        gridCols = table._tbl.tblGrid.gridCol_lst
+        for column, gridCol in zip(columns, gridCols[-count:]):
+            assert isinstance(column, _Column)
+            assert column._gridCol is gridCol
+
+    def it_can_delete_columns(self, delete_columns_fixture):
+        table, column_idxs, expected_xml = delete_columns_fixture
+        table.delete_columns(column_idxs)
+        assert table._tbl.xml == expected_xml
+
+    def it_can_delete_rows(self, delete_rows_fixture):
+        table, row_idxs, expected_xml = delete_rows_fixture
+        table.delete_rows(row_idxs)
+        assert table._tbl.xml == expected_xml
+
+    def it_raises_on_delete_index_out_of_range(self, delete_raise_fixture):
+        table, method_name, idxs, expected_xml = delete_raise_fixture
+        with pytest.raises(IndexError):
+            getattr(table, method_name)(idxs)
+        assert table._tbl.xml == expected_xml
+
+    def but_it_raises_on_delete_of_every_column(self):
+        tbl_cxml = (
+            'w:tbl/(w:tblGrid/(w:gridCol,w:gridCol),w:tr/(w:tc/w:p,w:tc/w:p))'
+        )
+        table = Table(element(tbl_cxml), None)
+        with pytest.raises(ValueError):
+            table.delete_columns([1, -2])
+        assert table._tbl.xml == xml(tbl_cxml)
+
+    def but_it_raises_on_delete_of_every_row(self):
+        tbl_cxml = (
+            'w:tbl/(w:tblGrid/w:gridCol,w:tr/w:tc/w:p,w:tr/w:tc/w:p)'
+        )
+        table = Table(element(tbl_cxml), None)
+        with pytest.raises(ValueError):
+            table.delete_rows([0, -1])
+        assert table._tbl.xml == xml(tbl_cxml)
+
     def it_provides_access_to_a_cell_by_row_and_col_indices(self, table):
         for row_idx in range(2):
             for col_idx in range(2):
@@ -69,6 +113,17 @@ class DescribeTable(object):
         row_cells = table.row_cells(row_idx)
         assert row_cells == expected_cells
 
+    def it_can_set_cell_values_in_bulk(self, set_values_fixture):
+        table, values, start, preserve, expected_xml = set_values_fixture
+        table.set_values(values, start, preserve)
+        assert table._tbl.xml == expected_xml
+
+    def it_raises_on_values_outside_the_grid(self, set_values_raise_fixture):
+        table, values, start, expected_xml = set_values_raise_fixture
+        with pytest.raises(IndexError):
+            table.set_values(values, start)
+        assert table._tbl.xml == expected_xml
+
     def it_knows_its_alignment_setting(self, alignment_get_fixture):
         table, expected_value = alignment_get_fixture
         assert table.alignment == expected_value
@@ -142,6 +197,18 @@ class DescribeTable(object):
         expected_xml = snippets[2]
         return table, width, expected_xml
 
+    @pytest.fixture
+    def add_columns_fixture(self):
+        tbl_cxml = 'w:tbl/(w:tblGrid/w:gridCol{w:w=720},w:tr/w:tc/w:p)'
+        table = Table(element(tbl_cxml), None)
+        count, width = 2, Inches(1)
+        new_tc = 'w:tc/(w:tcPr/w:tcW{w:type=dxa,w:w=1440},w:p)'
+        expected_xml = xml(
+            'w:tbl/(w:tblGrid/(w:gridCol{w:w=720},w:gridCol{w:w=1440},w:gri'
+            'dCol{w:w=1440}),w:tr/(w:tc/w:p,%s,%s))' % (new_tc, new_tc)
+        )
+        return table, count, width, expected_xml
+
     @pytest.fixture
     def add_row_fixture(self):
         snippets = snippet_seq('add-row-col')
@@ -233,6 +300,69 @@ class DescribeTable(object):
         table = Table(element(tbl_cxml), None)
         return table, expected_value
 
+    @pytest.fixture(params=[
+        ('w:tbl/(w:tblGrid/(w:gridCol,w:gridCol,w:gridCol),w:tr/(w:tc/w:p"a"'
+         ',w:tc/w:p"b",w:tc/w:p"c"),w:tr/(w:tc/w:p"d",w:tc/w:p"e",w:tc/w:p"f"'
+         '))', [1],
+         'w:tbl/(w:tblGrid/(w:gridCol,w:gridCol),w:tr/(w:tc/w:p"a",w:tc/w:p"'
+         'c"),w:tr/(w:tc/w:p"d",w:tc/w:p"f"))'),
+        ('w:tbl/(w:tblGrid/(w:gridCol,w:gridCol,w:gridCol),w:tr/(w:tc/w:p"a"'
+         ',w:tc/w:p"b",w:tc/w:p"c"))', [-1, 0],
+         'w:tbl/(w:tblGrid/w:gridCol,w:tr/w:tc/w:p"b")'),
+        ('w:tbl/(w:tblGrid/(w:gridCol{w:w=720},w:gridCol{w:w=1440},w:gridCol'
+         '{w:w=720}),w:tr/(w:tc/(w:tcPr/(w:tcW{w:type=dxa,w:w=2160},w:gridSp'
+         'an{w:val=2}),w:p"a"),w:tc/w:p"b"))', [1],
+         'w:tbl/(w:tblGrid/(w:gridCol{w:w=720},w:gridCol{w:w=720}),w:tr/(w:t'
+         'c/(w:tcPr/w:tcW{w:type=dxa,w:w=720},w:p"a"),w:tc/w:p"b"))'),
+        ('w:tbl/(w:tblGrid/(w:gridCol,w:gridCol,w:gridCol),w:tr/(w:tc/(w:tcP'
+         'r/w:gridSpan{w:val=3},w:p"a")))', [0, 2],
+         'w:tbl/(w:tblGrid/w:gridCol,w:tr/(w:tc/(w:tcPr,w:p"a")))'),
+    ])
+    def delete_columns_fixture(self, request):
+        tbl_cxml, column_idxs, expected_cxml = request.param
+        table = Table(element(tbl_cxml), None)
+        expected_xml = xml(expected_cxml)
+        return table, column_idxs, expected_xml
+
+    @pytest.fixture(params=[
+        ('delete_columns', [2]),
+        ('delete_columns', [-3]),
+        ('delete_rows', [0, 2]),
+    ])
+    def delete_raise_fixture(self, request):
+        method_name, idxs = request.param
+        tbl_cxml = (
+            'w:tbl/(w:tblGrid/(w:gridCol,w:gridCol),w:tr/(w:tc/w:p,w:tc/w:p)'
+            ',w:tr/(w:tc/w:p,w:tc/w:p))'
+        )
+        table = Table(element(tbl_cxml), None)
+        expected_xml = xml(tbl_cxml)
+        return table, method_name, idxs, expected_xml
+
+    @pytest.fixture(params=[
+        ('w:tbl/(w:tblGrid/w:gridCol,w:tr/w:tc/w:p"a",w:tr/w:tc/w:p"b",w:tr/'
+         'w:tc/w:p"c")', [0, 2],
+         'w:tbl/(w:tblGrid/w:gridCol,w:tr/w:tc/w:p"b")'),
+        ('w:tbl/(w:tblGrid/w:gridCol,w:tr/w:tc/w:p"a",w:tr/w:tc/w:p"b",w:tr/'
+         'w:tc/w:p"c")', [-1],
+         'w:tbl/(w:tblGrid/w:gridCol,w:tr/w:tc/w:p"a",w:tr/w:tc/w:p"b")'),
+        ('w:tbl/(w:tblGrid/w:gridCol,w:tr/w:tc/(w:tcPr/w:vMerge{w:val=restar'
+         't},w:p"a"),w:tr/w:tc/(w:tcPr/w:vMerge,w:p),w:tr/w:tc/(w:tcPr/w:vMe'
+         'rge,w:p))', [0],
+         'w:tbl/(w:tblGrid/w:gridCol,w:tr/w:tc/(w:tcPr/w:vMerge{w:val=restar'
+         't},w:p),w:tr/w:tc/(w:tcPr/w:vMerge,w:p))'),
+        ('w:tbl/(w:tblGrid/w:gridCol,w:tr/w:tc/(w:tcPr/w:vMerge{w:val=restar'
+         't},w:p"a"),w:tr/w:tc/(w:tcPr/w:vMerge,w:p),w:tr/w:tc/(w:tcPr/w:vMe'
+         'rge,w:p))', [1],
+         'w:tbl/(w:tblGrid/w:gridCol,w:tr/w:tc/(w:tcPr/w:vMerge{w:val=restar'
+         't},w:p"a"),w:tr/w:tc/(w:tcPr/w:vMerge,w:p))'),
+    ])
+    def delete_rows_fixture(self, request):
+        tbl_cxml, row_idxs, expected_cxml = request.param
+        table = Table(element(tbl_cxml), None)
+        expected_xml = xml(expected_cxml)
+        return table, row_idxs, expected_xml
+
     @pytest.fixture(params=[
         ('w:tbl/w:tblPr',                        None),
         ('w:tbl/w:tblPr/w:bidiVisual',           WD_TABLE_DIRECTION.RTL),
@@ -269,6 +399,65 @@ class DescribeTable(object):
         expected_cells = [3, 4, 5]
         return table, row_idx, expected_cells
 
+    @pytest.fixture(params=[
+        ('w:tbl/(w:tblGrid/(w:gridCol,w:gridCol),w:tr/(w:tc/w:p,w:tc/w:p))',
+         [['a', 'b']], (0, 0), True,
+         'w:tbl/(w:tblGrid/(w:gridCol,w:gridCol),w:tr/(w:tc/w:p/w:r/w:t"a",'
+         'w:tc/w:p/w:r/w:t"b"))'),
+        ('w:tbl/(w:tblGrid/(w:gridCol,w:gridCol),w:tr/(w:tc/w:p,w:tc/w:p))',
+         [[None, 42]], (0, 0), True,
+         'w:tbl/(w:tblGrid/(w:gridCol,w:gridCol),w:tr/(w:tc/w:p,'
+         'w:tc/w:p/w:r/w:t"42"))'),
+        ('w:tbl/(w:tblGrid/(w:gridCol,w:gridCol),w:tr/(w:tc/w:p,w:tc/w:p),'
+         'w:tr/(w:tc/w:p,w:tc/w:p))',
+         [['x']], (1, 1), True,
+         'w:tbl/(w:tblGrid/(w:gridCol,w:gridCol),w:tr/(w:tc/w:p,w:tc/w:p),'
+         'w:tr/(w:tc/w:p,w:tc/w:p/w:r/w:t"x"))'),
+        ('w:tbl/(w:tblGrid/w:gridCol,w:tr/w:tc/(w:tcPr,w:p/(w:pPr/w:jc{w:val='
+         'right},w:r/(w:rPr/w:b,w:t"old"),w:r/w:t"er"),w:p))',
+         [['new']], (0, 0), True,
+         'w:tbl/(w:tblGrid/w:gridCol,w:tr/w:tc/(w:tcPr,w:p/(w:pPr/w:jc{w:val='
+         'right},w:r/(w:rPr/w:b,w:t"new"))))'),
+        ('w:tbl/(w:tblGrid/w:gridCol,w:tr/w:tc/(w:tcPr,w:p/(w:pPr/w:jc{w:val='
+         'right},w:r/(w:rPr/w:b,w:t"old"))))',
+         [['new']], (0, 0), False,
+         'w:tbl/(w:tblGrid/w:gridCol,w:tr/w:tc/(w:tcPr,w:p/w:r/w:t"new"))'),
+        ('w:tbl/(w:tblGrid/(w:gridCol,w:gridCol),w:tr/w:tc/(w:tcPr/w:gridSpa'
+         'n{w:val=2},w:p))',
+         [['a', 'b']], (0, 0), True,
+         'w:tbl/(w:tblGrid/(w:gridCol,w:gridCol),w:tr/w:tc/(w:tcPr/w:gridSpa'
+         'n{w:val=2},w:p/w:r/w:t"b"))'),
+        ('w:tbl/(w:tblGrid/w:gridCol,w:tr/w:tc/(w:tcPr/w:vMerge{w:val=restar'
+         't},w:p),w:tr/w:tc/(w:tcPr/w:vMerge,w:p))',
+         [['a'], ['b']], (0, 0), True,
+         'w:tbl/(w:tblGrid/w:gridCol,w:tr/w:tc/(w:tcPr/w:vMerge{w:val=restar'
+         't},w:p/w:r/w:t"b"),w:tr/w:tc/(w:tcPr/w:vMerge,w:p))'),
+    ])
+    def set_values_fixture(self, request):
+        tbl_cxml, values, start, preserve, expected_cxml = request.param
+        table = Table(element(tbl_cxml), None)
+        expected_xml = xml(expected_cxml)
+        return table, values, start, preserve, expected_xml
+
+    @pytest.fixture(params=[
+        ([['a', 'b', 'c']], (0, 0)),
+        ([['a'], ['b'], ['c']], (0, 0)),
+        ([['a', 'b']], (1, 1)),
+        ([['a']], (-1, 0)),
+        ([['a']], (0, -1)),
+        ([['a'], ['b']], (-1, 0)),
+        ([[]], (-1, 0)),
+    ])
+    def set_values_raise_fixture(self, request):
+        values, start = request.param
+        tbl_cxml = (
+            'w:tbl/(w:tblGrid/(w:gridCol,w:gridCol),w:tr/(w:tc/w:p,w:tc/w:p)'
+            ',w:tr/(w:tc/w:p,w:tc/w:p))'
+        )
+        table = Table(element(tbl_cxml), None)
+        expected_xml = xml(tbl_cxml)
+        return table, values, start, expected_xml
+
     @pytest.fixture
     def style_get_fixture(self, part_prop_):
         style_id = 'Barbaz'
@@ -65,6 +65,18 @@ class DescribeParagraph(object):
         ParagraphFormat_.assert_called_once_with(paragraph._element)
         assert paragraph_format is paragraph_format_
 
+    def it_provides_access_to_its_effective_format(
+            self, part_prop_, document_part_, ParagraphFormat_,
+            paragraph_format_):
+        document_part_.effective_p.return_value = effective_p = element('w:p')
+        paragraph = Paragraph(element('w:p'), None)
+
+        paragraph_format = paragraph.effective_format
+
+        document_part_.effective_p.assert_called_once_with(paragraph._p)
+        ParagraphFormat_.assert_called_once_with(effective_p)
+        assert paragraph_format is paragraph_format_
+
     def it_provides_access_to_the_runs_it_contains(self, runs_fixture):
         paragraph, Run_, r_, r_2_, run_, run_2_ = runs_fixture
         runs = paragraph.runs
@@ -82,6 +94,19 @@ class DescribeParagraph(object):
         if style:
             style_prop_.assert_called_once_with(style)
 
+    def it_can_add_pictures_to_itself(self, part_prop_, document_part_):
+        inlines = [element('wp:inline'), element('wp:inline')]
+        document_part_.new_pic_inlines.return_value = inlines
+        paragraph = Paragraph(element('w:p'), None)
+
+        pictures = paragraph.add_pictures(['a.png', 'b.png'], 42, 24, 1)
+
+        document_part_.new_pic_inlines.assert_called_once_with(
+            ['a.png', 'b.png'], 42, 24, 1
+        )
+        assert paragraph._p.xpath('w:r/w:drawing/wp:inline') == inlines
+        assert [p._inline for p in pictures] == inlines
+
     def it_can_insert_a_paragraph_before_itself(self, insert_before_fixture):
         text, style, paragraph_, add_run_calls = insert_before_fixture
         paragraph = Paragraph(None, None)
@@ -65,6 +65,17 @@ class DescribeRun(object):
         Font_.assert_called_once_with(run._element)
         assert font is font_
 
+    def it_provides_access_to_its_effective_font(
+            self, part_prop_, document_part_, Font_, font_):
+        document_part_.effective_r.return_value = effective_r = element('w:r')
+        run = Run(element('w:r'), None)
+
+        font = run.effective_font
+
+        document_part_.effective_r.assert_called_once_with(run._r)
+        Font_.assert_called_once_with(effective_r)
+        assert font is font_
+
     def it_can_add_text(self, add_text_fixture, Text_):
         r, text_str, expected_xml = add_text_fixture
         run = Run(r, None)
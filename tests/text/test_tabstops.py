@@ -133,6 +133,27 @@ class DescribeTabStop(object):
 
 class DescribeTabStops(object):
 
+    def it_invalidates_resolved_formatting_of_a_style_when_changed(self):
+        styles = element(
+            'w:styles/w:style{w:type=paragraph,w:default=1,w:styleId=A}/w:pPr'
+        )
+        p = element('w:p')
+        tab_stops = TabStops(styles[0].pPr)
+        assert styles.effective_p(p).xml == xml('w:p/w:pPr')
+
+        tab_stop = tab_stops.add_tab_stop(Twips(720))
+        assert styles.effective_p(p).xpath('w:pPr/w:tabs/w:tab/@w:pos') == [
+            '720'
+        ]
+
+        tab_stop.position = Twips(360)
+        assert styles.effective_p(p).xpath('w:pPr/w:tabs/w:tab/@w:pos') == [
+            '360'
+        ]
+
+        tab_stops.clear_all()
+        assert styles.effective_p(p).xml == xml('w:p/w:pPr')
+
     def it_knows_its_length(self, len_fixture):
         tab_stops, expected_value = len_fixture
         assert len(tab_stops) == expected_value